@@ -1,12 +1,26 @@
 """Agent orchestration layer — MCP tools, prompt templates, and routing for Claude Agent SDK."""
 
-from .tools import search_data, search_assets, rag_mcp_server
+from .tools import (
+    search_data,
+    search_assets,
+    rag_mcp_server,
+    run_regression,
+    run_roi_analysis,
+    run_budget_optimizer,
+    run_adstock_curves,
+    mmm_mcp_server,
+)
 from .prompts import ORCHESTRATOR_PROMPT, RAG_AGENT_PROMPT, MMM_AGENT_PROMPT
 
 __all__ = [
     "search_data",
     "search_assets",
     "rag_mcp_server",
+    "run_regression",
+    "run_roi_analysis",
+    "run_budget_optimizer",
+    "run_adstock_curves",
+    "mmm_mcp_server",
     "ORCHESTRATOR_PROMPT",
     "RAG_AGENT_PROMPT",
     "MMM_AGENT_PROMPT",
@@ -0,0 +1,158 @@
+"""Admission control for chat requests: per-session serialization + global cap.
+
+Two requests for the same ``session_id`` must not drive one Agent SDK client
+at the same time, and a burst of sessions must not start more agent runs than
+the worker (and upstream rate limits) can handle.  ``AdmissionController``
+runs requests of one session one at a time, caps concurrent runs across all
+sessions, and keeps a bounded wait queue; a request that would overflow the
+queue, or waits longer than the queue timeout, is rejected with
+``AdmissionRejected`` so the API can answer 429 instead of piling up work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+# How many recent queue waits feed the percentile metrics.
+_WAIT_SAMPLE_SIZE = 512
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a chat request cannot be admitted (queue full or wait timed out)."""
+
+    def __init__(self, message: str, retry_after_seconds: int) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass
+class _SessionGate:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refs: int = 0
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class AdmissionController:
+    """Serializes each session and bounds concurrent agent runs with a wait queue."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float | None = None,
+        retry_after_seconds: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._clock = clock
+
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._gates: dict[str, _SessionGate] = {}
+        self._in_flight = 0
+        self._queued = 0
+        self._waits_ms: deque[float] = deque(maxlen=_WAIT_SAMPLE_SIZE)
+        self._max_wait_ms = 0.0
+        self._counters = {
+            "admitted": 0,
+            "queued_total": 0,
+            "rejected_queue_full": 0,
+            "rejected_timeout": 0,
+        }
+
+    async def _acquire(self, gate: _SessionGate) -> None:
+        await gate.lock.acquire()
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            gate.lock.release()
+            raise
+
+    def _reject(self, reason: str, message: str) -> AdmissionRejected:
+        self._counters[reason] += 1
+        return AdmissionRejected(message, self.retry_after_seconds)
+
+    @asynccontextmanager
+    async def admit(self, session_id: str) -> AsyncIterator[None]:
+        """Hold the session's turn and one global run slot for the ``async with`` body.
+
+        Raises ``AdmissionRejected`` when the wait queue is full or the wait
+        exceeds ``queue_timeout_seconds``.
+        """
+        gate = self._gates.setdefault(session_id, _SessionGate())
+        gate.refs += 1
+        try:
+            must_wait = gate.lock.locked() or self._slots.locked()
+            if not must_wait:
+                await self._acquire(gate)
+                self._record_wait(0.0)
+            else:
+                if self._queued >= self.max_queue:
+                    raise self._reject(
+                        "rejected_queue_full",
+                        f"{self._in_flight} chats running and {self._queued} queued",
+                    )
+                started = self._clock()
+                self._queued += 1
+                self._counters["queued_total"] += 1
+                try:
+                    await asyncio.wait_for(self._acquire(gate), self.queue_timeout_seconds)
+                except asyncio.TimeoutError:
+                    raise self._reject(
+                        "rejected_timeout",
+                        f"no chat slot freed within {self.queue_timeout_seconds:g}s",
+                    ) from None
+                finally:
+                    self._queued -= 1
+                self._record_wait((self._clock() - started) * 1000)
+
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+                self._slots.release()
+                gate.lock.release()
+        finally:
+            gate.refs -= 1
+            if gate.refs == 0:
+                del self._gates[session_id]
+
+    def _record_wait(self, wait_ms: float) -> None:
+        self._counters["admitted"] += 1
+        self._waits_ms.append(wait_ms)
+        self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+
+    def metrics(self) -> dict[str, int | float | None]:
+        """Snapshot of in-flight runs, queue depth, wait-time percentiles and counters."""
+        waits = sorted(self._waits_ms)
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout_seconds": self.queue_timeout_seconds,
+            "wait_ms_p50": round(_percentile(waits, 0.5), 1),
+            "wait_ms_p95": round(_percentile(waits, 0.95), 1),
+            "wait_ms_max": round(self._max_wait_ms, 1),
+            **self._counters,
+        }
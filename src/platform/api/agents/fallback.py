@@ -0,0 +1,141 @@
+"""Deterministic retrieval-backed answer used when agent routing fails.
+
+Instead of starting a second agent loop, the fallback runs ``search_text``
+(plus ``search_assets`` when the question is about creatives) directly and
+formats the top hits into a markdown answer with numbered citations.  No LLM
+is involved, so the answer is cheap, fast, and reproducible.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Bare "ad"/"ads" is left out: "which ads drove leads?" is a performance question.
+_ASSET_INTENT_RE = re.compile(
+    r"\b(image|images|creative|creatives|asset|assets|picture|pictures|photo|photos|"
+    r"visual|visuals|banner|banners|artwork)\b",
+    re.IGNORECASE,
+)
+_TEXT_TOP_K = 5
+_ASSET_TOP_K = 3
+_EXCERPT_CHARS = 280
+
+_NO_RESULTS_REPLY = (
+    "I'm sorry, I wasn't able to process your question right now, and no matching "
+    "records were found in the indexed project data. Please try again shortly."
+)
+
+# Runs one blocking search under a tool name; the router passes the tool executor.
+SearchRunner = Callable[[str, Callable[[], Any]], Awaitable[Any]]
+
+
+@dataclass
+class FallbackAnswer:
+    reply: str
+    sources: list[str] = field(default_factory=list)
+
+
+def wants_assets(question: str) -> bool:
+    """True when the question asks about creatives/images."""
+    return bool(_ASSET_INTENT_RE.search(question))
+
+
+def source_name(metadata: dict[str, Any]) -> str:
+    """File name used for citations (``data/raw/meta_ads.csv`` → ``meta_ads.csv``)."""
+    raw = str(metadata.get("source_file") or metadata.get("file_name") or "")
+    return PurePosixPath(raw.replace("\\", "/")).name if raw else ""
+
+
+def _excerpt(text: str) -> str:
+    collapsed = " ".join(str(text).split())
+    if len(collapsed) <= _EXCERPT_CHARS:
+        return collapsed
+    return collapsed[: _EXCERPT_CHARS - 1].rstrip() + "…"
+
+
+def _text_detail(metadata: dict[str, Any]) -> str:
+    details = [str(metadata["category"])] if metadata.get("category") else []
+    if metadata.get("date_min") and metadata.get("date_max"):
+        details.append(f"{metadata['date_min']} to {metadata['date_max']}")
+    if metadata.get("row_range"):
+        details.append(f"rows {metadata['row_range']}")
+    return f" ({', '.join(details)})" if details else ""
+
+
+def format_answer(
+    text_results: list[dict[str, Any]],
+    asset_results: list[dict[str, Any]],
+) -> FallbackAnswer:
+    """Render retrieval hits as a markdown answer with numbered citations."""
+    if not text_results and not asset_results:
+        return FallbackAnswer(_NO_RESULTS_REPLY)
+
+    sources: list[str] = []
+
+    def _cite(metadata: dict[str, Any]) -> str:
+        name = source_name(metadata) or "unknown source"
+        if name not in sources:
+            sources.append(name)
+        return f"[{sources.index(name) + 1}]"
+
+    lines = [
+        "The analysis agent is unavailable right now, so here are the most relevant "
+        "records from the indexed project data:",
+        "",
+    ]
+    for rank, result in enumerate(text_results, start=1):
+        metadata = result.get("metadata") or {}
+        citation = _cite(metadata)
+        name = source_name(metadata) or "unknown source"
+        lines.append(
+            f"{rank}. **{name}**{_text_detail(metadata)} — {_excerpt(result.get('text', ''))} {citation}"
+        )
+
+    if asset_results:
+        lines += ["", "**Matching creatives**", ""]
+        for result in asset_results:
+            metadata = result.get("metadata") or {}
+            citation = _cite(metadata)
+            label = metadata.get("image_path") or "asset"
+            tags = ", ".join(
+                str(metadata[key])
+                for key in ("channel", "vehicle_model", "creative_type")
+                if metadata.get(key)
+            )
+            tag_text = f" ({tags})" if tags else ""
+            lines.append(f"- `{label}`{tag_text} — {_excerpt(result.get('text', ''))} {citation}")
+
+    lines += ["", "**Sources:** " + " · ".join(f"[{i}] {name}" for i, name in enumerate(sources, 1))]
+    return FallbackAnswer("\n".join(lines), list(sources))
+
+
+async def answer_from_retrieval(question: str, run: SearchRunner) -> FallbackAnswer:
+    """Search the indexes directly and format the hits; never calls an LLM.
+
+    Each search leg fails independently, so a missing asset index still
+    returns text hits (and vice versa).
+    """
+    try:
+        from src.rag.retrieval.query_engine import search_assets, search_text
+    except Exception:
+        logger.warning("Retrieval unavailable for fallback", exc_info=True)
+        return format_answer([], [])
+
+    text_results: list[dict[str, Any]] = []
+    asset_results: list[dict[str, Any]] = []
+    try:
+        text_results = await run("search_data", lambda: search_text(question, _TEXT_TOP_K))
+    except Exception:
+        logger.warning("Fallback text search failed", exc_info=True)
+    if wants_assets(question):
+        try:
+            asset_results = await run("search_assets", lambda: search_assets(question, _ASSET_TOP_K))
+        except Exception:
+            logger.warning("Fallback asset search failed", exc_info=True)
+    return format_answer(text_results, asset_results)
@@ -0,0 +1,144 @@
+"""Local intent classifier deciding when a chat turn can skip orchestrator routing.
+
+Simple lookups ("What is the ITV contract worth?") do not need the
+orchestrator → ``rag-analyst`` → tool-call chain.  The classifier combines
+regex rules with a small TF-IDF nearest-neighbour model trained on seed
+examples from ``intent_examples.json`` (single-lookup questions, and
+analytical questions that need full routing).  It only opts into the fast path
+when the rules and the model agree; anything else goes through full routing.
+
+Pronouns ("how did it do?") only escalate when the session already has turns
+they could refer to; the router passes that in as ``has_history``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INTENT_EXAMPLES_PATH = Path(__file__).with_name("intent_examples.json")
+
+# Questions that need reasoning, modelling, assets, or explicitly refer back.
+_ESCALATE_RE = re.compile(
+    r"\b("
+    r"optimi[sz]\w*|recommend\w*|realloc\w*|allocat\w*|should|why|forecast\w*|predict\w*|"
+    r"what if|scenario\w*|roi|return on|adstock|saturat\w*|regression|coefficient\w*|mmm|"
+    r"marketing mix|incremental\w*|attribut\w*|trend\w*|correlat\w*|compar\w*|versus|"
+    r"explain\w*|strateg\w*|image\w*|creative\w*|asset\w*|picture\w*|photo\w*|"
+    r"previous|earlier|above"
+    r")\b",
+    re.IGNORECASE,
+)
+_FOLLOW_UP_RE = re.compile(r"^\s*(and|also|what about|how about|same for)\b", re.IGNORECASE)
+# Words that point at an earlier turn when the session has one.
+_REFERENCE_RE = re.compile(r"\b(it|its|that|those|these|them|they|there)\b", re.IGNORECASE)
+_LOOKUP_RE = re.compile(
+    r"^\s*(what|which|when|how many|how much|who|where|list|show me|give me)\b",
+    re.IGNORECASE,
+)
+_MAX_LOOKUP_WORDS = 25
+
+
+@dataclass(frozen=True)
+class IntentDecision:
+    """Outcome of classifying one question."""
+
+    fast_path: bool
+    intent: str
+    confidence: float
+    reason: str
+    elapsed_ms: float
+
+
+def load_intent_examples(path: Path = INTENT_EXAMPLES_PATH) -> tuple[list[tuple[str, str]], list[str]]:
+    """Return ``(lookup (question, category) pairs, full-routing questions)``; empty if unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        lookups = [(item["question"], item.get("category", "lookup")) for item in data["lookup"]]
+        return lookups, [str(question) for question in data["full_routing"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning("Intent training data unavailable at %s", path, exc_info=True)
+        return [], []
+
+
+class IntentClassifier:
+    """Rules + TF-IDF nearest neighbour over lookup and full-routing examples."""
+
+    def __init__(
+        self,
+        lookup_examples: list[tuple[str, str]],
+        full_routing_examples: list[str] | tuple[str, ...] = (),
+        *,
+        min_confidence: float = 0.6,
+        min_similarity: float = 0.2,
+    ) -> None:
+        self._lookup_examples = lookup_examples
+        self._full_routing_examples = list(full_routing_examples)
+        self.min_confidence = min_confidence
+        self.min_similarity = min_similarity
+        self._vectorizer = None
+        self._lookup_matrix = None
+        self._full_matrix = None
+
+    def prepare(self) -> None:
+        """Fit the TF-IDF model now (e.g. at startup) instead of on the first question."""
+        if self._vectorizer is None and self._lookup_examples:
+            self._fit()
+
+    def _fit(self) -> None:
+        # Deferred so importing the router does not pay for scikit-learn.
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        questions = [question for question, _ in self._lookup_examples]
+        vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(3, 5), sublinear_tf=True)
+        vectorizer.fit(questions + self._full_routing_examples)
+        self._lookup_matrix = vectorizer.transform(questions)
+        self._full_matrix = vectorizer.transform(self._full_routing_examples)
+        self._vectorizer = vectorizer
+
+    def _similarities(self, question: str) -> tuple[float, float, str]:
+        if self._vectorizer is None:
+            self._fit()
+        vector = self._vectorizer.transform([question])
+        lookup_scores = (self._lookup_matrix @ vector.T).toarray().ravel()
+        full_scores = (self._full_matrix @ vector.T).toarray().ravel()
+        best = int(lookup_scores.argmax())
+        full_similarity = float(full_scores.max()) if full_scores.size else 0.0
+        return float(lookup_scores[best]), full_similarity, self._lookup_examples[best][1]
+
+    def classify(self, question: str, *, has_history: bool = False) -> IntentDecision:
+        """Decide whether ``question`` can take the single-hop lookup path.
+
+        ``has_history`` says whether the session has earlier turns; only then
+        can a pronoun refer back to one, which needs full routing.
+        """
+        started = time.perf_counter()
+
+        def _decide(fast_path: bool, intent: str, confidence: float, reason: str) -> IntentDecision:
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+            return IntentDecision(fast_path, intent, round(confidence, 3), reason, elapsed_ms)
+
+        text = question.strip()
+        if _ESCALATE_RE.search(text) or _FOLLOW_UP_RE.match(text):
+            return _decide(False, "analysis", 1.0, "escalation keyword")
+        if has_history and _REFERENCE_RE.search(text):
+            return _decide(False, "follow-up", 1.0, "refers to an earlier turn")
+        if not _LOOKUP_RE.match(text) or len(text.split()) > _MAX_LOOKUP_WORDS:
+            return _decide(False, "unknown", 0.0, "no lookup pattern")
+        if not self._lookup_examples:
+            return _decide(False, "unknown", 0.0, "no training data")
+
+        lookup_similarity, full_similarity, category = self._similarities(text)
+        total = lookup_similarity + full_similarity
+        confidence = lookup_similarity / total if total else 0.0
+        if lookup_similarity < self.min_similarity:
+            return _decide(False, category, confidence, "unlike known lookups")
+        if confidence < self.min_confidence:
+            return _decide(False, category, confidence, "low confidence")
+        return _decide(True, category, confidence, "lookup")
@@ -0,0 +1,129 @@
+"""Pool of pre-connected Agent SDK clients for instant session checkout.
+
+Connecting a client spawns the CLI subprocess and performs the initial
+handshake, which used to happen on the first message of every chat session.
+The pool keeps ``warm_size`` idle, already-connected clients and refills in
+the background after each checkout, so a new session only pays that latency
+when the pool is drained.
+
+The pool only depends on a ``factory`` coroutine returning a connected client
+with an async ``disconnect()``, so tests can drive it with a stand-in client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_REFILL_BACKOFF_SECONDS = 1.0
+_MAX_REFILL_BACKOFF_SECONDS = 60.0
+
+
+class ClientPool:
+    """Keeps ``warm_size`` connected, unassigned clients ready for checkout."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        *,
+        warm_size: int,
+        refill_backoff_seconds: float = _REFILL_BACKOFF_SECONDS,
+    ) -> None:
+        if warm_size < 0:
+            raise ValueError("warm_size must be >= 0")
+
+        self._factory = factory
+        self.warm_size = warm_size
+        self._refill_backoff_seconds = refill_backoff_seconds
+        self._idle: deque[Any] = deque()
+        self._refill_task: asyncio.Task | None = None
+        self._closed = False
+        self._counters = {
+            "warm_checkouts": 0,
+            "cold_checkouts": 0,
+            "refilled": 0,
+            "refill_failures": 0,
+        }
+
+    def start(self) -> None:
+        """Begin filling the pool in the background (requires a running loop)."""
+        self._closed = False
+        self._schedule_refill()
+
+    async def checkout(self) -> Any:
+        """Return a connected client, warm if one is idle, and trigger a refill."""
+        if self._idle:
+            client = self._idle.popleft()
+            self._counters["warm_checkouts"] += 1
+        else:
+            client = await self._factory()
+            self._counters["cold_checkouts"] += 1
+        self._schedule_refill()
+        return client
+
+    def _schedule_refill(self) -> None:
+        if self._closed or len(self._idle) >= self.warm_size:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+
+    async def _refill(self) -> None:
+        backoff = self._refill_backoff_seconds
+        while not self._closed and len(self._idle) < self.warm_size:
+            try:
+                client = await self._factory()
+            except Exception:
+                self._counters["refill_failures"] += 1
+                logger.warning(
+                    "Warm agent client connect failed; retrying in %.1fs", backoff, exc_info=True
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_REFILL_BACKOFF_SECONDS)
+                continue
+
+            if self._closed:
+                await self._disconnect(client)
+                return
+            self._idle.append(client)
+            self._counters["refilled"] += 1
+            backoff = self._refill_backoff_seconds
+
+    async def wait_warm(self) -> None:
+        """Wait for the in-flight refill (if any) to finish; mainly for tests and startup."""
+        if self._refill_task is not None:
+            await asyncio.shield(self._refill_task)
+
+    @staticmethod
+    async def _disconnect(client: Any) -> None:
+        try:
+            await client.disconnect()
+        except Exception:
+            logger.warning("Agent client disconnect failed", exc_info=True)
+
+    async def close(self) -> None:
+        """Stop refilling and disconnect every idle client."""
+        self._closed = True
+        if self._refill_task is not None and not self._refill_task.done():
+            self._refill_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refill_task
+        self._refill_task = None
+        while self._idle:
+            await self._disconnect(self._idle.popleft())
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def metrics(self) -> dict[str, int]:
+        """Snapshot of warm size, idle clients, and checkout/refill counters."""
+        return {
+            "warm_size": self.warm_size,
+            "idle_clients": len(self._idle),
+            **self._counters,
+        }
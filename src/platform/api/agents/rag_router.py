@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import time
 import uuid
+from contextlib import aclosing, suppress
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 # Allow the Agent SDK to launch inside a Claude Code session.
 os.environ.pop("CLAUDECODE", None)
@@ -17,10 +20,32 @@ from claude_agent_sdk import (
     ClaudeAgentOptions,
     ClaudeSDKClient,
     TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
 )
 
-from .prompts import ORCHESTRATOR_PROMPT, RAG_AGENT_PROMPT
-from .tools import rag_mcp_server
+from .admission import AdmissionController
+from .fallback import answer_from_retrieval, source_name
+from .intent import IntentClassifier, IntentDecision, load_intent_examples
+from .pool import ClientPool
+from .prompts import (
+    FAST_PATH_PROMPT,
+    MMM_AGENT_PROMPT,
+    ORCHESTRATOR_PROMPT,
+    RAG_AGENT_PROMPT,
+    SESSION_CATCH_UP_PROMPT,
+    SESSION_REPLAY_PROMPT,
+)
+from .session_state import SessionStateStore, compact_transcript
+from .sessions import SessionCapacityError, SessionStore
+from .tools import (
+    mmm_mcp_server,
+    rag_mcp_server,
+    run_tool_call,
+    shutdown_tool_executor,
+    tool_executor_metrics,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,34 +59,117 @@ for _p in _PROJECT_ROOT.parents:
         _PROJECT_ROOT = _p
         break
 
+
 # ---------------------------------------------------------------------------
-# Session store — maps session_id → ClaudeSDKClient
+# Response streaming
 # ---------------------------------------------------------------------------
 
-_sessions: dict[str, ClaudeSDKClient] = {}
+def _extract_sources(reply: str) -> list[str]:
+    """Extract source references from the reply (filenames ending in .csv or .md)."""
+    sources: list[str] = []
+    for word in reply.split():
+        cleaned = word.strip("(),;:\"'`[]")
+        if cleaned.endswith((".csv", ".md")) and "/" not in cleaned:
+            if cleaned not in sources:
+                sources.append(cleaned)
+    return sources
 
 
-async def _extract_reply(client: ClaudeSDKClient) -> tuple[str, list[str]]:
-    """Collect text reply and source file references from the agent response."""
-    text_parts: list[str] = []
-    sources: list[str] = []
+async def _iter_agent_events(client: ClaudeSDKClient) -> AsyncIterator[dict[str, Any]]:
+    """Translate the agent response into text and tool start/finish events as they arrive."""
+    tool_names: dict[str, str] = {}
 
     async for message in client.receive_response():
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    text_parts.append(block.text)
+                    yield {"type": "text", "text": block.text}
+                elif isinstance(block, ToolUseBlock):
+                    tool_names[block.id] = block.name
+                    yield {
+                        "type": "tool_start",
+                        "id": block.id,
+                        "name": block.name,
+                        "input": block.input,
+                    }
+        elif isinstance(message, UserMessage) and isinstance(message.content, list):
+            for block in message.content:
+                if isinstance(block, ToolResultBlock):
+                    yield {
+                        "type": "tool_end",
+                        "id": block.tool_use_id,
+                        "name": tool_names.get(block.tool_use_id, ""),
+                        "is_error": bool(block.is_error),
+                    }
 
-    reply = "\n".join(text_parts)
 
-    # Extract source references from the reply (filenames ending in .csv or .md)
-    for word in reply.split():
-        cleaned = word.strip("(),;:\"'`[]")
-        if cleaned.endswith((".csv", ".md")) and "/" not in cleaned:
-            if cleaned not in sources:
-                sources.append(cleaned)
+# ---------------------------------------------------------------------------
+# Local intent fast path — skip orchestrator delegation for simple lookups
+# ---------------------------------------------------------------------------
+
+_FAST_PATH_ENABLED = os.getenv("RAG_FAST_PATH", "1").strip().lower() not in {"0", "false", "no"}
+_FAST_PATH_TOP_K = 5
+_FAST_PATH_CONTEXT_CHARS = 1500
+_FAST_PATH_SEARCH_ID = "local-search"
+
+_intent = IntentClassifier(
+    *load_intent_examples(),
+    min_confidence=float(os.getenv("RAG_FAST_PATH_MIN_CONFIDENCE", "0.6")),
+)
+_intent_warmup: asyncio.Future | None = None
+
+
+def _route(question: str, has_history: bool = False) -> IntentDecision:
+    """Classify the question and log how long the routing decision took."""
+    decision = _intent.classify(question, has_history=has_history)
+    if not _FAST_PATH_ENABLED and decision.fast_path:
+        decision = IntentDecision(
+            False, decision.intent, decision.confidence, "fast path disabled", decision.elapsed_ms
+        )
+    logger.info(
+        "Router decision: %s (intent=%s confidence=%.2f reason=%s) in %.2fms",
+        "fast" if decision.fast_path else "full",
+        decision.intent,
+        decision.confidence,
+        decision.reason,
+        decision.elapsed_ms,
+    )
+    return decision
+
+
+async def _local_search(question: str) -> list[dict[str, Any]]:
+    """Run hybrid text retrieval on the tool executor, under the search_data deadline."""
+    from src.rag.retrieval.query_engine import search_text
+
+    return await run_tool_call("search_data", lambda: search_text(question, _FAST_PATH_TOP_K))
 
-    return reply, sources
+
+def _fast_path_prompt(question: str, results: list[dict[str, Any]]) -> str:
+    blocks = []
+    for result in results:
+        metadata = result.get("metadata") or {}
+        source = metadata.get("source_file") or metadata.get("file_name") or "unknown"
+        text = str(result.get("text", ""))[:_FAST_PATH_CONTEXT_CHARS]
+        blocks.append(f"[{source}]\n{text}")
+    return FAST_PATH_PROMPT.format(context="\n\n".join(blocks), question=question)
+
+
+def _result_sources(results: list[dict[str, Any]]) -> list[str]:
+    sources: list[str] = []
+    for result in results:
+        source = source_name(result.get("metadata") or {})
+        if source and source not in sources:
+            sources.append(source)
+    return sources
+
+
+# In-process MMM tools; they share one loaded dataset and fitted model.
+_MMM_TOOLS = (
+    "mcp__mmm-tools__run_regression",
+    "mcp__mmm-tools__run_roi_analysis",
+    "mcp__mmm-tools__run_budget_optimizer",
+    "mcp__mmm-tools__run_adstock_curves",
+)
 
 
 async def _create_client() -> ClaudeSDKClient:
@@ -85,8 +193,17 @@ async def _create_client() -> ClaudeSDKClient:
                 ],
                 model="sonnet",
             ),
+            "mmm-analyst": AgentDefinition(
+                description=(
+                    "Marketing mix modeling analyst. Use for ROI by channel, budget "
+                    "optimization, adstock/saturation, and regression results."
+                ),
+                prompt=MMM_AGENT_PROMPT,
+                tools=list(_MMM_TOOLS),
+                model="sonnet",
+            ),
         },
-        mcp_servers={"rag-tools": rag_mcp_server},
+        mcp_servers={"rag-tools": rag_mcp_server, "mmm-tools": mmm_mcp_server},
         allowed_tools=[
             "Task",
             "Read",
@@ -94,6 +211,7 @@ async def _create_client() -> ClaudeSDKClient:
             "Glob",
             "mcp__rag-tools__search_data",
             "mcp__rag-tools__search_assets",
+            *_MMM_TOOLS,
         ],
         permission_mode="bypassPermissions",
         max_turns=15,
@@ -105,55 +223,297 @@ async def _create_client() -> ClaudeSDKClient:
     return client
 
 
-async def ask_with_routing(
+# ---------------------------------------------------------------------------
+# Warm client pool + session store — bounded LRU of session_id → ClaudeSDKClient
+# ---------------------------------------------------------------------------
+
+_WARM_CLIENTS = int(os.getenv("RAG_WARM_CLIENTS", "0"))
+_MAX_LIVE_CLIENTS = int(os.getenv("RAG_MAX_LIVE_CLIENTS", "32"))
+
+_pool = ClientPool(_create_client, warm_size=_WARM_CLIENTS)
+
+# Sessions check out warm clients; idle pool clients count toward the live cap.
+_sessions = SessionStore(
+    _pool.checkout,
+    max_sessions=int(os.getenv("RAG_MAX_SESSIONS", "32")),
+    idle_ttl_seconds=float(os.getenv("RAG_SESSION_IDLE_TTL_SECONDS", "900")),
+    max_live_clients=max(_MAX_LIVE_CLIENTS - _WARM_CLIENTS, 1),
+)
+
+# One run per session at a time, a global cap on concurrent runs, bounded wait queue.
+_admission = AdmissionController(
+    max_concurrent=int(os.getenv("RAG_MAX_CONCURRENT_CHATS", "8")),
+    max_queue=int(os.getenv("RAG_CHAT_QUEUE_SIZE", "16")),
+    queue_timeout_seconds=float(os.getenv("RAG_CHAT_QUEUE_TIMEOUT_SECONDS", "30")),
+    retry_after_seconds=int(os.getenv("RAG_CHAT_RETRY_AFTER_SECONDS", "2")),
+)
+
+# Transcripts persisted across workers and restarts; replayed into new clients.
+_session_state = SessionStateStore(
+    _PROJECT_ROOT / os.getenv("RAG_SESSION_DB", "data/processed/chat_sessions.sqlite3"),
+    max_turns_per_session=int(os.getenv("RAG_SESSION_MAX_TURNS", "50")),
+    retention_seconds=float(os.getenv("RAG_SESSION_RETENTION_DAYS", "30")) * 86400,
+)
+_SESSION_REPLAY_TURNS = int(os.getenv("RAG_SESSION_REPLAY_TURNS", "6"))
+
+
+async def _replay_prompt(session_id: str, prompt: str, seen_seq: int | None) -> tuple[str, bool, int]:
+    """Prefix ``prompt`` with stored turns the session's client has not seen.
+
+    ``seen_seq`` is the last persisted turn the live client saw, or None for a
+    fresh client (then the newest turns are replayed).  Returns the prompt,
+    whether anything was replayed, and the newest turn the client now knows.
+    """
+    known = seen_seq or 0
+    try:
+        turns = await asyncio.to_thread(_session_state.history, session_id, _SESSION_REPLAY_TURNS, known)
+    except Exception:
+        logger.warning("Could not load session %s history; starting fresh", session_id, exc_info=True)
+        return prompt, False, known
+    if not turns:
+        return prompt, False, known
+    _session_state.mark_rehydrated()
+    template = SESSION_REPLAY_PROMPT if seen_seq is None else SESSION_CATCH_UP_PROMPT
+    return template.format(transcript=compact_transcript(turns), question=prompt), True, turns[-1].seq
+
+
+async def _save_turn(session_id: str, question: str, reply: str, agent_used: str) -> int | None:
+    try:
+        return await asyncio.to_thread(_session_state.append_turn, session_id, question, reply, agent_used)
+    except Exception:
+        logger.warning("Could not persist turn for session %s", session_id, exc_info=True)
+        return None
+
+
+def _log_intent_warmup(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Intent model warm-up failed", exc_info=future.exception())
+
+
+async def _has_history(session_id: str) -> bool:
+    """Whether the session has earlier turns, live on this worker or stored by any worker."""
+    if session_id in _sessions:
+        return True
+    try:
+        return bool(await asyncio.to_thread(_session_state.history, session_id, 1))
+    except Exception:
+        logger.warning("Could not read history for session %s", session_id, exc_info=True)
+        return True
+
+
+def start_intent_warmup() -> None:
+    """Fit the intent model on a worker thread (called at app startup when the fast path is on)."""
+    global _intent_warmup
+    if not _FAST_PATH_ENABLED or _intent_warmup is not None:
+        return
+    _intent_warmup = asyncio.get_running_loop().run_in_executor(None, _intent.prepare)
+    _intent_warmup.add_done_callback(_log_intent_warmup)
+
+
+def start_client_pool() -> None:
+    """Start pre-connecting warm clients (called at app startup when RAG_WARM_CLIENTS > 0)."""
+    _pool.start()
+
+
+async def sweep_sessions() -> int:
+    """Disconnect sessions idle past the TTL and prune expired transcripts (called periodically)."""
+    try:
+        await asyncio.to_thread(_session_state.prune)
+    except Exception:
+        logger.warning("Session transcript pruning failed", exc_info=True)
+    return await _sessions.sweep()
+
+
+async def shutdown_sessions() -> None:
+    """Disconnect every agent client and stop the tool executor (called at app shutdown)."""
+    global _intent_warmup
+    if _intent_warmup is not None:
+        _intent_warmup.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await _intent_warmup
+        _intent_warmup = None
+    await _pool.close()
+    await _sessions.close()
+    shutdown_tool_executor()
+
+
+def session_metrics() -> dict[str, int | float]:
+    """Live session count, caps, and eviction/reconnect counters."""
+    return _sessions.metrics()
+
+
+def session_state_metrics() -> dict[str, int | float | str]:
+    """Stored transcript counts and save/rehydrate/prune counters."""
+    return _session_state.metrics()
+
+
+def pool_metrics() -> dict[str, int]:
+    """Warm pool size, idle clients, and warm/cold checkout counters."""
+    return _pool.metrics()
+
+
+def admission_metrics() -> dict[str, int | float | None]:
+    """In-flight chats, queue depth, queue wait percentiles, and rejection counters."""
+    return _admission.metrics()
+
+
+async def stream_with_routing(
     question: str,
     session_id: str | None = None,
-) -> dict[str, Any]:
-    """Route a question through the Claude Agent SDK orchestrator.
+) -> AsyncIterator[dict[str, Any]]:
+    """Route a question through the orchestrator, yielding events as they arrive.
 
-    Returns a dict with keys: reply, sources, session_id, agent_used.
-    Falls back to rag_agent.ask_marketing_question when the SDK is unavailable.
+    Event types: ``session`` (once a client is leased), ``text`` (each
+    TextBlock), ``tool_start``/``tool_end``, ``error`` (agent failed after
+    partial output), and a closing ``final`` with reply, sources, session_id,
+    agent_used, rehydrated and timing.
+
+    Every answered turn is persisted to the durable session store.  When this
+    worker holds no client for ``session_id`` (another worker served it, or
+    the process restarted), the stored turns are replayed compactly into the
+    new client's first prompt.  A live client is caught up on any turns other
+    workers served since its last reply.  Either way ``rehydrated`` is true.
+
+    Requests for one session run one at a time and concurrent runs are capped
+    per worker.  Before the first event, raises ``AdmissionRejected`` when the
+    wait queue is full (or the wait times out) and ``SessionCapacityError``
+    when every live agent client is busy.
     """
     if session_id is None:
         session_id = str(uuid.uuid4())
 
+    async with _admission.admit(session_id):
+        async with aclosing(_stream_session(question, session_id)) as events:
+            async for event in events:
+                yield event
+
+
+async def _stream_session(question: str, session_id: str) -> AsyncIterator[dict[str, Any]]:
+    started = time.perf_counter()
+    text_parts: list[str] = []
+    first_text_ms: float | None = None
+    agent_used = "rag-analyst"
+
+    def _elapsed_ms() -> float:
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    # A cold model is fitted on first use; keep that (and sklearn's import) off the event loop.
+    decision = await asyncio.to_thread(_route, question, await _has_history(session_id))
+    results: list[dict[str, Any]] = []
+    fallback_sources: list[str] = []
+    rehydrated = False
+    leased: Any = None
+    seen_seq = 0
+
     try:
-        # Reuse or create client for this session
-        client = _sessions.get(session_id)
-        if client is None:
-            client = await _create_client()
-            _sessions[session_id] = client
-
-        await client.query(question)
-        reply, sources = await _extract_reply(client)
-
-        return {
-            "reply": reply,
-            "sources": sources,
-            "session_id": session_id,
-            "agent_used": "rag-analyst",
-        }
+        async with _sessions.lease(session_id) as client:
+            leased = client
+            yield {"type": "session", "session_id": session_id}
+
+            prompt = question
+            if decision.fast_path:
+                search_input = {"query": question, "top_k": _FAST_PATH_TOP_K}
+                yield {
+                    "type": "tool_start",
+                    "id": _FAST_PATH_SEARCH_ID,
+                    "name": "search_text",
+                    "input": search_input,
+                }
+                try:
+                    results = await _local_search(question)
+                except Exception:
+                    logger.warning("Fast-path search failed; using full routing", exc_info=True)
+                yield {
+                    "type": "tool_end",
+                    "id": _FAST_PATH_SEARCH_ID,
+                    "name": "search_text",
+                    "is_error": not results,
+                    "results": results,
+                }
+                if results:
+                    prompt = _fast_path_prompt(question, results)
+                    agent_used = "rag-fast-path"
+
+            # Admission serializes this worker's runs of a session; turns another
+            # worker served since this client's last reply are replayed first.
+            prompt, rehydrated, seen_seq = await _replay_prompt(
+                session_id, prompt, _sessions.turn_seq(session_id, client)
+            )
+            _sessions.set_turn_seq(session_id, client, seen_seq)
+            await client.query(prompt)
+            async for event in _iter_agent_events(client):
+                if event["type"] == "text":
+                    text_parts.append(event["text"])
+                    if first_text_ms is None:
+                        first_text_ms = _elapsed_ms()
+                yield event
+
+    except SessionCapacityError:
+        # Spawning a fallback agent would only add processes; let the caller back off.
+        raise
 
     except Exception:
-        logger.exception("Agent SDK routing failed — falling back to file reader")
-        # Remove broken session
-        _sessions.pop(session_id, None)
-
-        try:
-            from ..rag_agent import ask_marketing_question
-
-            fallback_reply = await ask_marketing_question(question)
-            return {
-                "reply": fallback_reply,
-                "sources": [],
-                "session_id": session_id,
-                "agent_used": "file-reader-fallback",
-            }
-        except Exception:
-            logger.exception("Fallback also failed")
-            return {
-                "reply": "I'm sorry, I wasn't able to process your question right now. Please try again.",
-                "sources": [],
-                "session_id": session_id,
-                "agent_used": "file-reader-fallback",
-            }
+        # The lease already discarded and disconnected the broken session.
+        logger.exception("Agent SDK routing failed — falling back to direct retrieval")
+        if text_parts:
+            # Part of the answer is already on the wire; don't replace it with a fallback.
+            yield {"type": "error", "message": "The agent stopped before finishing its answer."}
+        else:
+            agent_used = "retrieval-fallback"
+            fallback = await answer_from_retrieval(question, run_tool_call)
+            fallback_sources = fallback.sources
+            text_parts.append(fallback.reply)
+            first_text_ms = _elapsed_ms()
+            yield {"type": "text", "text": fallback.reply}
+
+    reply = "\n".join(text_parts)
+    if agent_used == "retrieval-fallback":
+        sources = fallback_sources
+    else:
+        sources = _extract_sources(reply)
+        if not sources and agent_used == "rag-fast-path":
+            sources = _result_sources(results)
+    if reply:
+        saved_seq = await _save_turn(session_id, question, reply, agent_used)
+        # A gap means another worker saved a turn meanwhile; the next run replays it.
+        if saved_seq == seen_seq + 1:
+            _sessions.set_turn_seq(session_id, leased, saved_seq)
+    yield {
+        "type": "final",
+        "reply": reply,
+        "sources": sources,
+        "session_id": session_id,
+        "agent_used": agent_used,
+        "rehydrated": rehydrated,
+        "route": {
+            "path": "fast" if agent_used == "rag-fast-path" else "full",
+            "intent": decision.intent,
+            "confidence": decision.confidence,
+            "reason": decision.reason,
+            "decision_ms": decision.elapsed_ms,
+        },
+        "timing": {"first_text_ms": first_text_ms, "total_ms": _elapsed_ms()},
+    }
+
+
+async def ask_with_routing(
+    question: str,
+    session_id: str | None = None,
+) -> dict[str, Any]:
+    """Route a question through the Claude Agent SDK orchestrator.
+
+    Returns a dict with keys: reply, sources, session_id, agent_used.
+    Falls back to a retrieval-only markdown answer when the SDK is unavailable.
+    Raises ``AdmissionRejected`` or ``SessionCapacityError`` when the worker is saturated.
+    """
+    final: dict[str, Any] = {}
+    async for event in stream_with_routing(question, session_id):
+        if event["type"] == "final":
+            final = event
+
+    return {
+        "reply": final["reply"],
+        "sources": final["sources"],
+        "session_id": final["session_id"],
+        "agent_used": final["agent_used"],
+    }
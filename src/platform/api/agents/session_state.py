@@ -0,0 +1,205 @@
+"""Durable chat session transcripts shared by every API worker.
+
+Live Agent SDK clients stay in each worker's ``SessionStore``; this module
+keeps the part that must survive a worker switch or restart — the question
+and reply of every turn — in a local SQLite database.  When a worker sees a
+``session_id`` it holds no client for, the router loads the last few turns
+and replays them compactly into the first prompt of the new client.  A live
+client that missed turns served by another worker is caught up the same way
+with just the turns newer than the last one it saw.
+
+SQLite runs in WAL mode so several uvicorn workers can read while one
+writes.  Each call opens its own short-lived connection, so the store is
+safe to use from executor threads.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_sessions (
+    session_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    turns INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS chat_turns (
+    session_id TEXT NOT NULL REFERENCES chat_sessions(session_id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    reply TEXT NOT NULL,
+    agent_used TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+CREATE INDEX IF NOT EXISTS chat_sessions_updated_at ON chat_sessions(updated_at);
+"""
+
+# Per-turn reply excerpt used when replaying history into a new client.
+_REPLAY_REPLY_CHARS = 600
+
+
+@dataclass(frozen=True)
+class ChatTurn:
+    seq: int
+    question: str
+    reply: str
+    agent_used: str
+    created_at: float
+
+
+def compact_transcript(turns: list[ChatTurn], reply_chars: int = _REPLAY_REPLY_CHARS) -> str:
+    """Render turns as a short ``User:``/``Assistant:`` transcript with clipped replies."""
+    lines: list[str] = []
+    for turn in turns:
+        reply = " ".join(turn.reply.split())
+        if len(reply) > reply_chars:
+            reply = reply[: reply_chars - 1].rstrip() + "…"
+        lines.append(f"User: {' '.join(turn.question.split())}")
+        lines.append(f"Assistant: {reply}")
+    return "\n".join(lines)
+
+
+class SessionStateStore:
+    """SQLite-backed transcript per ``session_id`` with a retention window."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_turns_per_session: int,
+        retention_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_turns_per_session < 1:
+            raise ValueError("max_turns_per_session must be >= 1")
+        if retention_seconds <= 0:
+            raise ValueError("retention_seconds must be > 0")
+
+        self.path = Path(path)
+        self.max_turns_per_session = max_turns_per_session
+        self.retention_seconds = retention_seconds
+        self._clock = clock
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._counters_lock = threading.Lock()
+        self._counters = {"turns_saved": 0, "rehydrated": 0, "pruned_sessions": 0}
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=5.0)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                    finally:
+                        conn.close()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counters_lock:
+            self._counters[name] += amount
+
+    # ------------------------------------------------------------------
+    # Public API (blocking; call from an executor thread on the event loop)
+    # ------------------------------------------------------------------
+
+    def append_turn(self, session_id: str, question: str, reply: str, agent_used: str) -> int:
+        """Record one turn and trim the session to its newest turns; returns the turn number."""
+        now = self._clock()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO chat_sessions (session_id, created_at, updated_at, turns) "
+                    "VALUES (?, ?, ?, 0) ON CONFLICT(session_id) DO NOTHING",
+                    (session_id, now, now),
+                )
+                conn.execute(
+                    "UPDATE chat_sessions SET turns = turns + 1, updated_at = ? WHERE session_id = ?",
+                    (now, session_id),
+                )
+                (seq,) = conn.execute(
+                    "SELECT turns FROM chat_sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT INTO chat_turns (session_id, seq, question, reply, agent_used, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_id, seq, question, reply, agent_used, now),
+                )
+                conn.execute(
+                    "DELETE FROM chat_turns WHERE session_id = ? AND seq <= ?",
+                    (session_id, seq - self.max_turns_per_session),
+                )
+        finally:
+            conn.close()
+        self._count("turns_saved")
+        return seq
+
+    def history(self, session_id: str, limit: int | None = None, after_seq: int = 0) -> list[ChatTurn]:
+        """Return the session's stored turns after ``after_seq``, oldest first (the newest ``limit`` if given)."""
+        limit = self.max_turns_per_session if limit is None else limit
+        if limit < 1:
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT seq, question, reply, agent_used, created_at FROM chat_turns "
+                "WHERE session_id = ? AND seq > ? ORDER BY seq DESC LIMIT ?",
+                (session_id, after_seq, limit),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [ChatTurn(*row) for row in reversed(rows)]
+
+    def mark_rehydrated(self) -> None:
+        self._count("rehydrated")
+
+    def prune(self) -> int:
+        """Delete sessions idle past the retention window; returns how many were dropped."""
+        cutoff = self._clock() - self.retention_seconds
+        conn = self._connect()
+        try:
+            with conn:
+                dropped = conn.execute(
+                    "DELETE FROM chat_sessions WHERE updated_at < ?", (cutoff,)
+                ).rowcount
+        finally:
+            conn.close()
+        if dropped:
+            self._count("pruned_sessions", dropped)
+        return dropped
+
+    def metrics(self) -> dict[str, int | float | str]:
+        """Stored session/turn counts plus this worker's save/rehydrate/prune counters."""
+        conn = self._connect()
+        try:
+            (sessions,) = conn.execute("SELECT COUNT(*) FROM chat_sessions").fetchone()
+            (turns,) = conn.execute("SELECT COUNT(*) FROM chat_turns").fetchone()
+        finally:
+            conn.close()
+        with self._counters_lock:
+            counters = dict(self._counters)
+        return {
+            "path": str(self.path),
+            "stored_sessions": sessions,
+            "stored_turns": turns,
+            "max_turns_per_session": self.max_turns_per_session,
+            "retention_seconds": self.retention_seconds,
+            **counters,
+        }
@@ -0,0 +1,245 @@
+"""Bounded session store for long-lived Agent SDK clients.
+
+Each chat session owns one connected client (and its CLI subprocess).  The
+store keeps them in an LRU with an idle TTL and a hard cap on live clients per
+worker, disconnects every client it drops, and counts what it does so memory
+and process count stay flat under sustained chat traffic.
+
+Clients are checked out with ``lease()``; a leased client is never evicted,
+and a lease that exits with an exception discards its (possibly broken)
+client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# How many recently dropped session ids are remembered to count reconnects.
+_RETIRED_ID_MEMORY = 1024
+
+
+class SessionCapacityError(RuntimeError):
+    """Raised when every live client is leased and no new client may be created."""
+
+
+@dataclass
+class _SessionEntry:
+    client: Any
+    last_used: float
+    leases: int = 0
+    # Last persisted transcript turn this client has seen; None for a fresh client.
+    turn_seq: int | None = None
+
+
+class SessionStore:
+    """LRU + idle-TTL map of ``session_id`` to connected Agent SDK client."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        *,
+        max_sessions: int,
+        idle_ttl_seconds: float,
+        max_live_clients: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        if idle_ttl_seconds <= 0:
+            raise ValueError("idle_ttl_seconds must be > 0")
+
+        self._factory = factory
+        self.max_sessions = max_sessions
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_live_clients = max(max_live_clients or max_sessions, 1)
+        self._clock = clock
+
+        self._entries: OrderedDict[str, _SessionEntry] = OrderedDict()
+        self._retired: OrderedDict[str, None] = OrderedDict()
+        self._pending = 0
+        self._lock = asyncio.Lock()
+        self._counters = {
+            "created": 0,
+            "reconnects": 0,
+            "evicted_lru": 0,
+            "evicted_idle": 0,
+            "discarded": 0,
+            "capacity_rejections": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal bookkeeping (call with self._lock held)
+    # ------------------------------------------------------------------
+
+    def _retire_locked(self, session_id: str, reason: str) -> Any:
+        entry = self._entries.pop(session_id)
+        self._counters[reason] += 1
+        self._retired[session_id] = None
+        self._retired.move_to_end(session_id)
+        while len(self._retired) > _RETIRED_ID_MEMORY:
+            self._retired.popitem(last=False)
+        return entry.client
+
+    def _expire_locked(self, now: float) -> list[Any]:
+        expired = [
+            session_id
+            for session_id, entry in self._entries.items()
+            if entry.leases == 0 and now - entry.last_used >= self.idle_ttl_seconds
+        ]
+        return [self._retire_locked(session_id, "evicted_idle") for session_id in expired]
+
+    def _make_room_locked(self) -> list[Any]:
+        """Evict idle LRU sessions until one more client fits under both caps."""
+        evicted: list[Any] = []
+        while (
+            len(self._entries) >= self.max_sessions
+            or len(self._entries) + self._pending >= self.max_live_clients
+        ):
+            victim = next(
+                (sid for sid, entry in self._entries.items() if entry.leases == 0),
+                None,
+            )
+            if victim is None:
+                self._counters["capacity_rejections"] += 1
+                raise SessionCapacityError(
+                    f"all {len(self._entries) + self._pending} agent clients are busy"
+                )
+            evicted.append(self._retire_locked(victim, "evicted_lru"))
+        return evicted
+
+    @staticmethod
+    async def _disconnect(clients: list[Any]) -> None:
+        for client in clients:
+            try:
+                await client.disconnect()
+            except Exception:
+                logger.warning("Agent client disconnect failed", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def _checkout(self, session_id: str) -> Any:
+        to_close: list[Any] = []
+        try:
+            async with self._lock:
+                now = self._clock()
+                to_close.extend(self._expire_locked(now))
+                entry = self._entries.get(session_id)
+                if entry is not None:
+                    entry.leases += 1
+                    entry.last_used = now
+                    self._entries.move_to_end(session_id)
+                    return entry.client
+                to_close.extend(self._make_room_locked())
+                self._pending += 1
+        finally:
+            await self._disconnect(to_close)
+
+        try:
+            client = await self._factory()
+        except BaseException:
+            async with self._lock:
+                self._pending -= 1
+            raise
+
+        async with self._lock:
+            self._pending -= 1
+            existing = self._entries.get(session_id)
+            if existing is None:
+                self._entries[session_id] = _SessionEntry(client, self._clock(), leases=1)
+                self._counters["created"] += 1
+                if session_id in self._retired:
+                    del self._retired[session_id]
+                    self._counters["reconnects"] += 1
+                return client
+            # A concurrent lease created this session first; keep its client.
+            existing.leases += 1
+            existing.last_used = self._clock()
+        await self._disconnect([client])
+        return existing.client
+
+    async def _release(self, session_id: str, client: Any) -> None:
+        async with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and entry.client is client:
+                entry.leases = max(entry.leases - 1, 0)
+                entry.last_used = self._clock()
+
+    @asynccontextmanager
+    async def lease(self, session_id: str) -> AsyncIterator[Any]:
+        """Check out the session's client, creating (and connecting) it if needed.
+
+        Raises ``SessionCapacityError`` when the live-client cap is reached and
+        every client is leased.
+        """
+        client = await self._checkout(session_id)
+        try:
+            yield client
+        except BaseException:
+            await self.discard(session_id, client)
+            raise
+        await self._release(session_id, client)
+
+    async def discard(self, session_id: str, client: Any | None = None) -> None:
+        """Drop and disconnect a session, e.g. after its client failed."""
+        async with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or (client is not None and entry.client is not client):
+                return
+            dropped = self._retire_locked(session_id, "discarded")
+        await self._disconnect([dropped])
+
+    async def sweep(self) -> int:
+        """Evict sessions idle past the TTL; returns how many were dropped."""
+        async with self._lock:
+            expired = self._expire_locked(self._clock())
+        await self._disconnect(expired)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Disconnect every client, leased or not (app shutdown)."""
+        async with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+        await self._disconnect(clients)
+
+    def turn_seq(self, session_id: str, client: Any) -> int | None:
+        """Last persisted turn ``client`` has seen in this session (None if it is new)."""
+        entry = self._entries.get(session_id)
+        if entry is None or entry.client is not client:
+            return None
+        return entry.turn_seq
+
+    def set_turn_seq(self, session_id: str, client: Any, seq: int) -> None:
+        """Record that ``client`` has seen the session's persisted turns up to ``seq``."""
+        entry = self._entries.get(session_id)
+        if entry is not None and entry.client is client:
+            entry.turn_seq = seq
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics(self) -> dict[str, int | float]:
+        """Snapshot of live sessions, caps, and lifetime eviction/reconnect counters."""
+        return {
+            "live_sessions": len(self._entries),
+            "leased_sessions": sum(1 for entry in self._entries.values() if entry.leases),
+            "pending_clients": self._pending,
+            "max_sessions": self.max_sessions,
+            "max_live_clients": self.max_live_clients,
+            "idle_ttl_seconds": self.idle_ttl_seconds,
+            "evictions": self._counters["evicted_lru"] + self._counters["evicted_idle"],
+            **self._counters,
+        }
@@ -0,0 +1,90 @@
+"""Shared LRU cache of MCP tool result payloads.
+
+Different chat sessions often ask the same canned questions, so the search
+tools keep the final JSON text they returned, keyed by tool name, normalized
+arguments and the index version.  A hit costs one dict lookup instead of a
+retrieval plus ``json.dumps``; rebuilding an index changes the version and
+so retires every entry computed against the old one.  The cache is bounded by
+both entry count and total payload size.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from typing import Any
+
+
+class ToolResultCache:
+    """Size-bounded LRU of ``(tool, index_version, args) -> JSON text``."""
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "oversized": 0}
+
+    @staticmethod
+    def key(tool_name: str, args: dict[str, Any], index_version: str) -> tuple[str, str, str]:
+        """Build a cache key; ``args`` should already have defaults applied."""
+        return tool_name, index_version, json.dumps(args, sort_keys=True, default=str)
+
+    def get(self, key: tuple[str, str, str]) -> str | None:
+        payload = self._entries.get(key)
+        if payload is None:
+            self._counters["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._counters["hits"] += 1
+        return payload
+
+    def put(self, key: tuple[str, str, str], payload: str) -> None:
+        size = len(payload)
+        if size > self.max_bytes:
+            self._counters["oversized"] += 1
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = payload
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics(self) -> dict[str, int]:
+        """Snapshot of entries, payload bytes, and hit/miss/eviction counters."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            **self._counters,
+        }
+
+
+# Shared across sessions: identical searches against the same index reuse the JSON payload.
+shared_cache = ToolResultCache(
+    max_entries=int(os.getenv("RAG_TOOL_CACHE_ENTRIES", "256")),
+    max_bytes=int(os.getenv("RAG_TOOL_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+)
+
+
+def tool_cache_metrics() -> dict[str, int]:
+    """Entries, payload bytes, and hit/miss/eviction counters of the shared tool cache."""
+    return shared_cache.metrics()
@@ -0,0 +1,151 @@
+"""Bounded thread pool with per-tool deadlines for blocking tool calls.
+
+Retrieval (Qdrant, BM25, embedding requests) is synchronous.  Running it
+inline in an async tool handler blocks the event loop, and one slow call can
+hang an agent turn indefinitely.  ``ToolExecutor`` runs those calls on a
+fixed-size thread pool, rejects new calls once too many are waiting,
+enforces a deadline per tool, and cancels calls that have not started yet
+when the awaiting task is cancelled (e.g. the chat request disconnected).
+A call that is already running cannot be interrupted; its result is
+discarded when it finishes, and it counts as in flight until then.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class ToolExecutionError(RuntimeError):
+    """Base class for calls the executor refused or abandoned."""
+
+    kind = "error"
+    retryable = True
+
+    def __init__(self, tool_name: str, message: str) -> None:
+        super().__init__(message)
+        self.tool_name = tool_name
+
+
+class ToolTimeoutError(ToolExecutionError):
+    """Raised when a tool call misses its deadline."""
+
+    kind = "timeout"
+
+    def __init__(self, tool_name: str, timeout_seconds: float) -> None:
+        super().__init__(tool_name, f"{tool_name} timed out after {timeout_seconds:g}s")
+        self.timeout_seconds = timeout_seconds
+
+
+class ToolBusyError(ToolExecutionError):
+    """Raised when the wait queue is full."""
+
+    kind = "busy"
+
+
+class ToolExecutor:
+    """Runs blocking tool work on ``max_workers`` threads with per-tool timeouts."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_pending: int,
+        default_timeout_seconds: float,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_pending < 0:
+            raise ValueError("max_pending must be >= 0")
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.default_timeout_seconds = default_timeout_seconds
+        self.timeouts = dict(timeouts or {})
+        self._pool: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "rejected_busy": 0,
+        }
+
+    def timeout_for(self, tool_name: str) -> float:
+        return self.timeouts.get(tool_name, self.default_timeout_seconds)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="rag-tool"
+            )
+        return self._pool
+
+    def _release(self, _future: Future | None) -> None:
+        # Runs on the worker thread when the call really finishes (or when it is cancelled before starting).
+        with self._in_flight_lock:
+            self._in_flight -= 1
+
+    async def run(self, tool_name: str, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` on the pool and return its result within the tool's deadline.
+
+        Raises ``ToolBusyError`` when more than ``max_workers + max_pending``
+        calls are outstanding and ``ToolTimeoutError`` past the deadline.  A
+        timed-out call keeps its slot until its thread actually returns.
+        """
+        with self._in_flight_lock:
+            in_flight = self._in_flight
+            if in_flight < self.max_workers + self.max_pending:
+                self._in_flight += 1
+        if in_flight >= self.max_workers + self.max_pending:
+            self._counters["rejected_busy"] += 1
+            raise ToolBusyError(tool_name, f"{tool_name} rejected: {in_flight} tool calls queued")
+
+        timeout = self.timeout_for(tool_name)
+        self._counters["submitted"] += 1
+        try:
+            future = self._executor().submit(fn)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        try:
+            # Cancelling the awaiting future also cancels the pool future if it has not started.
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            logger.warning("Tool %s exceeded its %.1fs deadline", tool_name, timeout)
+            raise ToolTimeoutError(tool_name, timeout) from None
+        except asyncio.CancelledError:
+            self._counters["cancelled"] += 1
+            raise
+        except Exception:
+            self._counters["failed"] += 1
+            raise
+        self._counters["completed"] += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Drop queued calls and release the threads (app shutdown); the pool is recreated on demand."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of outstanding calls, limits, and outcome counters."""
+        return {
+            "in_flight": self._in_flight,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "timeouts_seconds": {"default": self.default_timeout_seconds, **self.timeouts},
+            **self._counters,
+        }
@@ -2,31 +2,125 @@
 
 from __future__ import annotations
 
+import importlib
 import json
-from typing import Any
+import os
+import threading
+from typing import Any, Callable
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
+from . import tool_cache
+from .tool_executor import ToolExecutionError, ToolExecutor, ToolTimeoutError
+
+
+def _tool_timeout(tool_name: str, default: float) -> float:
+    return float(os.getenv(f"RAG_TOOL_TIMEOUT_{tool_name.upper()}", default))
+
+
+# Blocking retrieval runs off the event loop, bounded and with per-tool deadlines.
+_tool_executor = ToolExecutor(
+    max_workers=int(os.getenv("RAG_TOOL_WORKERS", "4")),
+    max_pending=int(os.getenv("RAG_TOOL_MAX_PENDING", "16")),
+    default_timeout_seconds=float(os.getenv("RAG_TOOL_TIMEOUT_SECONDS", "30")),
+    timeouts={
+        "search_data": _tool_timeout("search_data", 20.0),
+        "search_assets": _tool_timeout("search_assets", 15.0),
+    },
+)
+
+
+def tool_executor_metrics() -> dict[str, Any]:
+    """Outstanding tool calls, deadlines, and timeout/cancellation counters."""
+    return _tool_executor.metrics()
+
+
+def shutdown_tool_executor() -> None:
+    """Drop queued tool calls and release worker threads (app shutdown)."""
+    _tool_executor.shutdown()
+
+
+async def run_tool_call(tool_name: str, fn: Callable[[], Any]) -> Any:
+    """Run blocking tool work on the shared executor under ``tool_name``'s deadline."""
+    return await _tool_executor.run(tool_name, fn)
+
+
+async def _cached_tool_call(tool_name: str, call: dict[str, Any], search: Callable[..., Any]) -> str:
+    """Return the JSON payload for ``search(**call)``, from the cache when possible."""
+    from src.rag.retrieval.query_engine import index_version
+
+    cache = tool_cache.shared_cache
+    key = cache.key(tool_name, call, index_version())
+    payload = cache.get(key)
+    if payload is None:
+        payload = await run_tool_call(
+            tool_name, lambda: json.dumps(search(**call), default=str)
+        )
+        cache.put(key, payload)
+    return payload
+
+
+def _tool_error(tool_name: str, exc: Exception) -> dict[str, Any]:
+    """Structured error payload so the agent can tell retryable failures apart."""
+    error: dict[str, Any] = {
+        "tool": tool_name,
+        "type": "error",
+        "retryable": False,
+        "message": f"{tool_name} error: {exc}",
+    }
+    if isinstance(exc, ToolExecutionError):
+        error["type"] = exc.kind
+        error["retryable"] = exc.retryable
+    if isinstance(exc, ToolTimeoutError):
+        error["timeout_seconds"] = exc.timeout_seconds
+    return {"content": [{"type": "text", "text": json.dumps({"error": error})}], "isError": True}
+
+
+_SEARCH_DATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "top_k": {"type": "integer"},
+        "category": {"type": "string"},
+        "date_from": {"type": "string", "description": "ISO date or month, e.g. 2025-03"},
+        "date_to": {"type": "string", "description": "ISO date or month, e.g. 2025-03-31"},
+        "channel": {"type": "string"},
+        "campaign": {"type": "string"},
+        "market": {"type": "string"},
+        "model": {"type": "string"},
+    },
+    "required": ["query"],
+}
+
 
 @tool(
     "search_data",
     "Search text data (CSVs, contracts, config) using hybrid retrieval (vector + BM25). "
-    "Use category filter to narrow results: digital_media, traditional_media, sales_pipeline, external.",
-    {"query": str, "top_k": int, "category": str},
+    "Use category filter to narrow results: digital_media, traditional_media, sales_pipeline, external. "
+    "Use date_from/date_to to restrict CSV rows to a period, and channel (tv, meta, google, ...), "
+    "campaign, market (GB, DE, FR) or model (e.g. DEEPAL S07) to restrict by entity.",
+    _SEARCH_DATA_SCHEMA,
 )
 async def search_data(args: dict[str, Any]) -> dict[str, Any]:
     """Invoke query_engine.search_text with hybrid retrieval."""
     try:
         from src.rag.retrieval.query_engine import search_text
 
-        results = search_text(
-            query=args["query"],
-            top_k=args.get("top_k", 5),
-            category=args.get("category") or None,
-        )
-        return {"content": [{"type": "text", "text": json.dumps(results, default=str)}]}
+        call = {
+            "query": args["query"],
+            "top_k": args.get("top_k", 5),
+            "category": args.get("category") or None,
+            "date_from": args.get("date_from") or None,
+            "date_to": args.get("date_to") or None,
+            "channel": args.get("channel") or None,
+            "campaign": args.get("campaign") or None,
+            "market": args.get("market") or None,
+            "model": args.get("model") or None,
+        }
+        text = await _cached_tool_call("search_data", call, search_text)
+        return {"content": [{"type": "text", "text": text}]}
     except Exception as exc:
-        return {"content": [{"type": "text", "text": f"search_data error: {exc}"}], "isError": True}
+        return _tool_error("search_data", exc)
 
 
 @tool(
@@ -40,17 +134,115 @@ async def search_assets(args: dict[str, Any]) -> dict[str, Any]:
     try:
         from src.rag.retrieval.query_engine import search_assets as _search_assets
 
-        results = _search_assets(
-            query=args["query"],
-            top_k=args.get("top_k", 5),
-            channel=args.get("channel") or None,
-        )
-        return {"content": [{"type": "text", "text": json.dumps(results, default=str)}]}
+        call = {
+            "query": args["query"],
+            "top_k": args.get("top_k", 5),
+            "channel": args.get("channel") or None,
+        }
+        text = await _cached_tool_call("search_assets", call, _search_assets)
+        return {"content": [{"type": "text", "text": text}]}
     except Exception as exc:
-        return {"content": [{"type": "text", "text": f"search_assets error: {exc}"}], "isError": True}
+        return _tool_error("search_assets", exc)
 
 
 rag_mcp_server = create_sdk_mcp_server(
     "rag-tools",
     tools=[search_data, search_assets],
 )
+
+
+# ---------------------------------------------------------------------------
+# MMM tools — one shared dataset and fitted model for every session
+# ---------------------------------------------------------------------------
+
+class _SharedMMM:
+    """model_ready.csv fitted once per file version, with each analysis computed once."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._fingerprint: tuple[int, int] | None = None
+        self._fitted: Any = None
+        self._results: dict[str, str] = {}
+
+    def result(self, name: str, run: Callable[[Any], dict[str, Any]]) -> str:
+        """Return the JSON output of ``run(fitted)``, refitting only when the CSV changed."""
+        from ..mmm_scripts.fitted_model import DATA_PATH, load_fitted_mmm
+
+        stat = DATA_PATH.stat()
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        # Tool calls run on executor threads; the lock keeps one fit per file version.
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._fitted = load_fitted_mmm(DATA_PATH)
+                self._fingerprint = fingerprint
+                self._results = {}
+            if name not in self._results:
+                self._results[name] = json.dumps(run(self._fitted), default=str)
+            return self._results[name]
+
+
+_shared_mmm = _SharedMMM()
+
+
+async def _mmm_tool_call(tool_name: str, script: str) -> dict[str, Any]:
+    """Run ``mmm_scripts.<script>.<tool_name>(fitted)`` on the tool executor."""
+
+    def _run(fitted: Any) -> dict[str, Any]:
+        # Imported on the worker thread: the first call loads pandas and scikit-learn.
+        module = importlib.import_module(f"..mmm_scripts.{script}", __package__)
+        return getattr(module, tool_name)(fitted)
+
+    try:
+        text = await run_tool_call(tool_name, lambda: _shared_mmm.result(tool_name, _run))
+        return {"content": [{"type": "text", "text": text}]}
+    except Exception as exc:
+        return _tool_error(tool_name, exc)
+
+
+@tool(
+    "run_regression",
+    "Ridge regression of weekly units_sold on channel adstock plus controls "
+    "(post-launch weeks): R², adjusted R², intercept, standardized coefficients.",
+    {},
+)
+async def run_regression(args: dict[str, Any]) -> dict[str, Any]:
+    """Regression summary from the shared fitted MMM."""
+    return await _mmm_tool_call("run_regression", "regression")
+
+
+@tool(
+    "run_roi_analysis",
+    "Per-channel ROI and marginal ROI: spend, incremental units and revenue attributed "
+    "by the MMM regression.",
+    {},
+)
+async def run_roi_analysis(args: dict[str, Any]) -> dict[str, Any]:
+    """Channel ROI from the shared fitted MMM."""
+    return await _mmm_tool_call("run_roi_analysis", "roi_analysis")
+
+
+@tool(
+    "run_budget_optimizer",
+    "Reallocate the total budget from low to high marginal-ROI channels (max ±30% per "
+    "channel): current vs optimal allocation and projected lift.",
+    {},
+)
+async def run_budget_optimizer(args: dict[str, Any]) -> dict[str, Any]:
+    """Budget reallocation from the shared fitted MMM."""
+    return await _mmm_tool_call("run_budget_optimizer", "budget_optimizer")
+
+
+@tool(
+    "run_adstock_curves",
+    "Adstock decay and saturation parameters per channel with raw vs adstocked spend totals.",
+    {},
+)
+async def run_adstock_curves(args: dict[str, Any]) -> dict[str, Any]:
+    """Adstock/saturation stats from the shared MMM dataset."""
+    return await _mmm_tool_call("run_adstock_curves", "adstock_curves")
+
+
+mmm_mcp_server = create_sdk_mcp_server(
+    "mmm-tools",
+    tools=[run_regression, run_roi_analysis, run_budget_optimizer, run_adstock_curves],
+)
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+from stat import S_ISREG
+import threading
+import time
 import warnings
+import zlib
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
 import yaml
 
+from .raw_schemas import TableSchema, raw_schema
+from .sketches import HyperLogLog, Reservoir, TDigest
+
+
+logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve()
 for parent in PROJECT_ROOT.parents:
@@ -20,6 +36,14 @@ for parent in PROJECT_ROOT.parents:
 
 RAW_DATA_DIR = PROJECT_ROOT / "data" / "raw"
 RULES_PATH = PROJECT_ROOT / "docs" / "prd" / "dashboard_checks.yml"
+PROFILE_CACHE_PATH = PROJECT_ROOT / "data" / "processed" / "raw_profile_cache.json"
+
+
+# Threads profiling raw files in parallel (pandas parsing releases the GIL).
+_PROFILE_WORKERS = int(os.getenv("RAW_PROFILE_WORKERS", str(min(8, os.cpu_count() or 1))))
+# CSVs at least this large are profiled in streaming mode with approximate sketches.
+_STREAM_PROFILE_BYTES = int(os.getenv("RAW_STREAM_PROFILE_BYTES", str(64 * 1024 * 1024)))
+_STREAM_CHUNK_ROWS = int(os.getenv("RAW_STREAM_CHUNK_ROWS", "100000"))
 
 
 DATE_CANDIDATE_COLUMNS = {
@@ -63,12 +87,25 @@ def _to_python_value(value: Any) -> Any:
     return value
 
 
+def _first_non_null(values: pd.Series, n: int) -> pd.Series:
+    """First ``n`` non-null values without a full-column ``dropna`` when a prefix suffices."""
+    head = values.head(n * 4).dropna()
+    if len(head) >= n or len(values) <= n * 4:
+        return head.head(n)
+    return values.dropna().head(n)
+
+
 def _looks_like_date_series(values: pd.Series) -> bool:
-    lowered = values.name.lower() if values.name else ""
+    lowered = str(values.name).lower() if values.name is not None else ""
     if lowered in DATE_CANDIDATE_COLUMNS:
         return True
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return True
+    # Numbers and booleans are never sniffed as dates; only a known date name opts them in.
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+        return False
 
-    sample = values.dropna().head(30).astype(str).tolist()
+    sample = _first_non_null(values, 30).astype(str).tolist()
     if not sample:
         return False
 
@@ -80,20 +117,29 @@ def _looks_like_date_series(values: pd.Series) -> bool:
     return matched >= max(1, int(len(sample) * 0.5))
 
 
-def _parse_dates(values: pd.Series) -> Optional[pd.Series]:
+def _date_stats(values: pd.Series) -> Optional[Tuple[pd.Timestamp, pd.Timestamp, int]]:
+    """(min, max, rows that parse) of the column's dates, or None when nothing parses.
+
+    Each distinct value is parsed once, so a 10k-row column with 365 dates
+    costs 365 parses.  ISO dates/months use a fixed format; anything else is
+    only fully parsed when a 20-value sample mostly parses.
+    """
     if values.empty:
         return None
+    if pd.api.types.is_datetime64_any_dtype(values):
+        present = values.dropna()
+        return (present.min(), present.max(), int(len(present))) if not present.empty else None
 
-    values_as_str = values.astype(str)
-
-    sample = values_as_str.dropna().astype(str).head(20)
-    date_pattern = sample.str.fullmatch(r"\d{4}-\d{2}-\d{2}")
-    month_pattern = sample.str.fullmatch(r"\d{4}-\d{2}")
+    counts = values.value_counts(dropna=True, sort=False)
+    if counts.empty:
+        return None
+    uniques = counts.index
 
-    if date_pattern.mean() >= 0.8:
-        date_series = pd.to_datetime(values, errors="coerce", format="%Y-%m-%d")
-    elif month_pattern.mean() >= 0.8:
-        date_series = pd.to_datetime(values, errors="coerce", format="%Y-%m")
+    sample = _first_non_null(values, 20).astype(str)
+    if sample.str.fullmatch(r"\d{4}-\d{2}-\d{2}").mean() >= 0.8:
+        parsed = pd.to_datetime(uniques, errors="coerce", format="%Y-%m-%d")
+    elif sample.str.fullmatch(r"\d{4}-\d{2}").mean() >= 0.8:
+        parsed = pd.to_datetime(uniques, errors="coerce", format="%Y-%m")
     else:
         with warnings.catch_warnings():
             warnings.filterwarnings(
@@ -101,87 +147,150 @@ def _parse_dates(values: pd.Series) -> Optional[pd.Series]:
                 message="Could not infer format.*",
                 category=UserWarning,
             )
-            date_series = pd.to_datetime(values, errors="coerce")
+            # Free-form parsing is slow; skip columns (IDs, names) whose sample doesn't parse.
+            if pd.to_datetime(sample, errors="coerce").notna().mean() < 0.5:
+                return None
+            parsed = pd.to_datetime(uniques, errors="coerce")
+
+    parsed = pd.DatetimeIndex(parsed)
+    valid = ~parsed.isna()
+    if not valid.any():
+        return None
+    return parsed[valid].min(), parsed[valid].max(), int(counts.to_numpy()[valid].sum())
+
 
-    if date_series.notna().mean() < 0.5:
+def _date_bounds(values: pd.Series) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """(min, max) of the column's dates, or None when under half its rows parse as dates."""
+    stats = _date_stats(values)
+    if stats is None or stats[2] < 0.5 * len(values):
         return None
-    return date_series
+    return stats[0], stats[1]
+
+
+def _as_text(values: pd.Series, date_format: Optional[str] = None) -> pd.Series:
+    if date_format and pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime(date_format)
+    return values.astype(str)
+
+
+def _sample_values(column: pd.Series, date_format: Optional[str] = None) -> List[str]:
+    """First three distinct non-null values (as text, clipped) for the UI."""
+    head = column.head(256)
+    sample = _as_text(head.dropna(), date_format).str.slice(0, 120).drop_duplicates().head(3).tolist()
+    if len(sample) < 3 and len(column) > len(head):
+        sample = _as_text(column.dropna(), date_format).str.slice(0, 120).drop_duplicates().head(3).tolist()
+    return sample
+
+
+def _column_profiles(df: pd.DataFrame, schema: Optional[TableSchema] = None) -> List[Dict[str, Any]]:
+    """Profile every column of ``df`` with frame-wide vectorized reductions.
+
+    Null counts, distinct counts, and numeric min/max are each one reduction
+    over the whole frame.  With a declared ``schema`` (and a frame read with
+    it) only the declared date columns are date columns; otherwise dates are
+    detected from dtype hints plus a small sample.
+    """
+    total = int(len(df))
+    null_counts = df.isna().sum()
+    distinct_counts = df.nunique(dropna=True)
+    numeric = df.select_dtypes(include=["number", "bool"])
+    numeric_min = numeric.min() if not numeric.empty else pd.Series(dtype=object)
+    numeric_max = numeric.max() if not numeric.empty else pd.Series(dtype=object)
+
+    profiles: List[Dict[str, Any]] = []
+    for position, col_name in enumerate(df.columns):
+        column = df.iloc[:, position]
+        null_count = int(null_counts.iloc[position])
+        date_format = schema.dates.get(col_name) if schema is not None else None
+        profile: Dict[str, Any] = {
+            "name": col_name,
+            "dtype": str(column.dtype),
+            "null_count": null_count,
+            "null_ratio": round(null_count / total if total else 0.0, 6),
+            "distinct_count": int(distinct_counts.iloc[position]),
+            "sample_values": _sample_values(column, date_format),
+        }
 
+        if col_name in numeric_min.index and not pd.isna(numeric_min[col_name]):
+            profile["numeric_min"] = _to_python_value(numeric_min[col_name])
+            profile["numeric_max"] = _to_python_value(numeric_max[col_name])
 
-def _column_profile(column: pd.Series) -> Dict[str, Any]:
-    col_name = column.name
-    null_count = int(column.isna().sum())
-    total = int(len(column))
-    null_ratio = null_count / total if total else 0.0
-    distinct_count = int(column.nunique(dropna=True))
-
-    profile: Dict[str, Any] = {
-        "name": col_name,
-        "dtype": str(column.dtype),
-        "null_count": null_count,
-        "null_ratio": round(null_ratio, 6),
-        "distinct_count": distinct_count,
-    }
+        is_date = date_format is not None if schema is not None else _looks_like_date_series(column)
+        if is_date:
+            bounds = _date_bounds(column)
+            if bounds is not None:
+                profile["date_min"] = _to_python_value(bounds[0])
+                profile["date_max"] = _to_python_value(bounds[1])
 
-    # Sample values for quick inspection in the UI.
-    sample_values = (
-        column.dropna()
-        .astype(str)
-        .str.slice(0, 120)
-        .drop_duplicates()
-        .head(3)
-        .tolist()
-    )
-    profile["sample_values"] = sample_values
-
-    if pd.api.types.is_numeric_dtype(column):
-        numeric = pd.to_numeric(column, errors="coerce").dropna()
-        if not numeric.empty:
-            profile["numeric_min"] = _to_python_value(numeric.min())
-            profile["numeric_max"] = _to_python_value(numeric.max())
-
-    if _looks_like_date_series(column):
-        parsed = _parse_dates(column)
-        if parsed is not None:
-            parsed = parsed.dropna()
-            if not parsed.empty:
-                profile["date_min"] = _to_python_value(parsed.min())
-                profile["date_max"] = _to_python_value(parsed.max())
+        profiles.append(profile)
+    return profiles
 
-    return profile
 
+def _column_profile(column: pd.Series) -> Dict[str, Any]:
+    return _column_profiles(column.to_frame())[0]
 
-def _build_file_profile(path: Path) -> Dict[str, Any]:
-    """Build profile for a raw data file."""
-    is_contract = path.suffix.lower() != ".csv"
-    profile: Dict[str, Any] = {
+
+def _base_file_profile(path: Path, stat: os.stat_result) -> Dict[str, Any]:
+    return {
         "file_name": str(path.relative_to(RAW_DATA_DIR)),
         "path": str(path),
-        "file_size_bytes": path.stat().st_size,
-        "last_modified": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
-        "is_csv": not is_contract,
+        "file_size_bytes": stat.st_size,
+        "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "is_csv": path.suffix.lower() == ".csv",
     }
 
-    if is_contract:
-        return profile
 
+def _raw_schema(path: Path) -> Optional[TableSchema]:
+    try:
+        return raw_schema(str(path.relative_to(RAW_DATA_DIR)))
+    except ValueError:
+        return None
+
+
+def _read_typed_csv(path: Path) -> Tuple[pd.DataFrame, Optional[TableSchema]]:
+    """Read with the file's declared schema; returns the schema actually applied.
+
+    A file that drifted from its declaration is read again with inferred
+    types (and profiled with date sniffing) rather than failing the scan.
+    """
+    schema = _raw_schema(path)
     try:
-        df = pd.read_csv(path)
+        if schema is not None:
+            try:
+                return schema.read_csv(path), schema
+            except (ValueError, TypeError) as exc:
+                logger.warning("%s does not match its declared schema (%s); inferring types", path.name, exc)
+        return pd.read_csv(path), None
     except Exception as exc:
         raise ProfileError(f"failed to read {path.name}: {exc}") from exc
 
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    return _read_typed_csv(path)[0]
+
+
+def _profile_frame(
+    profile: Dict[str, Any], df: pd.DataFrame, schema: Optional[TableSchema] = None
+) -> Dict[str, Any]:
+    """Add row/column counts, column profiles, and date coverage for ``df`` to ``profile``."""
     profile.update({
         "rows": int(len(df)),
         "columns": int(len(df.columns)),
         "column_names": df.columns.tolist(),
     })
 
-    column_profiles = [_column_profile(df[col]) for col in df.columns]
+    column_profiles = _column_profiles(df, schema)
+    profile["profile_mode"] = "exact"
+    profile["approximate_stats"] = []
     profile["column_profiles"] = column_profiles
     profile["overall_missing_ratio"] = (
-        round(df.isna().sum().sum() / max(1, df.size), 6)
+        round(sum(col["null_count"] for col in column_profiles) / max(1, df.size), 6)
     )
 
+    return _add_date_summary(profile, column_profiles)
+
+
+def _add_date_summary(profile: Dict[str, Any], column_profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
     date_columns = {
         col["name"]: {"min": col.get("date_min"), "max": col.get("date_max")} for col in column_profiles
         if "date_min" in col and "date_max" in col
@@ -202,46 +311,459 @@ def _build_file_profile(path: Path) -> Dict[str, Any]:
     return profile
 
 
-def scan_raw_directory() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, pd.DataFrame]]:
-    """Return file profiles and loaded CSV dataframes for raw inputs."""
-    profiles: Dict[str, Dict[str, Any]] = {}
-    dataframes: Dict[str, pd.DataFrame] = {}
+# ---------------------------------------------------------------------------
+# Streaming (approximate) profiler for large files
+# ---------------------------------------------------------------------------
+
+_STREAM_QUANTILES = {"p05": 0.05, "p25": 0.25, "p50": 0.5, "p75": 0.75, "p95": 0.95}
+_RESERVOIR_SIZE = 32
+
+
+def _merge_dtype(current: Any, chunk: Any) -> Any:
+    if current is None or current == chunk:
+        return chunk
+    if isinstance(current, pd.CategoricalDtype) and isinstance(chunk, pd.CategoricalDtype):
+        # Each chunk sees its own categories; the column is still categorical.
+        return pd.CategoricalDtype()
+    numeric = pd.api.types.is_numeric_dtype
+    if numeric(current) and numeric(chunk) and not (
+        pd.api.types.is_bool_dtype(current) or pd.api.types.is_bool_dtype(chunk)
+    ):
+        return np.result_type(current, chunk)
+    return np.dtype(object)
+
+
+class _StreamingColumn:
+    """Bounded-memory accumulator for one column across CSV chunks."""
+
+    def __init__(self, name: str, schema: Optional[TableSchema] = None) -> None:
+        self.name = name
+        self.date_format = schema.dates.get(name) if schema is not None else None
+        self.dtype: Any = None
+        self.rows = 0
+        self.nulls = 0
+        self.distinct = HyperLogLog()
+        self.digest = TDigest()
+        self.reservoir = Reservoir(_RESERVOIR_SIZE, seed=zlib.crc32(str(name).encode("utf-8")))
+        self.all_numeric = True
+        self.numeric_min: Any = None
+        self.numeric_max: Any = None
+        # A declared schema settles which columns hold dates; otherwise the first chunk decides.
+        self.date_candidate: Optional[bool] = (self.date_format is not None) if schema is not None else None
+        self.date_min: Optional[pd.Timestamp] = None
+        self.date_max: Optional[pd.Timestamp] = None
+        self.date_rows = 0
+
+    def add(self, column: pd.Series, null_count: int) -> None:
+        self.dtype = _merge_dtype(self.dtype, column.dtype)
+        self.rows += int(len(column))
+        self.nulls += null_count
+        self.distinct.add(column)
+        self.reservoir.add(column)
+
+        if null_count < len(column):
+            if pd.api.types.is_numeric_dtype(column):
+                low, high = column.min(), column.max()
+                self.numeric_min = low if self.numeric_min is None else min(self.numeric_min, low)
+                self.numeric_max = high if self.numeric_max is None else max(self.numeric_max, high)
+                if not pd.api.types.is_bool_dtype(column):
+                    self.digest.add(column.to_numpy(dtype=np.float64, na_value=np.nan))
+            else:
+                self.all_numeric = False
+
+        if self.date_candidate is None and null_count < len(column):
+            # Decided once, from the first chunk that has values.
+            self.date_candidate = _looks_like_date_series(column)
+        if self.date_candidate:
+            stats = _date_stats(column)
+            if stats is not None:
+                low, high, parsed_rows = stats
+                self.date_min = low if self.date_min is None else min(self.date_min, low)
+                self.date_max = high if self.date_max is None else max(self.date_max, high)
+                self.date_rows += parsed_rows
+
+    @property
+    def _sample_dtype(self) -> Any:
+        return self.dtype if self.date_format and pd.api.types.is_datetime64_any_dtype(self.dtype) else object
+
+    def profile(self) -> Dict[str, Any]:
+        approximate = ["distinct_count", "sample_values"]
+        profile: Dict[str, Any] = {
+            "name": self.name,
+            "dtype": str(self.dtype),
+            "null_count": self.nulls,
+            "null_ratio": round(self.nulls / self.rows if self.rows else 0.0, 6),
+            "distinct_count": min(self.distinct.count(), self.rows - self.nulls),
+            "sample_values": (
+                _as_text(pd.Series(self.reservoir.values, dtype=self._sample_dtype), self.date_format)
+                .str.slice(0, 120).drop_duplicates().head(3).tolist()
+            ),
+        }
+        if self.all_numeric and self.numeric_min is not None:
+            profile["numeric_min"] = _to_python_value(self.numeric_min)
+            profile["numeric_max"] = _to_python_value(self.numeric_max)
+            if self.digest.count:
+                profile["quantiles"] = {
+                    label: self.digest.quantile(q) for label, q in _STREAM_QUANTILES.items()
+                }
+                approximate.append("quantiles")
+        if self.date_min is not None and self.date_rows >= 0.5 * self.rows:
+            profile["date_min"] = _to_python_value(self.date_min)
+            profile["date_max"] = _to_python_value(self.date_max)
+        profile["approximate_stats"] = approximate
+        return profile
+
+
+def _stream_file_profile(profile: Dict[str, Any], path: Path) -> Dict[str, Any]:
+    """Profile a CSV chunk by chunk with fixed-size sketches (memory independent of rows).
+
+    Row, null, min/max and date-range figures are exact; distinct counts
+    (HyperLogLog), sample values (reservoir), and quantiles (t-digest) are
+    approximate and listed under ``approximate_stats``.
+    """
+    schema = _raw_schema(path)
+    try:
+        if schema is not None:
+            try:
+                return _stream_columns(profile, schema.iter_csv(path, _STREAM_CHUNK_ROWS), schema)
+            except (ValueError, TypeError) as exc:
+                logger.warning("%s does not match its declared schema (%s); inferring types", path.name, exc)
+        with pd.read_csv(path, chunksize=_STREAM_CHUNK_ROWS) as reader:
+            return _stream_columns(profile, reader, None)
+    except Exception as exc:
+        raise ProfileError(f"failed to read {path.name}: {exc}") from exc
+
+
+def _stream_columns(
+    profile: Dict[str, Any], chunks: Iterable[pd.DataFrame], schema: Optional[TableSchema]
+) -> Dict[str, Any]:
+    columns: Dict[str, _StreamingColumn] = {}
+    column_names: List[str] = []
+    rows = 0
+    for chunk in chunks:
+        if not column_names:
+            column_names = chunk.columns.tolist()
+            columns = {name: _StreamingColumn(name, schema) for name in column_names}
+        rows += int(len(chunk))
+        null_counts = chunk.isna().sum()
+        for position, name in enumerate(column_names):
+            columns[name].add(chunk.iloc[:, position], int(null_counts.iloc[position]))
+
+    column_profiles = [columns[name].profile() for name in column_names]
+    total_nulls = sum(col["null_count"] for col in column_profiles)
+    profile.update({
+        "rows": rows,
+        "columns": len(column_names),
+        "column_names": column_names,
+        "profile_mode": "streaming",
+        "approximate_stats": sorted({stat for col in column_profiles for stat in col["approximate_stats"]}),
+        "column_profiles": column_profiles,
+        "overall_missing_ratio": round(total_nulls / max(1, rows * len(column_names)), 6),
+    })
+    return _add_date_summary(profile, column_profiles)
+
+
+def _csv_column_chunks(path: Path, column: str, schema: Optional[TableSchema]) -> Iterator[pd.Series]:
+    if schema is not None:
+        for chunk in schema.iter_csv(path, _STREAM_CHUNK_ROWS, usecols=[column]):
+            yield chunk[column]
+        return
+    with pd.read_csv(path, chunksize=_STREAM_CHUNK_ROWS, usecols=[column]) as reader:
+        for chunk in reader:
+            yield chunk[column]
 
-    if not RAW_DATA_DIR.exists():
-        return profiles, dataframes
 
+def _fold_csv_column(
+    path: Path, column: str, build: Callable[[pd.Series], Any], merge: Callable[[Any, Any], Any]
+) -> Any:
+    """Reduce one CSV column chunk by chunk: ``build`` each chunk, ``merge`` the partial results.
+
+    Only ``column`` is parsed, ``_STREAM_CHUNK_ROWS`` rows at a time.  A file
+    that drifted from its declared schema is folded again with inferred types.
+    """
+    schema = _raw_schema(path)
+    try:
+        if schema is not None:
+            try:
+                return _fold_chunks(_csv_column_chunks(path, column, schema), build, merge)
+            except (ValueError, TypeError) as exc:
+                logger.warning("%s does not match its declared schema (%s); inferring types", path.name, exc)
+        return _fold_chunks(_csv_column_chunks(path, column, None), build, merge)
+    except Exception as exc:
+        raise ProfileError(f"failed to read {path.name}: {exc}") from exc
+
+
+def _fold_chunks(
+    chunks: Iterable[pd.Series], build: Callable[[pd.Series], Any], merge: Callable[[Any, Any], Any]
+) -> Any:
+    result: Any = None
+    for chunk in chunks:
+        part = build(chunk)
+        result = part if result is None else merge(result, part)
+    return build(pd.Series([], dtype=object)) if result is None else result
+
+
+def _csv_columns(path: Path) -> List[str]:
+    try:
+        return pd.read_csv(path, nrows=0).columns.tolist()
+    except Exception as exc:
+        raise ProfileError(f"failed to read {path.name}: {exc}") from exc
+
+
+def _build_file_profile(path: Path) -> Dict[str, Any]:
+    """Build profile for a raw data file."""
+    stat = path.stat()
+    profile = _base_file_profile(path, stat)
+    if not profile["is_csv"]:
+        return profile
+    if stat.st_size >= _STREAM_PROFILE_BYTES:
+        return _stream_file_profile(profile, path)
+    return _profile_frame(profile, *_read_typed_csv(path))
+
+
+def _scan_file(path: Path, stat: os.stat_result) -> Tuple[Dict[str, Any], Optional[pd.DataFrame]]:
+    """Profile one file from a single read; the parsed frame is returned for rule checks.
+
+    Files of ``_STREAM_PROFILE_BYTES`` or more are profiled in streaming mode
+    and return no frame, so memory stays bounded by the chunk size.
+    """
+    profile = _base_file_profile(path, stat)
+    if not profile["is_csv"]:
+        return profile, None
+    try:
+        if stat.st_size >= _STREAM_PROFILE_BYTES:
+            return _stream_file_profile(profile, path), None
+        df, schema = _read_typed_csv(path)
+    except ProfileError:
+        profile.update({
+            "rows": None,
+            "columns": None,
+            "column_names": [],
+            "column_profiles": [],
+            "overall_missing_ratio": 1.0,
+            "error": "unable to parse",
+        })
+        return profile, None
+    return _profile_frame(profile, df, schema), df
+
+
+def raw_files() -> List[Tuple[Path, os.stat_result]]:
+    """Files under data/raw (minus .gitkeep) with the one ``stat`` each scan needs."""
+    files: List[Tuple[Path, os.stat_result]] = []
     for path in sorted(RAW_DATA_DIR.glob("**/*")):
-        if not path.is_file():
-            continue
         if path.name == ".gitkeep":
             continue
-
-        relative_name = str(path.relative_to(RAW_DATA_DIR))
         try:
-            profile = _build_file_profile(path)
-        except ProfileError:
-            profile = {
-                "file_name": relative_name,
-                "path": str(path),
-                "file_size_bytes": path.stat().st_size,
-                "last_modified": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
-                "is_csv": path.suffix.lower() == ".csv",
-                "rows": None,
-                "columns": None,
-                "column_names": [],
-                "column_profiles": [],
-                "overall_missing_ratio": 1.0,
-                "error": "unable to parse",
-            }
+            stat = path.stat()
+        except OSError:
+            continue
+        if S_ISREG(stat.st_mode):
+            files.append((path, stat))
+    return files
+
+
+# ---------------------------------------------------------------------------
+# Persistent per-file profile cache
+# ---------------------------------------------------------------------------
+
+# Bump when profiling logic changes so stale cached profiles are discarded.
+_PROFILE_CACHE_VERSION = 4
+# The watcher and the overview refresh thread can both save the cache.
+_profile_cache_save_lock = threading.Lock()
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def _content_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _ProfileCache:
+    """Profiles of unchanged files, persisted as JSON under data/processed/.
+
+    An entry is reused when size and mtime match.  When only the mtime moved
+    (a touch or an identical rewrite) the content hash decides, so a file is
+    re-profiled only when its bytes actually changed.
+    """
 
-        profiles[relative_name] = profile
-        if path.suffix.lower() == ".csv":
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = path
+        self.root = str(root)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("version") == _PROFILE_CACHE_VERSION and payload.get("root") == self.root:
+            self.entries = payload.get("entries") or {}
+
+    def lookup(self, name: str, path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(name)
+        if entry is None or entry["size"] != stat.st_size:
+            return None
+        if entry["mtime_ns"] != stat.st_mtime_ns:
+            try:
+                if entry["hash"] != _content_hash(path):
+                    return None
+            except OSError:
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self.dirty = True
+        return entry
+
+    def store(self, name: str, path: Path, stat: os.stat_result, profile: Dict[str, Any], readable: bool) -> None:
+        try:
+            content_hash = _content_hash(path)
+        except OSError:
+            return
+        self.entries[name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": content_hash,
+            "readable": readable,
+            "profile": _safe_json_value(profile),
+        }
+        self.dirty = True
+
+    def retain(self, names: Iterable[str]) -> None:
+        keep = set(names)
+        for name in [name for name in self.entries if name not in keep]:
+            del self.entries[name]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"version": _PROFILE_CACHE_VERSION, "root": self.root, "entries": self.entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with _profile_cache_save_lock:
+                tmp.write_text(json.dumps(payload), encoding="utf-8")
+                os.replace(tmp, self.path)
+        except OSError:
+            logger.warning("Could not write profile cache %s", self.path, exc_info=True)
+            return
+        self.dirty = False
+
+
+class _LazyFrames(Mapping):
+    """CSV frames for rule checks: freshly parsed ones up front, cached files read on first use.
+
+    Streamed (large) files are never held in memory: rules fold their columns
+    chunk by chunk (see ``_RuleContext``), and indexing one reads it afresh
+    without caching the frame.
+    """
+
+    def __init__(
+        self,
+        loaded: Dict[str, pd.DataFrame],
+        deferred: Dict[str, Path],
+        streamed: Optional[Dict[str, Path]] = None,
+    ) -> None:
+        self._loaded = loaded
+        self._deferred = deferred
+        self._streamed = streamed if streamed is not None else {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+            streamed = self._streamed.get(name)
+            path = streamed if streamed is not None else self._deferred.pop(name)
             try:
-                dataframes[relative_name] = pd.read_csv(path)
-            except Exception:
-                pass
+                df = _read_csv(path)
+            except ProfileError as exc:
+                raise KeyError(name) from exc
+            if streamed is None:
+                self._loaded[name] = df
+            return df
+
+    def __iter__(self):
+        return iter(sorted([*self._loaded, *self._deferred, *self._streamed]))
+
+    def __len__(self) -> int:
+        return len(self._loaded) + len(self._deferred) + len(self._streamed)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loaded or name in self._deferred or name in self._streamed
+
+    def streamed_path(self, name: str) -> Optional[Path]:
+        """The path of a streamed file (rules read it chunk by chunk), else None."""
+        return self._streamed.get(name)
+
+    def replace(self, name: str, df: Optional[pd.DataFrame], path: Optional[Path], streamed: bool = False) -> None:
+        """Swap in a re-scanned file: its fresh frame, a path to read later (or stream), or neither."""
+        with self._lock:
+            self._loaded.pop(name, None)
+            self._deferred.pop(name, None)
+            self._streamed.pop(name, None)
+            if df is not None:
+                self._loaded[name] = df
+            elif path is not None:
+                (self._streamed if streamed else self._deferred)[name] = path
+
+    def discard(self, name: str) -> None:
+        self.replace(name, None, None)
+
+
+def scan_raw_directory() -> Tuple[Dict[str, Dict[str, Any]], Mapping[str, pd.DataFrame]]:
+    """Return file profiles and CSV dataframes for raw inputs.
+
+    Profiles of files unchanged since the last scan come from the persistent
+    profile cache; only new or modified files are read and profiled.  Each of
+    those is read once, and the frame is shared between profiling and rule
+    evaluation.  Files are profiled in parallel on ``_PROFILE_WORKERS`` threads.
+    Frames of cached files are read lazily, the first time a rule needs one;
+    streamed (large) files are never loaded whole.
+    """
+    profiles: Dict[str, Dict[str, Any]] = {}
+    loaded: Dict[str, pd.DataFrame] = {}
+    deferred: Dict[str, Path] = {}
+    streamed: Dict[str, Path] = {}
 
-    return profiles, dataframes
+    if not RAW_DATA_DIR.exists():
+        return profiles, _LazyFrames(loaded, deferred, streamed)
+
+    cache = _ProfileCache(PROFILE_CACHE_PATH, RAW_DATA_DIR)
+    files = raw_files()
+    stale: List[Tuple[Path, os.stat_result]] = []
+    for path, stat in files:
+        name = str(path.relative_to(RAW_DATA_DIR))
+        entry = cache.lookup(name, path, stat)
+        if entry is None:
+            stale.append((path, stat))
+            continue
+        profile = dict(entry["profile"])
+        profile.update(_base_file_profile(path, stat))
+        profiles[name] = profile
+        if profile["is_csv"] and entry["readable"]:
+            (streamed if profile.get("profile_mode") == "streaming" else deferred)[name] = path
+
+    workers = max(1, min(_PROFILE_WORKERS, len(stale)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="raw-profile") as pool:
+        scanned = list(pool.map(lambda item: _scan_file(*item), stale))
+
+    for (path, stat), (profile, df) in zip(stale, scanned):
+        name = profile["file_name"]
+        profiles[name] = profile
+        readable = profile["is_csv"] and "error" not in profile
+        if df is not None:
+            loaded[name] = df
+        elif readable:
+            # Streamed (large) files: rules fold their columns chunk by chunk.
+            streamed[name] = path
+        cache.store(name, path, stat, profile, readable=readable)
+
+    cache.retain(profiles)
+    cache.save()
+    return dict(sorted(profiles.items())), _LazyFrames(loaded, deferred, streamed)
 
 
 def _load_rules() -> Dict[str, Any]:
@@ -302,10 +824,114 @@ def _parse_rule_date(value: Any) -> pd.Timestamp:
     return parsed
 
 
+def _merge_counts(left: pd.Series, right: pd.Series) -> pd.Series:
+    return pd.concat([left, right]).groupby(level=0, sort=False).sum()
+
+
+def _merge_bounds(
+    left: Optional[Tuple[float, float]], right: Optional[Tuple[float, float]]
+) -> Optional[Tuple[float, float]]:
+    if left is None or right is None:
+        return left if right is None else right
+    return min(left[0], right[0]), max(left[1], right[1])
+
+
+def _numeric_bounds(series: pd.Series) -> Optional[Tuple[float, float]]:
+    values = pd.to_numeric(series, errors="coerce").dropna()
+    return None if values.empty else (float(values.min()), float(values.max()))
+
+
+class _RuleContext(Mapping):
+    """Frames plus column aggregates shared by every check in one evaluation.
+
+    Checks that touch the same column reuse one row/null count, one
+    ``astype(str)`` value count, one pair of numeric bounds, or one key index
+    instead of rebuilding it per rule.  Every aggregate merges across chunks,
+    so columns of streamed files are folded chunk by chunk instead of loading
+    the file.
+    """
+
+    def __init__(self, dataframes: Mapping[str, pd.DataFrame]) -> None:
+        self._frames = dataframes
+        self._memo: Dict[Tuple[str, str, str], Any] = {}
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        return self._frames[name]
+
+    def __iter__(self):
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _streamed_path(self, file_name: str) -> Optional[Path]:
+        if isinstance(self._frames, _LazyFrames):
+            return self._frames.streamed_path(file_name)
+        return None
+
+    def _cached(
+        self,
+        kind: str,
+        file_name: str,
+        column: str,
+        build: Callable[[pd.Series], Any],
+        merge: Callable[[Any, Any], Any],
+    ) -> Any:
+        key = (kind, file_name, column)
+        if key not in self._memo:
+            path = self._streamed_path(file_name)
+            if path is not None:
+                self._memo[key] = _fold_csv_column(path, column, build, merge)
+            else:
+                self._memo[key] = build(self._frames[file_name][column])
+        return self._memo[key]
+
+    def columns(self, file_name: str) -> Optional[List[str]]:
+        """Column names of the file, or None when it is missing or unreadable."""
+        key = ("columns", file_name, "")
+        if key not in self._memo:
+            path = self._streamed_path(file_name)
+            if path is not None:
+                try:
+                    self._memo[key] = _csv_columns(path)
+                except ProfileError:
+                    self._memo[key] = None
+            else:
+                df = self._frames.get(file_name)
+                self._memo[key] = None if df is None else df.columns.tolist()
+        return self._memo[key]
+
+    def row_and_null_counts(self, file_name: str, column: str) -> Tuple[int, int]:
+        return self._cached(
+            "counts", file_name, column,
+            lambda s: (int(len(s)), int(s.isna().sum())),
+            lambda a, b: (a[0] + b[0], a[1] + b[1]),
+        )
+
+    def text_value_counts(self, file_name: str, column: str) -> pd.Series:
+        return self._cached(
+            "text_counts", file_name, column, lambda s: s.astype(str).value_counts(), _merge_counts
+        )
+
+    def numeric_bounds(self, file_name: str, column: str) -> Optional[Tuple[float, float]]:
+        return self._cached("numeric", file_name, column, _numeric_bounds, _merge_bounds)
+
+    def key_index(self, file_name: str, column: str) -> pd.Index:
+        return self._cached(
+            "keys", file_name, column,
+            lambda s: pd.Index(s.dropna().astype(str).unique()),
+            lambda a, b: a.append(b).unique(),
+        )
+
+
+def _rule_context(dataframes: Mapping[str, pd.DataFrame]) -> _RuleContext:
+    return dataframes if isinstance(dataframes, _RuleContext) else _RuleContext(dataframes)
+
+
 def _check_exists(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     passed = file_profile is not None
     return {
@@ -319,7 +945,7 @@ def _check_exists(
 def _check_row_count(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     if file_profile is None or file_profile.get("rows") is None:
         return {"status": "fail", "observed": None, "expected": f"{rule.get('min', 0)}-{rule.get('max', 0)}", "details": "file missing or unreadable"}
@@ -338,7 +964,7 @@ def _check_row_count(
 def _check_required_columns(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     if file_profile is None:
         return {"status": "fail", "observed": None, "expected": rule.get("columns", []), "details": "file missing"}
@@ -358,7 +984,7 @@ def _check_required_columns(
 def _check_required_values(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     file_name = rule.get("file")
     column = rule.get("column")
@@ -368,18 +994,19 @@ def _check_required_values(
     if file_profile is None or not file_profile.get("is_csv", False):
         return {"status": "fail", "observed": None, "expected": values, "details": "file missing or not CSV"}
 
-    df = dataframes.get(file_name or "")
-    if df is None or column not in df.columns:
+    context = _rule_context(dataframes)
+    columns = context.columns(file_name or "")
+    if columns is None or column not in columns:
         return {"status": "fail", "observed": None, "expected": values, "details": f"column {column} missing"}
 
-    total = len(df)
+    total, _ = context.row_and_null_counts(file_name, column)
     if total == 0:
         return {"status": "warn", "observed": 0, "expected": values, "details": "empty table"}
 
-    series = df[column].astype(str)
+    counts = context.text_value_counts(file_name, column)
     missing_map = {}
     for value in values:
-        ratio = float((series == str(value)).mean())
+        ratio = float(counts.get(str(value), 0) / total)
         missing_map[value] = ratio
 
     missing = [value for value, ratio in missing_map.items() if ratio == 0.0]
@@ -406,7 +1033,7 @@ def _check_required_values(
 def _check_date_range(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     file_name = rule.get("file")
     column = rule.get("column")
@@ -453,7 +1080,7 @@ def _check_date_range(
 def _check_numeric_range(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     file_name = rule.get("file")
     column = rule.get("column")
@@ -463,16 +1090,16 @@ def _check_numeric_range(
     if file_profile is None or not file_profile.get("is_csv", False):
         return {"status": "fail", "observed": None, "expected": {"min": expected_min, "max": expected_max}, "details": "file missing or non-CSV"}
 
-    df = dataframes.get(file_name or "")
-    if df is None or column not in df.columns:
+    context = _rule_context(dataframes)
+    columns = context.columns(file_name or "")
+    if columns is None or column not in columns:
         return {"status": "fail", "observed": None, "expected": None, "details": f"column {column} missing"}
 
-    series = pd.to_numeric(df[column], errors="coerce").dropna()
-    if series.empty:
+    bounds = context.numeric_bounds(file_name, column)
+    if bounds is None:
         return {"status": "fail", "observed": None, "expected": {"min": expected_min, "max": expected_max}, "details": f"no numeric values in {column}"}
 
-    observed_min = float(series.min())
-    observed_max = float(series.max())
+    observed_min, observed_max = bounds
     passed = True
     if expected_min is not None and observed_min < float(expected_min):
         passed = False
@@ -490,7 +1117,7 @@ def _check_numeric_range(
 def _check_min_non_null_ratio(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     file_name = rule.get("file")
     column = rule.get("column")
@@ -499,15 +1126,16 @@ def _check_min_non_null_ratio(
     if file_profile is None or not file_profile.get("is_csv", False):
         return {"status": "fail", "observed": None, "expected": min_ratio, "details": "file missing or non-CSV"}
 
-    df = dataframes.get(file_name or "")
-    if df is None or column not in df.columns:
+    context = _rule_context(dataframes)
+    columns = context.columns(file_name or "")
+    if columns is None or column not in columns:
         return {"status": "fail", "observed": None, "expected": min_ratio, "details": f"column {column} missing"}
 
-    total = len(df)
+    total, nulls = context.row_and_null_counts(file_name, column)
     if total == 0:
         return {"status": "warn", "observed": 0.0, "expected": min_ratio, "details": "empty table"}
 
-    non_null_ratio = 1.0 - (df[column].isna().sum() / float(total))
+    non_null_ratio = 1.0 - (nulls / float(total))
     return {
         "status": "pass" if non_null_ratio >= min_ratio else "fail",
         "observed": round(non_null_ratio, 6),
@@ -519,7 +1147,7 @@ def _check_min_non_null_ratio(
 def _check_foreign_key_reference(
     rule: Dict[str, Any],
     file_profile: Optional[Dict[str, Any]],
-    dataframes: Dict[str, pd.DataFrame],
+    dataframes: Mapping[str, pd.DataFrame],
 ) -> Dict[str, Any]:
     source_file = rule.get("source_file")
     target_file = rule.get("target_file")
@@ -528,24 +1156,24 @@ def _check_foreign_key_reference(
     min_match_ratio = float(rule.get("min_match_ratio", 1.0))
     ignore_nulls = bool(rule.get("ignore_nulls", True))
 
-    source_df = dataframes.get(source_file)
-    target_df = dataframes.get(target_file)
-    if source_df is None:
+    context = _rule_context(dataframes)
+    source_columns = context.columns(source_file)
+    target_columns = context.columns(target_file)
+    if source_columns is None:
         return {"status": "fail", "observed": None, "expected": min_match_ratio, "details": f"source file missing: {source_file}"}
-    if target_df is None:
+    if target_columns is None:
         return {"status": "fail", "observed": None, "expected": min_match_ratio, "details": f"target file missing: {target_file}"}
 
-    if source_column not in source_df.columns:
+    if source_column not in source_columns:
         return {"status": "fail", "observed": None, "expected": min_match_ratio, "details": f"missing source column: {source_column}"}
-    if target_column not in target_df.columns:
+    if target_column not in target_columns:
         return {"status": "fail", "observed": None, "expected": min_match_ratio, "details": f"missing target column: {target_column}"}
 
-    source_values = set(source_df[source_column].dropna().astype(str).tolist())
-    target_values = target_df[target_column].astype(str)
-    if ignore_nulls:
-        target_values = target_values[target_df[target_column].notna()]
+    source_keys = context.key_index(source_file, source_column)
+    rows, nulls = context.row_and_null_counts(target_file, target_column)
+    total = rows - nulls if ignore_nulls else rows
 
-    if target_values.empty:
+    if total == 0:
         return {
             "status": "warn",
             "observed": 1.0,
@@ -553,13 +1181,16 @@ def _check_foreign_key_reference(
             "details": "no target keys to validate",
         }
 
-    matches = target_values.astype(str).isin(source_values)
-    match_ratio = float(matches.mean()) if len(matches) else 1.0
+    # Hash each distinct target key once and weight the hits by how often each occurs.
+    # Missing keys are not counted (they are kept in the total when ignore_nulls is false).
+    target_counts = context.text_value_counts(target_file, target_column)
+    matched = int(target_counts[target_counts.index.isin(source_keys)].sum())
+    match_ratio = matched / total
     return {
         "status": "pass" if match_ratio >= min_match_ratio else "fail",
         "observed": round(match_ratio, 6),
         "expected": min_match_ratio,
-        "details": f"matched {int(matches.sum())}/{len(matches)} target references",
+        "details": f"matched {matched}/{total} target references",
     }
 
 
@@ -575,7 +1206,7 @@ CHECK_HANDLERS = {
 }
 
 
-def _evaluate_check(rule: Dict[str, Any], profiles: Dict[str, Dict[str, Any]], dataframes: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+def _evaluate_check(rule: Dict[str, Any], profiles: Dict[str, Dict[str, Any]], dataframes: Mapping[str, pd.DataFrame]) -> Dict[str, Any]:
     file_name = rule.get("file")
     check_type = rule.get("type")
     file_profile = profiles.get(file_name)
@@ -592,7 +1223,10 @@ def _evaluate_check(rule: Dict[str, Any], profiles: Dict[str, Dict[str, Any]], d
             "details": f"unsupported check type: {check_type}",
         }
 
-    result = handler(rule, file_profile, dataframes)
+    try:
+        result = handler(rule, file_profile, dataframes)
+    except ProfileError as exc:
+        result = {"status": "fail", "observed": None, "expected": None, "details": str(exc)}
     return {
         "id": rule.get("id", ""),
         "title": rule.get("title", ""),
@@ -604,35 +1238,103 @@ def _evaluate_check(rule: Dict[str, Any], profiles: Dict[str, Dict[str, Any]], d
     }
 
 
-def evaluate_rules(profiles: Dict[str, Dict[str, Any]], dataframes: Dict[str, pd.DataFrame]) -> List[Dict[str, Any]]:
-    rules_payload = _load_rules()
-    file_rules = rules_payload.get("files", []) or []
-    cross_checks = rules_payload.get("cross_file_checks", []) or []
+# ---------------------------------------------------------------------------
+# Compiled rule plan
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class RulePlan:
+    """Rules flattened in YAML order, plus an execution order grouped by file and column."""
+
+    checks: Tuple[Dict[str, Any], ...]
+    execution_order: Tuple[int, ...]
+
+    def checks_reading(self, file_names: Iterable[str]) -> List[int]:
+        """Indices of the checks that read any of ``file_names`` (as file, source or target)."""
+        wanted = set(file_names)
+        return [
+            index
+            for index, check in enumerate(self.checks)
+            if wanted.intersection(
+                check.get(key) for key in ("file", "source_file", "target_file")
+            )
+        ]
+
 
-    results: List[Dict[str, Any]] = []
+def compile_rules(payload: Dict[str, Any]) -> RulePlan:
+    """Flatten per-file and cross-file rules and group them for execution.
 
-    for file_rule in file_rules:
+    Checks on the same file and column run back to back, so the context's
+    cached conversions are reused while they are hot.
+    """
+    checks: List[Dict[str, Any]] = []
+    for file_rule in payload.get("files", []) or []:
         file_name = file_rule.get("file")
-        for check in file_rule.get("checks", []):
+        for check in file_rule.get("checks", []) or []:
             check = dict(check)
             check["file"] = file_name
-            results.append(_evaluate_check(check, profiles, dataframes))
+            checks.append(check)
+    for check in payload.get("cross_file_checks", []) or []:
+        checks.append(dict(check))
 
-    for check in cross_checks:
-        results.append(_evaluate_check(check, profiles, dataframes))
+    def _group(index: int) -> Tuple[str, str, int]:
+        check = checks[index]
+        file_name = check.get("file") or check.get("target_file") or ""
+        column = check.get("column") or check.get("target_column") or ""
+        return str(file_name), str(column), index
 
-    return results
+    return RulePlan(tuple(checks), tuple(sorted(range(len(checks)), key=_group)))
 
 
-def build_overview() -> Dict[str, Any]:
-    profiles, dataframes = scan_raw_directory()
-    checks = evaluate_rules(profiles, dataframes)
+_compiled_rules: Optional[Tuple[Tuple[int, int], RulePlan]] = None
+_compiled_rules_lock = threading.Lock()
+
+
+def load_rule_plan() -> RulePlan:
+    """The compiled plan for the rules file; recompiled only when the YAML changes."""
+    global _compiled_rules
+    try:
+        stat = RULES_PATH.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None
+    with _compiled_rules_lock:
+        if key is not None and _compiled_rules is not None and _compiled_rules[0] == key:
+            return _compiled_rules[1]
+        plan = compile_rules(_load_rules())
+        if key is not None:
+            _compiled_rules = (key, plan)
+        return plan
+
+
+def _evaluate_plan(
+    plan: RulePlan,
+    profiles: Dict[str, Dict[str, Any]],
+    dataframes: Mapping[str, pd.DataFrame],
+    indices: Optional[Iterable[int]] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """Results of the plan's checks (or just ``indices``), keyed by check index."""
+    wanted = None if indices is None else set(indices)
+    context = _rule_context(dataframes)
+    return {
+        index: _evaluate_check(plan.checks[index], profiles, context)
+        for index in plan.execution_order
+        if wanted is None or index in wanted
+    }
 
+
+def evaluate_rules(profiles: Dict[str, Dict[str, Any]], dataframes: Mapping[str, pd.DataFrame]) -> List[Dict[str, Any]]:
+    plan = load_rule_plan()
+    results = _evaluate_plan(plan, profiles, dataframes)
+    return [results[index] for index in range(len(plan.checks))]
+
+
+def _overview_summary(profiles: Dict[str, Dict[str, Any]], checks: List[Dict[str, Any]]) -> Dict[str, Any]:
     csv_profiles = [
         p for p in profiles.values() if p.get("is_csv", False)
     ]
 
-    summary = {
+    return {
         "total_files": len(profiles),
         "csv_files": len(csv_profiles),
         "total_rows": int(sum((p.get("rows", 0) or 0) for p in csv_profiles)),
@@ -643,8 +1345,10 @@ def build_overview() -> Dict[str, Any]:
         "scanned_at": datetime.utcnow().isoformat(),
     }
 
+
+def _assemble_overview(profiles: Dict[str, Dict[str, Any]], checks: List[Dict[str, Any]]) -> Dict[str, Any]:
     return {
-        "summary": summary,
+        "summary": _overview_summary(profiles, checks),
         "files": sorted(
             _safe_json_value(list(profiles.values())),
             key=lambda item: (item.get("file_name") or ""),
@@ -656,26 +1360,354 @@ def build_overview() -> Dict[str, Any]:
     }
 
 
-def load_preview(file_name: str, rows: int = 20) -> Dict[str, Any]:
-    path = resolve_raw_path(file_name)
-    if not path.exists():
-        raise ProfileError(f"file does not exist: {file_name}")
+def build_overview() -> Dict[str, Any]:
+    profiles, dataframes = scan_raw_directory()
+    return _assemble_overview(profiles, evaluate_rules(profiles, dataframes))
+
+
+# ---------------------------------------------------------------------------
+# Incremental overview state
+# ---------------------------------------------------------------------------
+
+class RawDataState:
+    """Profiles, frames, and check results kept current one changed file at a time.
+
+    ``load()`` does the same full scan as ``build_overview()``.  After that,
+    ``apply(names)`` re-profiles only the named files (created, modified, or
+    deleted) and re-evaluates only the checks that read them, so the work is
+    proportional to the change.  When the rules file changed, every check is
+    re-evaluated.  Callers serialise ``load``/``apply``; ``overview()`` may be
+    read from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._frames = _LazyFrames({}, {})
+        self._plan: Optional[RulePlan] = None
+        self._results: List[Dict[str, Any]] = []
+        self._overview: Optional[Dict[str, Any]] = None
+
+    def load(self) -> Dict[str, Any]:
+        profiles, frames = scan_raw_directory()
+        plan = load_rule_plan()
+        results = _evaluate_plan(plan, profiles, frames)
+        with self._lock:
+            self._profiles = dict(profiles)
+            self._frames = frames if isinstance(frames, _LazyFrames) else _LazyFrames(dict(frames), {})
+            self._plan = plan
+            self._results = [results[index] for index in range(len(plan.checks))]
+            self._overview = _assemble_overview(self._profiles, self._results)
+            return self._overview
+
+    def overview(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._overview
+
+    def apply(self, names: Iterable[str]) -> Dict[str, Any]:
+        """Fold changed file names into the state and return what changed.
+
+        The result lists ``created``/``modified``/``deleted`` names, the new
+        profiles of created and modified files, the checks whose result
+        changed, and the new summary.  A name whose bytes did not actually
+        change (a touch) is dropped.
+        """
+        if self._plan is None:
+            self.load()
+        profiles = dict(self._profiles)
+        cache = _ProfileCache(PROFILE_CACHE_PATH, RAW_DATA_DIR)
+        created: List[str] = []
+        modified: List[str] = []
+        deleted: List[str] = []
+
+        for name in sorted(set(names)):
+            path = RAW_DATA_DIR / name
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+            if stat is None or not S_ISREG(stat.st_mode) or path.name == ".gitkeep":
+                if profiles.pop(name, None) is not None:
+                    self._frames.discard(name)
+                    deleted.append(name)
+                continue
+
+            entry = cache.lookup(name, path, stat)
+            if entry is not None:
+                profile, df = {**entry["profile"], **_base_file_profile(path, stat)}, None
+                readable = profile["is_csv"] and entry["readable"]
+                if name in profiles:
+                    profiles[name] = profile
+                    continue
+            else:
+                profile, df = _scan_file(path, stat)
+                readable = profile["is_csv"] and "error" not in profile
+                cache.store(name, path, stat, profile, readable=readable)
+            (modified if name in profiles else created).append(name)
+            profiles[name] = profile
+            self._frames.replace(
+                name, df, path if readable and df is None else None,
+                streamed=profile.get("profile_mode") == "streaming",
+            )
+
+        cache.retain(profiles)
+        cache.save()
+
+        plan = load_rule_plan()
+        rules_changed = plan is not self._plan
+        changed_files = [*created, *modified, *deleted]
+        if rules_changed:
+            results = _evaluate_plan(plan, profiles, self._frames)
+            previous = {(check["file"], check["id"]): check for check in self._results}
+            new_results = [results[index] for index in range(len(plan.checks))]
+            changed_checks = [
+                check for check in new_results if previous.get((check["file"], check["id"])) != check
+            ]
+        else:
+            results = _evaluate_plan(plan, profiles, self._frames, plan.checks_reading(changed_files))
+            new_results = list(self._results)
+            changed_checks = []
+            for index, check in results.items():
+                if new_results[index] != check:
+                    changed_checks.append(check)
+                new_results[index] = check
+
+        overview = _assemble_overview(dict(sorted(profiles.items())), new_results)
+        with self._lock:
+            self._profiles = profiles
+            self._plan = plan
+            self._results = new_results
+            self._overview = overview
 
-    if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path)
-        preview = df.head(rows).to_dict(orient="records")
         return {
-            "file_name": str(path.relative_to(RAW_DATA_DIR)),
-            "rows": int(len(df)),
-            "columns": list(df.columns),
-            "preview_rows": _safe_json_value(preview),
+            "created": created,
+            "modified": modified,
+            "deleted": deleted,
+            "rules_changed": rules_changed,
+            "files": _safe_json_value([profiles[name] for name in [*created, *modified]]),
+            "checks": _safe_json_value(changed_checks),
+            "summary": overview["summary"],
         }
 
-    with path.open("r", encoding="utf-8") as f:
-        text = f.read()
-    return {
-        "file_name": str(path.relative_to(RAW_DATA_DIR)),
-        "rows": len(text.splitlines()),
-        "columns": ["text"],
-        "preview_rows": [_safe_json_value(text[:1024])],
-    }
+
+# ---------------------------------------------------------------------------
+# Overview snapshot cache
+# ---------------------------------------------------------------------------
+
+def raw_fingerprint() -> Tuple[Any, ...]:
+    """Cheap signature of data/raw and the rules file: names, sizes, and mtimes.
+
+    Only ``stat`` calls — no file is opened — so it costs microseconds per file.
+    """
+    entries: List[Tuple[str, int, int]] = []
+    if RAW_DATA_DIR.exists():
+        pending = [RAW_DATA_DIR]
+        while pending:
+            directory = pending.pop()
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        pending.append(Path(entry.path))
+                    elif entry.is_file() and entry.name != ".gitkeep":
+                        stat = entry.stat()
+                        relative = os.path.relpath(entry.path, RAW_DATA_DIR)
+                        entries.append((relative, stat.st_size, stat.st_mtime_ns))
+    try:
+        rules_mtime: Optional[int] = RULES_PATH.stat().st_mtime_ns
+    except OSError:
+        rules_mtime = None
+    return tuple(sorted(entries)), rules_mtime
+
+
+class OverviewCache:
+    """Snapshot of ``build_overview()`` reused until the raw-data fingerprint changes.
+
+    The fingerprint is re-checked at most once per ``check_interval_seconds``;
+    between checks a request is a lock-protected attribute read.  When the
+    fingerprint changes and a snapshot exists, the stale snapshot keeps being
+    served while one background thread rebuilds it.  Only the very first
+    request (or one after ``invalidate()``) builds synchronously.  Snapshots
+    are shared between callers and must be treated as read-only.
+
+    While the raw-data watcher runs it owns the snapshot
+    (``serve_published_only(True)``): requests serve whatever ``publish``
+    installed without fingerprint checks or rebuilds, and a cold request waits
+    for the first publish.  Only if none arrives within
+    ``publish_wait_seconds`` does it build one itself.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], Dict[str, Any]],
+        fingerprint: Callable[[], Hashable],
+        *,
+        check_interval_seconds: float,
+        publish_wait_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._build = build
+        self._fingerprint_fn = fingerprint
+        self.check_interval_seconds = check_interval_seconds
+        self.publish_wait_seconds = publish_wait_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._published = threading.Condition(self._lock)
+        self._published_only = False
+        self._build_lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._fingerprint: Optional[Hashable] = None
+        self._checked_at = float("-inf")
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "rebuilds": 0,
+            "background_refreshes": 0,
+            "refresh_errors": 0,
+            "published": 0,
+            "publish_waits": 0,
+            "publish_wait_timeouts": 0,
+        }
+
+    def get(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._published_only:
+                if self._snapshot is None:
+                    self._counters["publish_waits"] += 1
+                    self._published.wait_for(
+                        lambda: self._snapshot is not None or not self._published_only,
+                        timeout=self.publish_wait_seconds,
+                    )
+                if self._snapshot is not None:
+                    self._counters["hits"] += 1
+                    return self._snapshot
+                if self._published_only:
+                    self._counters["publish_wait_timeouts"] += 1
+                    logger.warning(
+                        "No overview published within %.0fs; building one", self.publish_wait_seconds
+                    )
+
+        now = self._clock()
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.check_interval_seconds:
+                self._counters["hits"] += 1
+                return snapshot
+
+        fingerprint = self._fingerprint_fn()
+        with self._lock:
+            self._checked_at = now
+            if snapshot is not None and self._snapshot is snapshot:
+                if fingerprint == self._fingerprint:
+                    self._counters["hits"] += 1
+                    return snapshot
+                self._counters["stale_hits"] += 1
+                self._refresh_in_background_locked()
+                return snapshot
+
+        return self.refresh()
+
+    def refresh(self) -> Dict[str, Any]:
+        """Rebuild now unless a concurrent rebuild already produced a current snapshot."""
+        with self._build_lock:
+            fingerprint = self._fingerprint_fn()
+            with self._lock:
+                if self._snapshot is not None and fingerprint == self._fingerprint:
+                    return self._snapshot
+            snapshot = self._build()
+            with self._lock:
+                self._snapshot = snapshot
+                self._fingerprint = fingerprint
+                self._checked_at = self._clock()
+                self._counters["rebuilds"] += 1
+            return snapshot
+
+    def refresh_in_background(self) -> None:
+        """Start a background rebuild (e.g. to prewarm at startup) if none is running."""
+        with self._lock:
+            if not self._published_only:
+                self._refresh_in_background_locked()
+
+    def _refresh_in_background_locked(self) -> None:
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._counters["background_refreshes"] += 1
+        self._refresh_thread = threading.Thread(
+            target=self._background_refresh, name="overview-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("Background overview refresh failed; serving the previous snapshot")
+            with self._lock:
+                self._counters["refresh_errors"] += 1
+                # Re-check on the next request instead of waiting out the interval.
+                self._checked_at = float("-inf")
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def publish(self, snapshot: Dict[str, Any], fingerprint: Hashable) -> None:
+        """Install a snapshot built elsewhere (the raw-data watcher) for ``fingerprint``."""
+        with self._lock:
+            self._snapshot = snapshot
+            self._fingerprint = fingerprint
+            self._checked_at = self._clock()
+            self._counters["published"] += 1
+            self._published.notify_all()
+
+    def serve_published_only(self, enabled: bool) -> None:
+        """Hand the snapshot to an external publisher (the watcher), or take it back."""
+        with self._lock:
+            self._published_only = enabled
+            # Back in charge: re-check the fingerprint on the next request.
+            self._checked_at = float("-inf")
+            self._published.notify_all()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._fingerprint = None
+            self._checked_at = float("-inf")
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cached": self._snapshot is not None,
+                "scanned_at": (self._snapshot or {}).get("summary", {}).get("scanned_at"),
+                "check_interval_seconds": self.check_interval_seconds,
+                **self._counters,
+            }
+
+
+_overview_cache = OverviewCache(
+    lambda: build_overview(),
+    lambda: raw_fingerprint(),
+    check_interval_seconds=float(os.getenv("RAW_OVERVIEW_CHECK_SECONDS", "1")),
+)
+
+
+def get_overview() -> Dict[str, Any]:
+    """Cached ``build_overview()``; recomputed only after data/raw or the rules change."""
+    return _overview_cache.get()
+
+
+def publish_overview(snapshot: Dict[str, Any], fingerprint: Hashable) -> None:
+    """Serve ``snapshot`` (kept current by the raw-data watcher) until ``fingerprint`` changes."""
+    _overview_cache.publish(snapshot, fingerprint)
+
+
+def serve_published_overview(enabled: bool) -> None:
+    """While True, ``get_overview()`` serves only snapshots installed by ``publish_overview``."""
+    _overview_cache.serve_published_only(enabled)
+
+
+def prewarm_overview() -> None:
+    """Build the overview snapshot on a background thread (called at app startup)."""
+    _overview_cache.refresh_in_background()
@@ -0,0 +1,103 @@
+"""Dataset catalog for the Data Management page: category, rows, size, and freshness.
+
+Kept apart from profiling and the PRD checks so the catalog stays cheap no
+matter how expensive the checks get.  Row and column counts come from the
+preview's persisted row-offset index (a quote-aware newline count over the
+raw bytes; nothing is parsed with pandas), and each entry is reused until
+the file's size or mtime changes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from . import data_profiles
+from .raw_preview import row_index
+
+
+logger = logging.getLogger(__name__)
+
+_CATEGORY_MAP: Dict[str, str] = {
+    # Digital media
+    "meta_ads.csv": "Digital Media",
+    "google_ads.csv": "Digital Media",
+    "dv360.csv": "Digital Media",
+    "tiktok_ads.csv": "Digital Media",
+    "youtube_ads.csv": "Digital Media",
+    "linkedin_ads.csv": "Digital Media",
+    # Traditional media
+    "tv_performance.csv": "Traditional Media",
+    "ooh_performance.csv": "Traditional Media",
+    "print_performance.csv": "Traditional Media",
+    "radio_performance.csv": "Traditional Media",
+    # Sales pipeline
+    "vehicle_sales.csv": "Sales Pipeline",
+    "website_analytics.csv": "Sales Pipeline",
+    "configurator_sessions.csv": "Sales Pipeline",
+    "leads.csv": "Sales Pipeline",
+    "test_drives.csv": "Sales Pipeline",
+    # External / context
+    "competitor_spend.csv": "External",
+    "economic_indicators.csv": "External",
+    "events.csv": "External",
+    "sla_tracking.csv": "External",
+}
+
+# name -> ((size, mtime_ns), entry without the request-time age)
+_entries: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_entries_lock = threading.Lock()
+
+
+def _catalog_entry(name: str, path: Path, stat: os.stat_result) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "name": name,
+        "category": _CATEGORY_MAP.get(name, "Other"),
+        "rows": 0,
+        "columns": 0,
+        "size_bytes": stat.st_size,
+        "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "updated": datetime.fromtimestamp(stat.st_mtime).date().isoformat(),
+        "status": "ready",
+    }
+    try:
+        index = row_index(path)
+    except (OSError, ValueError):
+        logger.warning("Could not count rows of %s", path, exc_info=True)
+        entry["status"] = "error"
+        return entry
+    entry["rows"] = index.rows
+    entry["columns"] = len(index.columns)
+    return entry
+
+
+def list_datasets() -> List[Dict[str, Any]]:
+    """One catalog entry per raw CSV, sorted by name; only new or changed files are counted."""
+    now = time.time()
+    datasets: List[Dict[str, Any]] = []
+    seen = set()
+    for path, stat in data_profiles.raw_files():
+        if path.suffix.lower() != ".csv":
+            continue
+        name = str(path.relative_to(data_profiles.RAW_DATA_DIR))
+        key = (stat.st_size, stat.st_mtime_ns)
+        seen.add(name)
+        with _entries_lock:
+            cached = _entries.get(name)
+        if cached is not None and cached[0] == key:
+            entry = cached[1]
+        else:
+            entry = _catalog_entry(name, path, stat)
+            with _entries_lock:
+                _entries[name] = (key, entry)
+        datasets.append({**entry, "age_seconds": max(0, int(now - stat.st_mtime))})
+
+    with _entries_lock:
+        for name in [name for name in _entries if name not in seen]:
+            del _entries[name]
+    return datasets
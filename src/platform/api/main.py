@@ -2,17 +2,91 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
 from datetime import datetime, timezone
-from typing import Literal
+from typing import AsyncIterator, Literal
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .data_profiles import build_overview, load_preview, ProfileError
+from .data_profiles import get_overview, prewarm_overview, ProfileError
+from .dataset_catalog import list_datasets
+from .raw_preview import PreviewQueryError, query_preview
+from .raw_watcher import change_feed, start_raw_watcher, stop_raw_watcher, watcher_running
+
+logger = logging.getLogger(__name__)
+
+_RAG_ROUTER_MODULE = f"{__package__}.agents.rag_router"
+_SESSION_SWEEP_INTERVAL_SECONDS = float(os.getenv("RAG_SESSION_SWEEP_INTERVAL_SECONDS", "60"))
+_CHAT_RETRY_AFTER_SECONDS = 5
+_DISCONNECT_POLL_SECONDS = 1.0
+# Non-standard, but widely used for "client closed request" (never seen by the client).
+_CLIENT_CLOSED_REQUEST = 499
+# Prewarming imports the Agent SDK and spawns CLI subprocesses in every
+# worker, so it is opt-in (set RAG_WARM_CLIENTS > 0 to enable it).
+_WARM_AGENT_CLIENTS = int(os.getenv("RAG_WARM_CLIENTS", "0"))
+# The intent model behind the chat fast path is fitted at startup, off the event loop.
+_WARM_INTENT_MODEL = os.getenv("RAG_FAST_PATH", "1").strip().lower() not in {"0", "false", "no"}
+_STREAM_MEDIA_TYPES = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}
+
+
+def _loaded_rag_router():
+    """Return the agent router module if a chat request has imported it, else None.
+
+    The router pulls in the Agent SDK, so lifecycle hooks never import it eagerly.
+    """
+    return sys.modules.get(_RAG_ROUTER_MODULE)
+
+
+async def _sweep_agent_sessions() -> None:
+    """Periodically disconnect agent sessions idle past their TTL."""
+    while True:
+        await asyncio.sleep(_SESSION_SWEEP_INTERVAL_SECONDS)
+        router = _loaded_rag_router()
+        if router is None:
+            continue
+        try:
+            await router.sweep_sessions()
+        except Exception:
+            logger.exception("Agent session sweep failed")
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # The watcher's first pass builds and publishes the overview snapshot itself.
+    if not start_raw_watcher():
+        prewarm_overview()
+    if _WARM_INTENT_MODEL or _WARM_AGENT_CLIENTS > 0:
+        # Importing the router loads the Agent SDK; only pay that when something needs warming.
+        try:
+            from .agents import rag_router
+
+            rag_router.start_intent_warmup()
+            if _WARM_AGENT_CLIENTS > 0:
+                rag_router.start_client_pool()
+        except Exception:
+            logger.exception("Agent warm-up failed to start; chat will warm up on first use")
+    sweeper = asyncio.create_task(_sweep_agent_sessions())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sweeper
+        router = _loaded_rag_router()
+        if router is not None:
+            await router.shutdown_sessions()
+        await asyncio.to_thread(stop_raw_watcher)
+
 
-app = FastAPI(title="RAG + MMM Data Dashboard API")
+app = FastAPI(title="RAG + MMM Data Dashboard API", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -290,12 +364,12 @@ def health() -> dict:
 
 @app.get("/api/raw/dashboard/summary")
 def raw_dashboard_summary() -> dict:
-    return build_overview()
+    return get_overview()
 
 
 @app.get("/api/raw/dashboard/files")
 def raw_dashboard_files() -> dict:
-    payload = build_overview()
+    payload = get_overview()
     return {
         "summary": payload["summary"],
         "files": payload["files"],
@@ -304,19 +378,69 @@ def raw_dashboard_files() -> dict:
 
 @app.get("/api/raw/dashboard/prd-checks")
 def raw_dashboard_checks() -> dict:
-    payload = build_overview()
+    payload = get_overview()
     return {
         "summary": payload["summary"],
         "checks": payload["checks"],
     }
 
 
+@app.get("/api/raw/dashboard/events")
+async def raw_dashboard_events(request: Request) -> StreamingResponse:
+    """Server-sent events as files in data/raw change.
+
+    ``diff`` events carry the created/modified/deleted file names, their new
+    profiles, the checks whose result changed, and the new summary.  On
+    ``reset`` a client refetches ``/api/raw/dashboard/summary``.  Reconnects
+    with ``Last-Event-ID`` are replayed the events they missed.
+    """
+    if not watcher_running():
+        raise HTTPException(status_code=503, detail="raw data watcher is not running")
+    events = change_feed().subscribe(request.headers.get("last-event-id"))
+
+    async def _body() -> AsyncIterator[str]:
+        async for event in events:
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {event['id']}\n" + _format_stream_event(event, "sse")
+
+    return StreamingResponse(
+        _body(),
+        media_type=_STREAM_MEDIA_TYPES["sse"],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/raw/dashboard/file/{file_name:path}")
-def raw_file_preview(file_name: str, rows: int = 20) -> dict:
+def raw_file_preview(
+    file_name: str,
+    rows: int = 20,
+    offset: int = 0,
+    columns: str | None = None,
+    filters: list[str] = Query([], alias="filter"),
+    sort: str | None = None,
+) -> dict:
+    """One page of a raw file: ``rows`` per page from ``offset``.
+
+    ``columns`` and ``sort`` are comma-separated (``sort=-spend,date``);
+    ``filter`` may repeat and takes ``column:op:value`` (``market:eq:GB``).
+    """
     if rows < 1 or rows > 200:
         raise HTTPException(status_code=400, detail="rows must be between 1 and 200")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset must be >= 0")
     try:
-        payload = load_preview(file_name, rows=rows)
+        payload = query_preview(
+            file_name,
+            offset=offset,
+            limit=rows,
+            columns=[c for c in (columns or "").split(",") if c],
+            filters=filters,
+            sort=[key for key in (sort or "").split(",") if key],
+        )
+    except PreviewQueryError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except ProfileError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return payload
@@ -326,50 +450,10 @@ def raw_file_preview(file_name: str, rows: int = 20) -> dict:
 # Dataset list (consumed by Data Management page)
 # ---------------------------------------------------------------------------
 
-_CATEGORY_MAP: dict[str, str] = {
-    # Digital media
-    "meta_ads.csv": "Digital Media",
-    "google_ads.csv": "Digital Media",
-    "dv360.csv": "Digital Media",
-    "tiktok_ads.csv": "Digital Media",
-    "youtube_ads.csv": "Digital Media",
-    "linkedin_ads.csv": "Digital Media",
-    # Traditional media
-    "tv_performance.csv": "Traditional Media",
-    "ooh_performance.csv": "Traditional Media",
-    "print_performance.csv": "Traditional Media",
-    "radio_performance.csv": "Traditional Media",
-    # Sales pipeline
-    "vehicle_sales.csv": "Sales Pipeline",
-    "website_analytics.csv": "Sales Pipeline",
-    "configurator_sessions.csv": "Sales Pipeline",
-    "leads.csv": "Sales Pipeline",
-    "test_drives.csv": "Sales Pipeline",
-    # External / context
-    "competitor_spend.csv": "External",
-    "economic_indicators.csv": "External",
-    "events.csv": "External",
-    "sla_tracking.csv": "External",
-}
-
-
 @app.get("/api/data/datasets")
 def data_datasets() -> list:
-    """Return a dataset catalogue entry for each raw CSV file."""
-    payload = build_overview()
-    datasets = []
-    for f in payload["files"]:
-        if not f.get("is_csv"):
-            continue
-        name = f["file_name"]
-        datasets.append({
-            "name": name,
-            "category": _CATEGORY_MAP.get(name, "Other"),
-            "rows": f.get("rows") or 0,
-            "updated": (f.get("last_modified") or "")[:10],
-            "status": "ready",
-        })
-    return datasets
+    """Return a dataset catalogue entry (category, rows, size, freshness) for each raw CSV file."""
+    return list_datasets()
 
 
 # ---------------------------------------------------------------------------
@@ -382,13 +466,123 @@ class ChatRequest(BaseModel):
     session_id: str | None = None
 
 
-@app.post("/api/rag/chat")
-async def rag_chat(req: ChatRequest) -> dict:
-    """Answer a marketing question via agent routing with session continuity."""
+async def _cancel_on_disconnect(request: Request, task: asyncio.Task) -> bool:
+    """Wait for ``task``; cancel it if the client goes away first. Returns True if cancelled."""
+    try:
+        while not task.done():
+            await asyncio.wait({task}, timeout=_DISCONNECT_POLL_SECONDS)
+            if not task.done() and await request.is_disconnected():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+                return True
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    return False
+
+
+@app.post("/api/rag/chat", response_model=None)
+async def rag_chat(req: ChatRequest, request: Request) -> dict | Response:
+    """Answer a marketing question via agent routing with session continuity.
+
+    The agent run (and any queued tool calls) is cancelled if the client disconnects.
+    """
     if not req.message.strip():
         raise HTTPException(status_code=400, detail="message is required")
 
+    from .agents.admission import AdmissionRejected
     from .agents.rag_router import ask_with_routing
+    from .agents.sessions import SessionCapacityError
 
-    result = await ask_with_routing(req.message, req.session_id)
+    task = asyncio.ensure_future(ask_with_routing(req.message, req.session_id))
+    if await _cancel_on_disconnect(request, task):
+        logger.info("Chat client disconnected; agent run cancelled")
+        return Response(status_code=_CLIENT_CLOSED_REQUEST)
+    try:
+        result = task.result()
+    except (AdmissionRejected, SessionCapacityError) as exc:
+        raise _chat_capacity_error(exc) from exc
     return result
+
+
+def _chat_capacity_error(exc: Exception) -> HTTPException:
+    """429 when the admission queue rejected the request, 503 when agent clients ran out."""
+    from .agents.admission import AdmissionRejected
+
+    if isinstance(exc, AdmissionRejected):
+        return HTTPException(
+            status_code=429,
+            detail=f"Too many concurrent chats: {exc}. Please retry shortly.",
+            headers={"Retry-After": str(exc.retry_after_seconds)},
+        )
+    return HTTPException(
+        status_code=503,
+        detail=f"Chat is at capacity: {exc}. Please retry shortly.",
+        headers={"Retry-After": str(_CHAT_RETRY_AFTER_SECONDS)},
+    )
+
+
+def _format_stream_event(event: dict, stream_format: str) -> str:
+    payload = json.dumps(event, default=str)
+    if stream_format == "ndjson":
+        return payload + "\n"
+    return f"event: {event['type']}\ndata: {payload}\n\n"
+
+
+@app.post("/api/rag/chat/stream")
+async def rag_chat_stream(
+    req: ChatRequest,
+    stream_format: Literal["sse", "ndjson"] = Query("sse", alias="format"),
+) -> StreamingResponse:
+    """Stream a chat answer as server-sent events (or NDJSON with ``?format=ndjson``).
+
+    Events: ``session``, ``text`` deltas, ``tool_start``/``tool_end``, ``error``,
+    and a closing ``final`` with reply, sources, agent_used and timing.
+    """
+    if not req.message.strip():
+        raise HTTPException(status_code=400, detail="message is required")
+
+    from .agents.admission import AdmissionRejected
+    from .agents.rag_router import stream_with_routing
+    from .agents.sessions import SessionCapacityError
+
+    events = stream_with_routing(req.message, req.session_id)
+    # Pull the first event before committing to a 200 so capacity errors still map to 503.
+    try:
+        first = await anext(events)
+    except (AdmissionRejected, SessionCapacityError) as exc:
+        raise _chat_capacity_error(exc) from exc
+
+    async def _body() -> AsyncIterator[str]:
+        yield _format_stream_event(first, stream_format)
+        async for event in events:
+            yield _format_stream_event(event, stream_format)
+
+    return StreamingResponse(
+        _body(),
+        media_type=_STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/rag/metrics")
+def rag_metrics() -> dict:
+    """Agent session, transcript store, warm-pool, admission-queue, and tool metrics for this worker."""
+    router = _loaded_rag_router()
+    if router is None:
+        return {
+            "sessions": None, "session_state": None, "pool": None, "admission": None,
+            "tool_cache": None, "tools": None,
+        }
+    # Loaded along with the router, so this import is free here.
+    from .agents.tool_cache import tool_cache_metrics
+
+    return {
+        "sessions": router.session_metrics(),
+        "session_state": router.session_state_metrics(),
+        "pool": router.pool_metrics(),
+        "admission": router.admission_metrics(),
+        "tool_cache": tool_cache_metrics(),
+        "tools": router.tool_executor_metrics(),
+    }
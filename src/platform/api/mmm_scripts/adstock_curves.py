@@ -2,32 +2,23 @@
 
 import json
 import sys
-from pathlib import Path
 
-import pandas as pd
+try:
+    from .fitted_model import CHANNELS, FittedMMM, generator_constant, load_fitted_mmm
+except ImportError:  # executed directly as a script
+    from fitted_model import CHANNELS, FittedMMM, generator_constant, load_fitted_mmm
 
-_here = Path(__file__).resolve().parent
-PROJECT_ROOT = _here
-for _ in range(10):
-    if (PROJECT_ROOT / "requirements.txt").exists():
-        break
-    PROJECT_ROOT = PROJECT_ROOT.parent
 
-DATA_PATH = PROJECT_ROOT / "data" / "mmm" / "model_ready.csv"
+def run_adstock_curves(fitted: FittedMMM | None = None):
+    """Compute adstock transformation stats per channel.
 
-# Import decay rates and saturation params from config
-sys.path.insert(0, str(PROJECT_ROOT / "data" / "generators"))
-from config import ADSTOCK_DECAY_RATES, SATURATION_PARAMS
-
-CHANNELS = [
-    "tv", "ooh", "print", "radio", "youtube",
-    "meta", "google", "dv360", "tiktok", "linkedin", "events",
-]
-
-
-def run_adstock_curves():
-    """Compute adstock transformation stats per channel."""
-    df = pd.read_csv(DATA_PATH, parse_dates=["week_start"])
+    Pass ``fitted`` to reuse an already loaded dataset.
+    """
+    if fitted is None:
+        fitted = load_fitted_mmm()
+    df = fitted.df
+    decay_rates = generator_constant("ADSTOCK_DECAY_RATES")
+    saturation_params = generator_constant("SATURATION_PARAMS")
 
     channels_result = []
     for ch in CHANNELS:
@@ -38,8 +29,8 @@ def run_adstock_curves():
         total_adstocked = float(df[adstock_col].sum())
         peak_adstock = float(df[adstock_col].max())
 
-        decay_rate = ADSTOCK_DECAY_RATES.get(ch, 0.5)
-        sat = SATURATION_PARAMS.get(ch, {"alpha": 0.5, "gamma": 0.5})
+        decay_rate = decay_rates.get(ch, 0.5)
+        sat = saturation_params.get(ch, {"alpha": 0.5, "gamma": 0.5})
 
         channels_result.append({
             "name": ch,
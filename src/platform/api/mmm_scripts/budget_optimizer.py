@@ -2,52 +2,24 @@
 
 import json
 import sys
-from pathlib import Path
 
-import numpy as np
-import pandas as pd
-from sklearn.linear_model import Ridge
-from sklearn.preprocessing import StandardScaler
-
-_here = Path(__file__).resolve().parent
-PROJECT_ROOT = _here
-for _ in range(10):
-    if (PROJECT_ROOT / "requirements.txt").exists():
-        break
-    PROJECT_ROOT = PROJECT_ROOT.parent
-
-DATA_PATH = PROJECT_ROOT / "data" / "mmm" / "model_ready.csv"
-
-CHANNELS = [
-    "tv", "ooh", "print", "radio", "youtube",
-    "meta", "google", "dv360", "tiktok", "linkedin", "events",
-]
-
-ADSTOCK_COLS = [f"adstock_{ch}" for ch in CHANNELS]
-CONTROL_COLS = ["consumer_confidence_index", "bank_rate_pct", "competitor_spend_weekly"]
-TARGET = "units_sold"
+try:
+    from .fitted_model import CHANNELS, FittedMMM, load_fitted_mmm
+except ImportError:  # executed directly as a script
+    from fitted_model import CHANNELS, FittedMMM, load_fitted_mmm
 
 MAX_SHIFT_PCT = 0.30  # +/-30% constraint per channel
 
 
-def run_budget_optimizer():
-    """Optimize budget allocation based on marginal ROI."""
-    df = pd.read_csv(DATA_PATH, parse_dates=["week_start"])
-    df_post = df[df[TARGET] > 0].copy()
-
-    feature_names = ADSTOCK_COLS + CONTROL_COLS
-    X = df_post[feature_names].values
-    y = df_post[TARGET].values
-
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-
-    model = Ridge(alpha=1.0)
-    model.fit(X_scaled, y)
+def run_budget_optimizer(fitted: FittedMMM | None = None):
+    """Optimize budget allocation based on marginal ROI.
 
-    total_revenue = float(df_post["revenue"].sum())
-    total_units = float(df_post[TARGET].sum())
-    revenue_per_unit = total_revenue / total_units if total_units > 0 else 0
+    Pass ``fitted`` to reuse an already loaded dataset and model.
+    """
+    if fitted is None:
+        fitted = load_fitted_mmm()
+    df_post = fitted.df_post
+    revenue_per_unit = fitted.revenue_per_unit
 
     # Current allocation and marginal ROI per channel
     current_allocation = {}
@@ -57,7 +29,7 @@ def run_budget_optimizer():
         total_spend = float(df_post[spend_col].sum())
         current_allocation[ch] = total_spend
 
-        coef_original = model.coef_[i] / scaler.scale_[i]
+        coef_original = fitted.coef_original(i)
         marginal_rois[ch] = coef_original * revenue_per_unit
 
     total_budget = sum(current_allocation.values())
@@ -99,7 +71,7 @@ def run_budget_optimizer():
     current_units = 0
     optimal_units = 0
     for i, ch in enumerate(CHANNELS):
-        coef_original = model.coef_[i] / scaler.scale_[i]
+        coef_original = fitted.coef_original(i)
         current_units += coef_original * current_allocation[ch]
         optimal_units += coef_original * optimal[ch]
 
@@ -0,0 +1,125 @@
+"""Shared MMM dataset load and Ridge fit used by the mmm_scripts.
+
+Each script used to re-read ``model_ready.csv`` and refit the same Ridge
+model.  ``load_fitted_mmm()`` does that once and returns everything the
+scripts need, so callers that run several analyses (e.g. the in-process MMM
+agent tools) can fit once and pass the result to each ``run_*`` function.
+"""
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+
+# Resolve project root (walk up until we find requirements.txt)
+_here = Path(__file__).resolve().parent
+PROJECT_ROOT = _here
+for _ in range(10):
+    if (PROJECT_ROOT / "requirements.txt").exists():
+        break
+    PROJECT_ROOT = PROJECT_ROOT.parent
+
+try:
+    from ..raw_schemas import MODEL_READY_SCHEMA
+except ImportError:  # run as a standalone script
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from src.platform.api.raw_schemas import MODEL_READY_SCHEMA
+
+from src.rag.data_processing.config_constants import extract_config_constants
+
+DATA_PATH = PROJECT_ROOT / "data" / "mmm" / "model_ready.csv"
+GENERATOR_CONFIG_PATH = PROJECT_ROOT / "data" / "generators" / "config.py"
+
+CHANNELS = [
+    "tv", "ooh", "print", "radio", "youtube",
+    "meta", "google", "dv360", "tiktok", "linkedin", "events",
+]
+
+ADSTOCK_COLS = [f"adstock_{ch}" for ch in CHANNELS]
+CONTROL_COLS = ["consumer_confidence_index", "bank_rate_pct", "competitor_spend_weekly"]
+FEATURE_NAMES = ADSTOCK_COLS + CONTROL_COLS
+TARGET = "units_sold"
+
+
+@lru_cache(maxsize=1)
+def _generator_constants():
+    return extract_config_constants(GENERATOR_CONFIG_PATH.read_text(encoding="utf-8"))
+
+
+def generator_constant(name: str):
+    """A literal top-level constant from data/generators/config.py.
+
+    Parsed with the same static evaluator the RAG ingest uses, rather than
+    imported: importing it seeds numpy's global RNG and builds dataframes,
+    which must not happen inside the API process.
+    """
+    constants = _generator_constants()
+    if name in constants:
+        return constants[name][0]
+    raise KeyError(f"{name} is not a literal constant in {GENERATOR_CONFIG_PATH}")
+
+
+@dataclass(frozen=True)
+class FittedMMM:
+    """model_ready.csv plus the Ridge fit on post-launch weeks (units_sold > 0)."""
+
+    df: pd.DataFrame
+    df_post: pd.DataFrame
+    scaler: StandardScaler
+    model: Ridge
+    total_revenue: float
+    total_units: float
+
+    @property
+    def revenue_per_unit(self) -> float:
+        return self.total_revenue / self.total_units if self.total_units > 0 else 0
+
+    def coef_original(self, index: int) -> float:
+        """Coefficient of feature ``index`` converted back to original (unscaled) units."""
+        return self.model.coef_[index] / self.scaler.scale_[index]
+
+
+def fit_mmm(df: pd.DataFrame) -> FittedMMM:
+    """Fit the standardized Ridge model on the post-launch weeks of ``df``."""
+    df_post = df[df[TARGET] > 0].copy()
+
+    X = df_post[FEATURE_NAMES].values
+    y = df_post[TARGET].values
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+
+    model = Ridge(alpha=1.0)
+    model.fit(X_scaled, y)
+
+    return FittedMMM(
+        df=df,
+        df_post=df_post,
+        scaler=scaler,
+        model=model,
+        total_revenue=float(df_post["revenue"].sum()),
+        total_units=float(df_post[TARGET].sum()),
+    )
+
+
+def load_fitted_mmm(path: Path | None = None) -> FittedMMM:
+    """Read model_ready.csv (default ``DATA_PATH``) with its declared schema and fit the model."""
+    return fit_mmm(MODEL_READY_SCHEMA.read_csv(path or DATA_PATH))
+
+
+def r_squared(fitted: FittedMMM) -> tuple[float, float]:
+    """Return (R², adjusted R²) of the fit on post-launch weeks."""
+    X_scaled = fitted.scaler.transform(fitted.df_post[FEATURE_NAMES].values)
+    y = fitted.df_post[TARGET].values
+    y_pred = fitted.model.predict(X_scaled)
+    ss_res = np.sum((y - y_pred) ** 2)
+    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    r2 = 1 - ss_res / ss_tot
+    n, p = X_scaled.shape
+    adjusted = 1 - (1 - r2) * (n - 1) / (n - p - 1)
+    return float(r2), float(adjusted)
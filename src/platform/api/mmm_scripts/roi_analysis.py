@@ -2,63 +2,36 @@
 
 import json
 import sys
-from pathlib import Path
 
-import numpy as np
-import pandas as pd
-from sklearn.linear_model import Ridge
-from sklearn.preprocessing import StandardScaler
+try:
+    from .fitted_model import CHANNELS, FittedMMM, load_fitted_mmm
+except ImportError:  # executed directly as a script
+    from fitted_model import CHANNELS, FittedMMM, load_fitted_mmm
 
-_here = Path(__file__).resolve().parent
-PROJECT_ROOT = _here
-for _ in range(10):
-    if (PROJECT_ROOT / "requirements.txt").exists():
-        break
-    PROJECT_ROOT = PROJECT_ROOT.parent
 
-DATA_PATH = PROJECT_ROOT / "data" / "mmm" / "model_ready.csv"
+def run_roi_analysis(fitted: FittedMMM | None = None):
+    """Compute per-channel ROI from regression coefficients.
 
-CHANNELS = [
-    "tv", "ooh", "print", "radio", "youtube",
-    "meta", "google", "dv360", "tiktok", "linkedin", "events",
-]
-
-ADSTOCK_COLS = [f"adstock_{ch}" for ch in CHANNELS]
-CONTROL_COLS = ["consumer_confidence_index", "bank_rate_pct", "competitor_spend_weekly"]
-TARGET = "units_sold"
-
-
-def run_roi_analysis():
-    """Compute per-channel ROI from regression coefficients."""
-    df = pd.read_csv(DATA_PATH, parse_dates=["week_start"])
-    df_post = df[df[TARGET] > 0].copy()
-
-    feature_names = ADSTOCK_COLS + CONTROL_COLS
-    X = df_post[feature_names].values
-    y = df_post[TARGET].values
-
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-
-    model = Ridge(alpha=1.0)
-    model.fit(X_scaled, y)
+    Pass ``fitted`` to reuse an already loaded dataset and model.
+    """
+    if fitted is None:
+        fitted = load_fitted_mmm()
+    df_post = fitted.df_post
 
     # Average revenue per unit from post-launch data
-    total_revenue = float(df_post["revenue"].sum())
-    total_units = float(df_post[TARGET].sum())
-    revenue_per_unit = total_revenue / total_units if total_units > 0 else 0
+    total_revenue = fitted.total_revenue
+    total_units = fitted.total_units
+    revenue_per_unit = fitted.revenue_per_unit
 
     channels_result = []
     overall_spend = 0.0
-    overall_revenue = total_revenue
 
     for i, ch in enumerate(CHANNELS):
         adstock_col = f"adstock_{ch}"
         spend_col = f"spend_{ch}"
 
-        coef_scaled = model.coef_[i]
         # Convert scaled coefficient back to original units
-        coef_original = coef_scaled / scaler.scale_[i]
+        coef_original = fitted.coef_original(i)
 
         total_adstock = float(df_post[adstock_col].sum())
         total_spend = float(df_post[spend_col].sum())
@@ -1,9 +1,8 @@
 """Build a high-level MMM data summary from data/mmm/ files."""
 
+import sys
 from pathlib import Path
 
-import pandas as pd
-
 _here = Path(__file__).resolve().parent
 PROJECT_ROOT = _here
 for _ in range(10):
@@ -11,6 +10,12 @@ for _ in range(10):
         break
     PROJECT_ROOT = PROJECT_ROOT.parent
 
+try:
+    from .raw_schemas import MODEL_READY_SCHEMA
+except ImportError:  # run as a standalone script
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from src.platform.api.raw_schemas import MODEL_READY_SCHEMA
+
 MMM_DIR = PROJECT_ROOT / "data" / "mmm"
 DATA_PATH = MMM_DIR / "model_ready.csv"
 
@@ -22,7 +27,7 @@ CHANNELS = [
 
 def build_mmm_summary() -> dict:
     """Return a summary dict of the MMM dataset."""
-    df = pd.read_csv(DATA_PATH, parse_dates=["week_start"])
+    df = MODEL_READY_SCHEMA.read_csv(DATA_PATH)
 
     total_spend = float(df["spend_total"].sum())
     total_units = int(df["units_sold"].sum())
@@ -60,7 +65,6 @@ def build_mmm_summary() -> dict:
 
 if __name__ == "__main__":
     import json
-    import sys
 
     summary = build_mmm_summary()
     json.dump(summary, sys.stdout, indent=2)
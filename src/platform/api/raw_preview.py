@@ -0,0 +1,437 @@
+"""Paged, filtered and sorted previews of raw CSVs backed by a row-offset index.
+
+The first preview of a file scans its bytes once (no CSV parsing) and records
+the byte offset of every ``_INDEX_STRIDE``-th data row, the header, and the
+total row count.  The index is persisted under ``data/processed/row_index/``
+and reused until the file's size or mtime changes, so:
+
+- total row counts come from the index instead of a full parse;
+- page N seeks to the nearest indexed row and parses at most
+  ``_INDEX_STRIDE + limit`` rows;
+- filters and sorting stream the file in chunks with only the needed
+  columns, keeping at most ``offset + limit`` rows in memory.
+
+Row boundaries respect quoted fields, so embedded newlines and commas do not
+shift the index.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass
+import hashlib
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import data_profiles
+from .data_profiles import PROJECT_ROOT, ProfileError, _safe_json_value, resolve_raw_path
+from .raw_schemas import TableSchema, raw_schema
+
+
+logger = logging.getLogger(__name__)
+
+ROW_INDEX_DIR = PROJECT_ROOT / "data" / "processed" / "row_index"
+
+# Bump when the on-disk index layout changes.
+_INDEX_VERSION = 1
+# Every N-th data row gets a byte offset; a page parses at most N-1 rows it then skips.
+_INDEX_STRIDE = int(os.getenv("RAW_PREVIEW_INDEX_STRIDE", "256"))
+_SCAN_BYTES = 4 << 20
+# Rows per chunk when a filter or sort has to stream the whole file.
+_QUERY_CHUNK_ROWS = int(os.getenv("RAW_PREVIEW_CHUNK_ROWS", "100000"))
+
+_NEWLINE = ord("\n")
+_QUOTE = ord('"')
+
+FILTER_OPS = ("eq", "ne", "lt", "le", "gt", "ge", "contains")
+
+
+class PreviewQueryError(ValueError):
+    """Raised when a preview request names unknown columns or malformed filters/sorts."""
+
+
+# ---------------------------------------------------------------------------
+# Row-offset index
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RowIndex:
+    """Header, row count, and byte offsets of rows 0, stride, 2·stride, … of one CSV."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    columns: List[str]
+    rows: int
+    stride: int
+    offsets: np.ndarray
+
+    def is_current(self, stat: os.stat_result) -> bool:
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns and self.stride == _INDEX_STRIDE
+
+
+def _parse_header(raw: bytes) -> List[str]:
+    text = raw.decode("utf-8-sig").rstrip("\r\n")
+    return next(csv.reader(io.StringIO(text)), []) if text else []
+
+
+def build_row_index(path: Path, stat: os.stat_result) -> RowIndex:
+    """Scan ``path`` once for row boundaries (newlines outside quotes); blank lines are not rows."""
+    checkpoints: List[np.ndarray] = []
+    header_end: Optional[int] = None
+    line_start = 0  # start of the line being scanned (absolute byte offset)
+    in_quotes = 0
+    rows = 0
+    position = 0
+
+    with path.open("rb") as f:
+        header_bytes = b""
+        while True:
+            chunk = f.read(_SCAN_BYTES)
+            if not chunk:
+                break
+            data = np.frombuffer(chunk, dtype=np.uint8)
+            # Quote parity after each byte: odd means inside a quoted field ("" toggles twice).
+            parity = (np.cumsum(data == _QUOTE) + in_quotes) & 1
+            in_quotes = int(parity[-1])
+            ends = np.flatnonzero((data == _NEWLINE) & (parity == 0)) + position
+            if header_end is None:
+                header_bytes += chunk
+                if ends.size:
+                    header_end = int(ends[0]) + 1
+                    header_bytes = header_bytes[:header_end]
+                    line_start = header_end
+                    ends = ends[1:]
+            if ends.size:
+                starts = np.concatenate([[line_start], ends[:-1] + 1])
+                blank = ends == starts
+                # "\r\n" blank lines (the lone byte is checked when it lies in this chunk).
+                maybe_cr = np.flatnonzero((ends - starts == 1) & (starts >= position))
+                blank[maybe_cr] = data[starts[maybe_cr] - position] == ord("\r")
+                row_starts = starts[~blank]
+                numbers = np.arange(rows, rows + row_starts.size)
+                checkpoints.append(row_starts[numbers % _INDEX_STRIDE == 0])
+                rows += int(row_starts.size)
+                line_start = int(ends[-1]) + 1
+            position += len(chunk)
+
+    if header_end is None:
+        header_end = position
+    elif line_start < position:
+        # Final row without a trailing newline.
+        if rows % _INDEX_STRIDE == 0:
+            checkpoints.append(np.array([line_start]))
+        rows += 1
+
+    offsets = np.concatenate(checkpoints).astype(np.uint64) if checkpoints else np.empty(0, dtype=np.uint64)
+    return RowIndex(
+        path=str(path),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        columns=_parse_header(header_bytes[:header_end]),
+        rows=rows,
+        stride=_INDEX_STRIDE,
+        offsets=offsets,
+    )
+
+
+def _index_file(path: Path) -> Path:
+    key = hashlib.blake2b(str(path).encode("utf-8"), digest_size=10).hexdigest()
+    return ROW_INDEX_DIR / f"{path.name}.{key}.npz"
+
+
+def _load_persisted(path: Path, stat: os.stat_result) -> Optional[RowIndex]:
+    try:
+        with np.load(_index_file(path), allow_pickle=False) as stored:
+            meta = json.loads(str(stored["meta"][()]))
+            offsets = stored["offsets"]
+    except (OSError, ValueError, KeyError):
+        return None
+    if meta.get("version") != _INDEX_VERSION or meta.get("path") != str(path):
+        return None
+    index = RowIndex(
+        path=meta["path"],
+        size=meta["size"],
+        mtime_ns=meta["mtime_ns"],
+        columns=meta["columns"],
+        rows=meta["rows"],
+        stride=meta["stride"],
+        offsets=offsets,
+    )
+    return index if index.is_current(stat) else None
+
+
+def _persist(path: Path, index: RowIndex) -> None:
+    meta = {
+        "version": _INDEX_VERSION,
+        "path": index.path,
+        "size": index.size,
+        "mtime_ns": index.mtime_ns,
+        "columns": index.columns,
+        "rows": index.rows,
+        "stride": index.stride,
+    }
+    target = _index_file(path)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp.open("wb") as f:
+            np.savez(f, offsets=index.offsets, meta=np.array(json.dumps(meta)))
+        os.replace(tmp, target)
+    except OSError:
+        logger.warning("Could not write row index %s", target, exc_info=True)
+
+
+_indexes: Dict[str, RowIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def row_index(path: Path) -> RowIndex:
+    """Current index for ``path``: from memory, then disk, else rebuilt and persisted."""
+    stat = path.stat()
+    key = str(path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+    if index is not None and index.is_current(stat):
+        return index
+    index = _load_persisted(path, stat)
+    if index is None:
+        index = build_row_index(path, stat)
+        _persist(path, index)
+    with _indexes_lock:
+        _indexes[key] = index
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Query parsing
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ColumnFilter:
+    column: str
+    op: str
+    value: str
+
+
+def parse_filter(text: str) -> ColumnFilter:
+    """Parse ``column:op:value`` (e.g. ``market:eq:GB``, ``spend:gt:1000``)."""
+    parts = text.split(":", 2)
+    if len(parts) != 3 or not parts[0]:
+        raise PreviewQueryError(f"filter must look like column:op:value, got {text!r}")
+    column, op, value = parts
+    if op not in FILTER_OPS:
+        raise PreviewQueryError(f"unknown filter op {op!r}; expected one of {', '.join(FILTER_OPS)}")
+    return ColumnFilter(column, op, value)
+
+
+def parse_sort(text: str) -> Tuple[str, bool]:
+    """``spend`` sorts ascending, ``-spend`` descending; returns (column, ascending)."""
+    column = text.lstrip("-")
+    if not column:
+        raise PreviewQueryError(f"invalid sort key {text!r}")
+    return column, not text.startswith("-")
+
+
+def _filter_value(series: pd.Series, flt: ColumnFilter) -> Any:
+    if series.isna().all():
+        # An all-null chunk of an untyped column parses as float; there is nothing to coerce for.
+        return flt.value
+    try:
+        if pd.api.types.is_bool_dtype(series):
+            return flt.value.strip().lower() in ("true", "1", "yes")
+        if pd.api.types.is_numeric_dtype(series):
+            return float(flt.value)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return pd.Timestamp(flt.value)
+    except (TypeError, ValueError) as exc:
+        raise PreviewQueryError(f"invalid value {flt.value!r} for column {flt.column}") from exc
+    return flt.value
+
+
+def _filter_mask(df: pd.DataFrame, filters: Sequence[ColumnFilter]) -> pd.Series:
+    mask = pd.Series(True, index=df.index)
+    for flt in filters:
+        series = df[flt.column]
+        if flt.op == "contains":
+            mask &= series.astype(str).str.contains(flt.value, case=False, regex=False, na=False)
+            continue
+        value = _filter_value(series, flt)
+        if isinstance(value, str):
+            # Text (and categorical) columns compare as text.
+            series = series.astype(str).where(series.notna())
+        compare: Dict[str, Callable[[], pd.Series]] = {
+            "eq": lambda: series == value,
+            "ne": lambda: series != value,
+            "lt": lambda: series < value,
+            "le": lambda: series <= value,
+            "gt": lambda: series > value,
+            "ge": lambda: series >= value,
+        }
+        mask &= compare[flt.op]().fillna(False).astype(bool)
+    return mask
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+
+def _with_schema(
+    run: Callable[[Optional[TableSchema]], Any], schema: Optional[TableSchema], path: Path
+) -> Tuple[Any, Optional[TableSchema]]:
+    """``run(schema)``, re-run with inferred types if the file drifted from its declaration."""
+    if schema is not None:
+        try:
+            return run(schema), schema
+        except PreviewQueryError:
+            raise
+        except (ValueError, TypeError) as exc:
+            logger.warning("%s does not match its declared schema (%s); inferring types", path.name, exc)
+    return run(None), None
+
+
+def _read_kwargs(schema: Optional[TableSchema]) -> Dict[str, Any]:
+    return schema.read_kwargs() if schema is not None else {}
+
+
+def _read_page(
+    path: Path, index: RowIndex, start: int, count: int, usecols: List[str], schema: Optional[TableSchema]
+) -> pd.DataFrame:
+    """Rows ``[start, start + count)`` parsed from the nearest indexed offset."""
+    if count <= 0 or start >= index.rows:
+        return pd.DataFrame(columns=usecols)
+    checkpoint = start // index.stride
+    with path.open("rb") as f:
+        f.seek(int(index.offsets[checkpoint]))
+        df = pd.read_csv(
+            f,
+            header=None,
+            names=index.columns,
+            usecols=usecols,
+            skiprows=start - checkpoint * index.stride,
+            nrows=count,
+            **_read_kwargs(schema),
+        )
+    return schema.parse_dates(df) if schema is not None else df
+
+
+def _scan_query(
+    path: Path,
+    usecols: List[str],
+    schema: Optional[TableSchema],
+    filters: Sequence[ColumnFilter],
+    sort: Sequence[Tuple[str, bool]],
+    keep: int,
+) -> Tuple[pd.DataFrame, int]:
+    """Stream the file, returning the first ``keep`` matching rows (in sort order) and the match count."""
+    kept: Optional[pd.DataFrame] = None
+    matched = 0
+    with pd.read_csv(path, usecols=usecols, chunksize=_QUERY_CHUNK_ROWS, **_read_kwargs(schema)) as reader:
+        for chunk in reader:
+            if schema is not None:
+                chunk = schema.parse_dates(chunk)
+            if filters:
+                chunk = chunk[_filter_mask(chunk, filters)]
+            matched += len(chunk)
+            if sort:
+                merged = chunk if kept is None else pd.concat([kept, chunk])
+                kept = merged.sort_values(
+                    [column for column, _ in sort],
+                    ascending=[ascending for _, ascending in sort],
+                    kind="stable",
+                    na_position="last",
+                ).head(keep)
+            elif kept is None or len(kept) < keep:
+                kept = chunk.head(keep) if kept is None else pd.concat([kept, chunk.head(keep - len(kept))])
+    if kept is None:
+        kept = pd.DataFrame(columns=usecols)
+    return kept, matched
+
+
+def query_preview(
+    file_name: str,
+    *,
+    offset: int = 0,
+    limit: int = 20,
+    columns: Optional[Sequence[str]] = None,
+    filters: Iterable[str] = (),
+    sort: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """One page of a raw file.
+
+    CSVs support column projection, ``column:op:value`` filters and ``[-]column``
+    sort keys; ``rows`` is the file's total from the row index and
+    ``matched_rows`` the count after filtering.  Other files return their
+    line count and first 1 KiB of text.
+    """
+    path = resolve_raw_path(file_name)
+    if not path.is_file():
+        raise ProfileError(f"file does not exist: {file_name}")
+    relative = str(path.relative_to(data_profiles.RAW_DATA_DIR))
+
+    if path.suffix.lower() != ".csv":
+        with path.open("r", encoding="utf-8") as f:
+            text = f.read()
+        return {
+            "file_name": relative,
+            "rows": len(text.splitlines()),
+            "columns": ["text"],
+            "preview_rows": [_safe_json_value(text[:1024])],
+        }
+
+    if offset < 0 or limit < 1:
+        raise PreviewQueryError("offset must be >= 0 and limit >= 1")
+    parsed_filters = [parse_filter(text) for text in filters]
+    parsed_sort = [parse_sort(text) for text in sort]
+
+    index = row_index(path)
+    selected = list(columns) if columns else list(index.columns)
+    needed = [*selected, *(f.column for f in parsed_filters), *(column for column, _ in parsed_sort)]
+    unknown = sorted({column for column in needed if column not in index.columns})
+    if unknown:
+        raise PreviewQueryError(f"unknown columns: {', '.join(unknown)}")
+    usecols = [column for column in index.columns if column in set(needed)]
+    schema = raw_schema(relative)
+
+    try:
+        if parsed_filters or parsed_sort:
+            (page, matched), schema = _with_schema(
+                lambda applied: _scan_query(path, usecols, applied, parsed_filters, parsed_sort, offset + limit),
+                schema,
+                path,
+            )
+            page = page.iloc[offset:]
+        else:
+            page, schema = _with_schema(
+                lambda applied: _read_page(path, index, offset, limit, usecols, applied), schema, path
+            )
+            matched = index.rows
+    except PreviewQueryError:
+        raise
+    except Exception as exc:
+        raise ProfileError(f"failed to read {path.name}: {exc}") from exc
+
+    page = page[selected]
+    if schema is not None:
+        page = schema.format_dates(page)
+    return {
+        "file_name": relative,
+        "rows": index.rows,
+        "columns": selected,
+        "offset": offset,
+        "limit": limit,
+        "matched_rows": matched,
+        "has_more": offset + len(page) < matched,
+        "preview_rows": _safe_json_value(page.to_dict(orient="records")),
+    }
@@ -0,0 +1,269 @@
+"""Declared column types for the raw CSVs and the MMM model-ready table.
+
+Column lists and types mirror what ``data/generators`` writes and what
+``docs/prd/dashboard_checks.yml`` validates.  Loaders read with these
+declarations instead of letting pandas infer types:
+
+- low-cardinality text (market, model, channel, device, stage, utm_* …) is
+  read straight into ``category``;
+- identifiers and free text stay ``str``;
+- date columns are parsed once with their exact format, so profiling never
+  has to sniff which columns hold dates.
+
+A file that no longer matches its declaration (a new blank in an integer
+column, a reformatted date) raises ``ValueError`` from ``TableSchema.read_csv``;
+callers fall back to an inferred read.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+import pandas as pd
+
+_CAT = "category"
+_STR = "str"
+_INT = "int64"
+_FLOAT = "float64"
+_BOOL = "bool"
+
+_DAY = "%Y-%m-%d"
+_MONTH = "%Y-%m"
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Declared ``read_csv`` dtypes plus date columns (column → strptime format)."""
+
+    name: str
+    dtypes: Mapping[str, str]
+    dates: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def columns(self) -> list[str]:
+        return [*self.dates, *self.dtypes]
+
+    @property
+    def categoricals(self) -> list[str]:
+        return [column for column, dtype in self.dtypes.items() if dtype == _CAT]
+
+    def read_kwargs(self) -> Dict[str, Any]:
+        # Dates are read as text and parsed afterwards with their declared format.
+        return {"dtype": {**{column: _STR for column in self.dates}, **self.dtypes}}
+
+    def parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the declared date columns present in ``df`` in place; raises ``ValueError`` on drift."""
+        for column, date_format in self.dates.items():
+            if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[column] = pd.to_datetime(df[column], format=date_format)
+        return df
+
+    def format_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Copy of ``df`` with parsed date columns rendered back in their declared format."""
+        out = df.copy()
+        for column, date_format in self.dates.items():
+            if column in out.columns and pd.api.types.is_datetime64_any_dtype(out[column]):
+                out[column] = out[column].dt.strftime(date_format)
+        return out
+
+    def read_csv(self, source: Any, **kwargs: Any) -> pd.DataFrame:
+        return self.parse_dates(pd.read_csv(source, **self.read_kwargs(), **kwargs))
+
+    def iter_csv(self, source: Any, chunksize: int, **kwargs: Any) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(source, chunksize=chunksize, **self.read_kwargs(), **kwargs) as reader:
+            for chunk in reader:
+                yield self.parse_dates(chunk)
+
+
+def _table(name: str, *, dates: Optional[Mapping[str, str]] = None, **dtypes: str) -> TableSchema:
+    return TableSchema(name=name, dtypes=dtypes, dates=dict(dates or {}))
+
+
+# ---------------------------------------------------------------------------
+# data/raw/*.csv
+# ---------------------------------------------------------------------------
+
+_RAW_TABLES = [
+    # Digital media (data/generators/digital_media.py)
+    _table(
+        "meta_ads.csv",
+        dates={"date": _DAY},
+        campaign_name=_STR, campaign_id=_STR, platform=_CAT, objective=_CAT, market=_CAT, model=_CAT,
+        impressions=_INT, clicks=_INT, ctr=_FLOAT, cpm=_FLOAT, cpc=_FLOAT, spend=_FLOAT,
+        reach=_INT, frequency=_FLOAT, video_views=_INT, video_view_rate=_FLOAT, leads=_INT,
+        link_clicks=_INT, landing_page_views=_INT, cost_per_lead=_FLOAT,
+    ),
+    _table(
+        "google_ads.csv",
+        dates={"date": _DAY},
+        campaign_name=_STR, campaign_id=_STR, campaign_type=_CAT, market=_CAT, model=_CAT,
+        keyword_group=_CAT, impressions=_INT, clicks=_INT, ctr=_FLOAT, avg_cpc=_FLOAT, spend=_FLOAT,
+        conversions=_INT, conversion_rate=_FLOAT, cost_per_conversion=_FLOAT, quality_score=_INT,
+        impression_share=_FLOAT, search_impression_share=_FLOAT,
+    ),
+    _table(
+        "dv360.csv",
+        dates={"date": _DAY},
+        insertion_order=_STR, line_item_name=_STR, line_item_id=_STR, market=_CAT, model=_CAT,
+        creative_size=_CAT, exchange=_CAT, impressions=_INT, clicks=_INT, ctr=_FLOAT, cpm=_FLOAT,
+        spend=_FLOAT, viewable_impressions=_INT, viewability_rate=_FLOAT, video_completions=_INT,
+        video_completion_rate=_FLOAT,
+    ),
+    _table(
+        "tiktok_ads.csv",
+        dates={"date": _DAY},
+        campaign_name=_STR, campaign_id=_STR, objective=_CAT, market=_CAT, model=_CAT,
+        impressions=_INT, clicks=_INT, ctr=_FLOAT, cpm=_FLOAT, spend=_FLOAT, video_views=_INT,
+        video_view_rate=_FLOAT, avg_watch_time_seconds=_FLOAT, shares=_INT, comments=_INT,
+        likes=_INT, profile_visits=_INT, website_clicks=_INT,
+    ),
+    _table(
+        "youtube_ads.csv",
+        dates={"date": _DAY},
+        campaign_name=_STR, campaign_id=_STR, format=_CAT, market=_CAT, model=_CAT,
+        impressions=_INT, views=_INT, view_rate=_FLOAT, clicks=_INT, ctr=_FLOAT, cpv=_FLOAT,
+        cpm=_FLOAT, spend=_FLOAT, video_played_25=_INT, video_played_50=_INT, video_played_75=_INT,
+        video_played_100=_INT, earned_views=_INT, earned_subscribers=_INT,
+    ),
+    _table(
+        "linkedin_ads.csv",
+        dates={"date": _DAY},
+        campaign_name=_STR, campaign_id=_STR, objective=_CAT, market=_CAT, model=_CAT,
+        impressions=_INT, clicks=_INT, ctr=_FLOAT, cpm=_FLOAT, cpc=_FLOAT, spend=_FLOAT,
+        leads=_INT, cost_per_lead=_FLOAT, social_actions=_INT, follower_gains=_INT,
+        company_page_clicks=_INT,
+    ),
+    # Traditional media (data/generators/traditional_media.py)
+    _table(
+        "tv_performance.csv",
+        dates={"date_week_start": _DAY},
+        broadcaster=_CAT, daypart=_CAT, market=_CAT, spot_length_seconds=_INT, spots_aired=_INT,
+        grps=_FLOAT, reach_000=_INT, reach_pct=_FLOAT, avg_frequency=_FLOAT, cpp=_FLOAT,
+        spend=_FLOAT, programme_name=_CAT,
+    ),
+    _table(
+        "ooh_performance.csv",
+        dates={"start_date": _DAY, "end_date": _DAY},
+        campaign_name=_STR, campaign_id=_STR, market=_CAT, format=_CAT, vendor=_CAT,
+        sites_booked=_INT, impressions=_INT, reach_000=_INT, frequency=_FLOAT, spend=_FLOAT,
+        region=_CAT, city=_CAT,
+    ),
+    _table(
+        "print_performance.csv",
+        dates={"date": _DAY},
+        publication=_CAT, edition=_CAT, format=_CAT, market=_CAT, model=_CAT,
+        rate_card_cost=_FLOAT, negotiated_cost=_FLOAT, spend=_FLOAT, circulation=_INT,
+        readership_000=_INT, page_number=_INT, creative_id=_STR,
+    ),
+    _table(
+        "radio_performance.csv",
+        dates={"start_date": _DAY, "end_date": _DAY},
+        campaign_name=_STR, station=_CAT, station_group=_CAT, market=_CAT, daypart=_CAT,
+        spots_per_day=_INT, total_spots=_INT, reach_000=_INT, frequency=_FLOAT, cpm=_FLOAT,
+        spend=_FLOAT, region=_CAT,
+    ),
+    # Sales pipeline (data/generators/sales_pipeline.py)
+    _table(
+        "vehicle_sales.csv",
+        dates={"date": _DAY},
+        sale_id=_STR, model=_CAT, trim=_CAT, dealer_id=_CAT, market=_CAT, price_gbp=_INT,
+        finance_type=_CAT, lead_id=_STR, source=_CAT,
+    ),
+    _table(
+        "leads.csv",
+        dates={"created_date": _DAY, "stage_updated_date": _DAY},
+        lead_id=_STR, source=_CAT, model=_CAT, dealer_id=_CAT, stage=_CAT, market=_CAT,
+        finance_type=_CAT, is_qualified=_BOOL,
+    ),
+    _table(
+        "test_drives.csv",
+        dates={"booking_date": _DAY, "test_drive_date": _DAY},
+        booking_id=_STR, lead_id=_STR, dealer_id=_CAT, model=_CAT, outcome=_CAT,
+        duration_min=_INT, converted_to_sale=_BOOL, market=_CAT,
+    ),
+    _table(
+        "website_analytics.csv",
+        dates={"date": _DAY},
+        channel=_CAT, device=_CAT, sessions=_INT, users=_INT, new_users=_INT, bounce_rate=_FLOAT,
+        avg_session_duration_sec=_FLOAT, pages_per_session=_FLOAT, configurator_starts=_INT,
+    ),
+    _table(
+        "configurator_sessions.csv",
+        dates={"date": _DAY},
+        session_id=_STR, model=_CAT, trim=_CAT, device=_CAT, utm_source=_CAT, utm_medium=_CAT,
+        utm_campaign=_STR, duration_sec=_INT, steps_completed=_INT, completed=_BOOL,
+        lead_submitted=_BOOL, market=_CAT,
+    ),
+    # External data (data/generators/external_data.py, events.py, contracts.py)
+    _table(
+        "competitor_spend.csv",
+        dates={"year_month": _MONTH},
+        competitor=_CAT, channel=_CAT, estimated_spend_gbp=_FLOAT, share_of_voice_pct=_FLOAT,
+        source=_CAT,
+    ),
+    _table(
+        "economic_indicators.csv",
+        dates={"year_month": _MONTH},
+        country=_CAT, smmt_total_registrations=_INT, smmt_bev_registrations=_INT,
+        bev_market_share_pct=_FLOAT, consumer_confidence_index=_FLOAT, bank_rate_pct=_FLOAT,
+        avg_petrol_price_ppl=_FLOAT, avg_electricity_price_pkwh=_FLOAT,
+        unemployment_rate_pct=_FLOAT, cpi_index=_FLOAT, new_car_avg_transaction_price_gbp=_INT,
+    ),
+    _table(
+        "events.csv",
+        dates={"start_date": _DAY, "end_date": _DAY},
+        event_name=_STR, event_type=_CAT, location=_STR, market=_CAT, estimated_attendance=_INT,
+        media_impressions=_INT, spend=_FLOAT, leads_generated=_INT, test_drives_completed=_INT,
+        description=_STR,
+    ),
+    _table(
+        "sla_tracking.csv",
+        dates={"year_month": _MONTH},
+        vendor=_CAT, contract_type=_CAT, metric_name=_CAT, contracted_value=_FLOAT,
+        actual_value=_FLOAT, variance_pct=_FLOAT, in_compliance=_BOOL, notes=_CAT,
+    ),
+]
+
+RAW_SCHEMAS: Dict[str, TableSchema] = {table.name: table for table in _RAW_TABLES}
+
+
+# ---------------------------------------------------------------------------
+# data/mmm/model_ready.csv (validators.aggregate_mmm_data)
+# ---------------------------------------------------------------------------
+
+MMM_CHANNELS = [
+    "tv", "ooh", "print", "radio", "youtube",
+    "meta", "google", "dv360", "tiktok", "linkedin", "events",
+]
+
+MODEL_READY_SCHEMA = TableSchema(
+    name="model_ready.csv",
+    dates={"week_start": _DAY},
+    dtypes={
+        **{f"spend_{ch}": _FLOAT for ch in MMM_CHANNELS},
+        "spend_total": _FLOAT,
+        "units_sold": _FLOAT,
+        "revenue": _FLOAT,
+        "units_gb": _FLOAT,
+        "units_de": _FLOAT,
+        "units_fr": _FLOAT,
+        "test_drives": _FLOAT,
+        "leads": _FLOAT,
+        "web_sessions": _FLOAT,
+        **{f"adstock_{ch}": _FLOAT for ch in MMM_CHANNELS},
+        "consumer_confidence_index": _FLOAT,
+        "bank_rate_pct": _FLOAT,
+        "bev_market_share_pct": _FLOAT,
+        "cpi_index": _FLOAT,
+        "competitor_spend_weekly": _FLOAT,
+        "seasonal_index": _FLOAT,
+    },
+)
+
+
+def raw_schema(file_name: str) -> Optional[TableSchema]:
+    """Declared schema for a file under data/raw (``meta_ads.csv``), or None if undeclared."""
+    return RAW_SCHEMAS.get(Path(file_name).as_posix())
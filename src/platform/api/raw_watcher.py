@@ -0,0 +1,403 @@
+"""Watch data/raw and push incremental overview diffs to subscribers.
+
+A background thread waits for filesystem activity: inotify on Linux (through
+libc via ctypes), otherwise a timed ``stat`` poll.  Each pass compares the
+``raw_fingerprint()`` of data/raw with the previous pass to find the files
+that were created, modified, or deleted.  Only those are folded into a
+``RawDataState``, which re-profiles them and re-evaluates just the checks that
+read them.  The resulting diff goes out on a ``ChangeFeed`` (served as SSE by
+the API), and the new snapshot is installed in the overview cache so the
+summary endpoints stay current without a rescan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from . import data_profiles
+from .data_profiles import RawDataState
+
+
+logger = logging.getLogger(__name__)
+
+_WATCH_ENABLED = os.getenv("RAW_WATCH_ENABLED", "1").lower() not in {"0", "false", "no"}
+# "auto" uses inotify where available and falls back to polling.
+_WATCH_BACKEND = os.getenv("RAW_WATCH_BACKEND", "auto")
+_POLL_SECONDS = float(os.getenv("RAW_WATCH_POLL_SECONDS", "2"))
+# Quiet period after the last inotify event before a pass, so a burst of writes is one diff.
+_SETTLE_SECONDS = float(os.getenv("RAW_WATCH_SETTLE_SECONDS", "0.5"))
+_FEED_HISTORY = int(os.getenv("RAW_WATCH_HISTORY", "100"))
+_SUBSCRIBER_QUEUE_SIZE = 64
+_KEEPALIVE_SECONDS = 15.0
+
+
+# ---------------------------------------------------------------------------
+# Change detection backends
+# ---------------------------------------------------------------------------
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BYTES = 64 * 1024
+
+
+class _InotifyBackend:
+    """Wakes on inotify events for data/raw (recursively) and the rules file's directory.
+
+    Events are only a wake-up: which files changed is decided by comparing
+    fingerprints, so overflowed or coalesced events cannot lose a change.
+    """
+
+    name = "inotify"
+
+    def __init__(self, raw_dir: Path, rules_dir: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._libc = libc
+        self._fd = fd
+        self._raw_dir = raw_dir
+        self._watches: Dict[int, str] = {}
+        try:
+            self._watch(str(raw_dir), recursive=True, required=True)
+            self._watch(str(rules_dir), recursive=False, required=False)
+        except OSError:
+            os.close(fd)
+            raise
+
+    def _add_watch(self, directory: str) -> int:
+        if directory in self._watches.values():
+            return 0
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._watches[wd] = directory
+        return wd
+
+    def _watch(self, root: str, *, recursive: bool, required: bool) -> None:
+        try:
+            self._add_watch(root)
+        except OSError:
+            if required:
+                raise
+            logger.warning("Not watching %s", root, exc_info=True)
+            return
+        if not recursive:
+            return
+        for directory, subdirectories, _ in os.walk(root):
+            for subdirectory in subdirectories:
+                try:
+                    self._add_watch(os.path.join(directory, subdirectory))
+                except OSError:
+                    logger.warning("Not watching %s", subdirectory, exc_info=True)
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds; True when something under a watch changed."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            data = os.read(self._fd, _READ_BYTES)
+        except BlockingIOError:
+            return False
+        new_directory = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size + length
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+            elif mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                new_directory = True
+        if new_directory:
+            self._watch(str(self._raw_dir), recursive=True, required=False)
+        return True
+
+    def settle(self, quiet_seconds: float) -> None:
+        """Drain events until none arrive for ``quiet_seconds``."""
+        while self.wait(quiet_seconds):
+            pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """Wakes every ``interval`` seconds; the fingerprint comparison finds the changes."""
+
+    name = "polling"
+
+    def __init__(self, interval: float, stop: threading.Event) -> None:
+        self._interval = interval
+        self._stop = stop
+
+    def wait(self, timeout: float) -> bool:
+        return not self._stop.wait(self._interval)
+
+    def settle(self, quiet_seconds: float) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Change feed
+# ---------------------------------------------------------------------------
+
+class ChangeFeed:
+    """Fan-out of watcher events to asyncio subscribers, with a short replay history.
+
+    ``publish`` may be called from any thread.  Every event carries an ``id``
+    of ``<epoch>-<seq>`` (the SSE event id).  A subscriber that reconnects with
+    ``Last-Event-ID`` is replayed what it missed.  It is sent a ``reset``
+    instead when the history no longer reaches back that far, when the id
+    comes from another process, or when its queue overflowed; a client
+    refetches the summary on ``reset``.
+    """
+
+    def __init__(self, history: int = _FEED_HISTORY, queue_size: int = _SUBSCRIBER_QUEUE_SIZE) -> None:
+        self.epoch = uuid.uuid4().hex[:12]
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._subscribers: Dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+
+    @property
+    def subscribers(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def _event(self, event_type: str, seq: int, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {"type": event_type, "id": f"{self.epoch}-{seq}", "seq": seq, **(payload or {})}
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._seq += 1
+            event = self._event(event_type, self._seq, payload)
+            self._history.append(event)
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:
+                # The subscriber's loop has shut down; its generator cleans up.
+                continue
+        return event
+
+    def _offer(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this far behind refetches instead of replaying a backlog.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(self._event("reset", event["seq"]))
+
+    def _missed_locked(self, last_event_id: Optional[str]) -> List[Dict[str, Any]]:
+        if not last_event_id:
+            return []
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch == self.epoch and seq.isdigit():
+            last_seq = int(seq)
+            if last_seq >= self._seq:
+                return []
+            if self._history and self._history[0]["seq"] <= last_seq + 1:
+                return [event for event in self._history if event["seq"] > last_seq]
+        return [self._event("reset", self._seq)]
+
+    async def subscribe(
+        self,
+        last_event_id: Optional[str] = None,
+        keepalive_seconds: float = _KEEPALIVE_SECONDS,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield events as they are published; ``None`` after each idle ``keepalive_seconds``."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+            backlog = self._missed_locked(last_event_id)
+            last_seq = backlog[-1]["seq"] if backlog else self._seq
+        try:
+            for event in backlog:
+                yield event
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), keepalive_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event["seq"] <= last_seq and event["type"] != "reset":
+                    continue
+                last_seq = max(last_seq, event["seq"])
+                yield event
+        finally:
+            with self._lock:
+                self._subscribers.pop(queue, None)
+
+
+# ---------------------------------------------------------------------------
+# Watcher
+# ---------------------------------------------------------------------------
+
+def _entries(fingerprint: Hashable) -> Dict[str, Tuple[int, int]]:
+    files, _rules_mtime = fingerprint
+    return {name: (size, mtime_ns) for name, size, mtime_ns in files}
+
+
+class RawDataWatcher:
+    """Background thread turning data/raw changes into ``diff`` events and fresh snapshots."""
+
+    def __init__(
+        self,
+        feed: ChangeFeed,
+        *,
+        state: Optional[RawDataState] = None,
+        backend: str = _WATCH_BACKEND,
+        poll_seconds: float = _POLL_SECONDS,
+        settle_seconds: float = _SETTLE_SECONDS,
+        publish_snapshot: Optional[Callable[[Dict[str, Any], Hashable], None]] = None,
+    ) -> None:
+        self.feed = feed
+        self.state = state or RawDataState()
+        self.backend = backend
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self._publish_snapshot = publish_snapshot or data_profiles.publish_overview
+        self._fingerprint: Optional[Hashable] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.backend_name: Optional[str] = None
+
+    def sync(self) -> Optional[Dict[str, Any]]:
+        """Fold whatever changed since the last pass into the state.
+
+        The first pass loads the full state.  Returns the published ``diff``
+        event, or None when no file or check result changed.
+        """
+        fingerprint = data_profiles.raw_fingerprint()
+        if self._fingerprint is None:
+            self._publish_snapshot(self.state.load(), fingerprint)
+            self._fingerprint = fingerprint
+            return None
+        if fingerprint == self._fingerprint:
+            return None
+
+        before, after = _entries(self._fingerprint), _entries(fingerprint)
+        changed = sorted(name for name in before.keys() | after.keys() if before.get(name) != after.get(name))
+        diff = self.state.apply(changed)
+        self._publish_snapshot(self.state.overview(), fingerprint)
+        self._fingerprint = fingerprint
+        if not (diff["created"] or diff["modified"] or diff["deleted"] or diff["checks"] or diff["rules_changed"]):
+            return None
+        return self.feed.publish("diff", diff)
+
+    def _open_backend(self) -> Any:
+        if self.backend in {"auto", "inotify"}:
+            try:
+                return _InotifyBackend(data_profiles.RAW_DATA_DIR, data_profiles.RULES_PATH.parent)
+            except (OSError, AttributeError):
+                if self.backend == "inotify":
+                    raise
+                logger.info("inotify unavailable; polling data/raw every %ss", self.poll_seconds)
+        return _PollingBackend(self.poll_seconds, self._stop)
+
+    def _sync_safely(self) -> None:
+        try:
+            self.sync()
+        except Exception:
+            logger.exception("Raw data watcher pass failed; reloading on the next change")
+            self._fingerprint = None
+            self.feed.publish("reset", {})
+
+    def _run(self) -> None:
+        backend = self._open_backend()
+        self.backend_name = backend.name
+        try:
+            self._sync_safely()
+            while not self._stop.is_set():
+                if not backend.wait(min(self.poll_seconds, 1.0)):
+                    continue
+                backend.settle(self.settle_seconds)
+                if not self._stop.is_set():
+                    self._sync_safely()
+        finally:
+            backend.close()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="raw-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+
+_feed = ChangeFeed()
+_watcher: Optional[RawDataWatcher] = None
+
+
+def change_feed() -> ChangeFeed:
+    return _feed
+
+
+def watcher_running() -> bool:
+    return _watcher is not None and _watcher.running
+
+
+def start_raw_watcher() -> bool:
+    """Start watching data/raw unless ``RAW_WATCH_ENABLED`` is off; True when running."""
+    global _watcher
+    if not _WATCH_ENABLED:
+        return False
+    if _watcher is None or not _watcher.running:
+        # The watcher publishes every snapshot; requests must not scan on their own meanwhile.
+        data_profiles.serve_published_overview(True)
+        _watcher = RawDataWatcher(_feed)
+        _watcher.start()
+    return True
+
+
+def stop_raw_watcher() -> None:
+    global _watcher
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
+        data_profiles.serve_published_overview(False)
@@ -15,12 +15,29 @@ from qdrant_client import QdrantClient
 
 load_dotenv()
 
+from src.rag.data_processing.dedup import (
+    DEDUP_MODES,
+    DedupReport,
+    suppress_near_duplicates,
+)
 from src.rag.data_processing.ingest import (
+    CHUNKER_VERSION,
+    discover_asset_sources,
+    discover_text_sources,
     load_all_text_documents,
     load_asset_documents,
-    load_config_document,
+    load_config_documents,
     load_contract_documents,
     load_csv_documents,
+    load_source_documents,
+)
+from src.rag.data_processing.manifest import (
+    ChangeSet,
+    ManifestEntry,
+    apply_change_set,
+    compute_change_set,
+    load_manifest,
+    save_manifest,
 )
 from src.rag.embeddings.indexer import RAGIndexer
 
@@ -29,6 +46,8 @@ _ASSET_COLLECTION = "campaign_assets"
 _DEFAULT_QDRANT_PATH = "data/qdrant_db"
 _DEFAULT_BM25_PATH = "data/index/bm25"
 _EMBEDDING_COST_PER_1M_TOKENS_USD = 0.13
+_DEFAULT_DEDUP_THRESHOLD = 0.9
+_DEFAULT_MANIFEST_PATH = "data/processed/ingest_manifest.json"
 
 
 @dataclass(frozen=True)
@@ -111,6 +130,40 @@ def build_arg_parser() -> argparse.ArgumentParser:
             "config.py, and asset_manifest.csv."
         ),
     )
+    parser.add_argument(
+        "--dedup-mode",
+        choices=DEDUP_MODES,
+        default="tag",
+        help=(
+            "Near-duplicate text chunk handling before embedding: tag them for result "
+            "de-duplication (default), collapse clones into a representative chunk "
+            "(tabular chunks only when identical), or off."
+        ),
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=_DEFAULT_DEDUP_THRESHOLD,
+        metavar="FLOAT",
+        help="MinHash similarity in (0, 1] at which text chunks count as near-duplicates.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only load, chunk, and embed files added or modified since the last "
+            "incremental build, and delete chunks of modified or removed files."
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        default=_DEFAULT_MANIFEST_PATH,
+        metavar="PATH",
+        help=(
+            "Ingest manifest written by every full build and read by --incremental "
+            "(default: %(default)s)."
+        ),
+    )
     return parser
 
 
@@ -138,7 +191,7 @@ def _load_sample_text_documents(project_root: Path) -> list[Document]:
             / "MediaAgency_Terms_of_Business.md"
         )
     )
-    docs.append(load_config_document())
+    docs.extend(load_config_documents())
     return docs
 
 
@@ -249,6 +302,43 @@ def _print_estimate(docs: LoadedDocuments, totals: dict[str, int | float]) -> No
     print(f"- estimated_cost_usd={totals['estimated_cost_usd']:.8f}")
 
 
+def _print_dedup_report(report: DedupReport) -> None:
+    """Print near-duplicate suppression outcome and embedding cost avoided."""
+    cost_saved_usd = (report.tokens_saved / 1_000_000) * _EMBEDDING_COST_PER_1M_TOKENS_USD
+    print("Near-duplicate suppression:")
+    print(f"- mode={report.mode}, threshold={report.threshold}")
+    print(f"- duplicate_groups={report.duplicate_groups}")
+    print(f"- duplicates={report.duplicates}")
+    print(f"- chunks={report.chunks_in}->{report.chunks_out}")
+    print(f"- estimated_tokens_saved={report.tokens_saved}")
+    print(f"- estimated_cost_saved_usd={cost_saved_usd:.8f}")
+
+
+def _print_change_set(change_set: ChangeSet) -> None:
+    """Print the per-target add/modify/remove summary of an incremental build."""
+    print(f"Changes ({change_set.target}):")
+    print(f"- added={len(change_set.added)}")
+    print(f"- modified={len(change_set.modified)}")
+    print(f"- removed={len(change_set.removed)}")
+    print(f"- unchanged={len(change_set.unchanged)}")
+    for label, rel_paths in (
+        ("+", change_set.added),
+        ("~", change_set.modified),
+        ("-", change_set.removed),
+    ):
+        for rel_path in rel_paths:
+            print(f"  {label} {rel_path}")
+
+
+def _chunk_ids_by_file(docs: list[Document]) -> dict[str, list[str]]:
+    """Group chunk ids by the project-relative source file that produced them."""
+    grouped: dict[str, list[str]] = {}
+    for doc in docs:
+        source_file = str((doc.metadata or {}).get("source_file", ""))
+        grouped.setdefault(source_file, []).append(doc.doc_id)
+    return grouped
+
+
 def _validate_cost_cap(max_cost_usd: float | None, estimated_cost_usd: float) -> tuple[bool, str]:
     """Validate optional cost ceiling before build."""
     if max_cost_usd is None:
@@ -266,13 +356,162 @@ def _validate_cost_cap(max_cost_usd: float | None, estimated_cost_usd: float) ->
     return (True, "")
 
 
+def run_incremental(args: argparse.Namespace, targets: BuildTargets) -> int:
+    """Build only what changed since the manifest was last written.
+
+    A target with no manifest entries yet gets a full rebuild so the manifest
+    and the indexes start out in agreement.
+    """
+    project_root = _get_project_root()
+    manifest_path = _resolve_project_path(args.manifest)
+    entries = load_manifest(manifest_path)
+
+    change_sets: list[ChangeSet] = []
+    if targets.include_text:
+        change_sets.append(
+            compute_change_set(
+                "text", discover_text_sources(), entries, project_root, CHUNKER_VERSION
+            )
+        )
+    if targets.include_assets:
+        change_sets.append(
+            compute_change_set(
+                "assets", discover_asset_sources(), entries, project_root, CHUNKER_VERSION
+            )
+        )
+    for change_set in change_sets:
+        _print_change_set(change_set)
+
+    if not any(change_set.has_changes for change_set in change_sets):
+        updated = entries
+        for change_set in change_sets:
+            updated = apply_change_set(updated, change_set, {}, CHUNKER_VERSION)
+        if updated != entries and not args.dry_run:
+            save_manifest(manifest_path, updated)
+        print("No changes detected; indexes are up to date.")
+        return 0
+
+    loaded: dict[str, list[Document]] = {}
+    for change_set in change_sets:
+        target_docs: list[Document] = []
+        for rel_path in change_set.changed:
+            target_docs.extend(load_source_documents(project_root / rel_path))
+        loaded[change_set.target] = target_docs
+
+    text_docs = loaded.get("text", [])
+    if text_docs and args.dedup_mode != "off":
+        text_docs, dedup_report = suppress_near_duplicates(
+            text_docs,
+            threshold=args.dedup_threshold,
+            mode=args.dedup_mode,
+        )
+        loaded["text"] = text_docs
+        _print_dedup_report(dedup_report)
+
+    docs = LoadedDocuments(text_docs=loaded.get("text", []), asset_docs=loaded.get("assets", []))
+    totals = _estimate_documents(docs.text_docs + docs.asset_docs)
+    _print_estimate(docs, totals)
+
+    is_valid, reason = _validate_cost_cap(
+        max_cost_usd=args.max_cost_usd,
+        estimated_cost_usd=float(totals["estimated_cost_usd"]),
+    )
+    if not is_valid:
+        print(reason)
+        return 1
+
+    if args.dry_run:
+        print("Dry run complete. No indexes were built.")
+        return 0
+
+    indexer = RAGIndexer()
+    updated: dict[str, ManifestEntry] = entries
+    for change_set in change_sets:
+        target_docs = loaded[change_set.target]
+        removed_ids = list(change_set.removed_chunk_ids)
+        first_build = not any(entry.target == change_set.target for entry in entries.values())
+
+        if change_set.target == "text":
+            if first_build:
+                if target_docs:
+                    indexer.build_text_index(target_docs)
+                    indexer.build_bm25_index(target_docs, rebuild=True)
+            elif change_set.has_changes:
+                indexer.update_text_index(target_docs, removed_ids)
+                indexer.update_bm25_index(target_docs, removed_ids)
+        elif first_build:
+            if target_docs:
+                indexer.build_asset_index(target_docs)
+        elif change_set.has_changes:
+            indexer.update_asset_index(target_docs, removed_ids)
+
+        if change_set.has_changes:
+            print(
+                f"Updated {change_set.target}: +{len(target_docs)} chunks, "
+                f"-{len(removed_ids)} chunks."
+            )
+        updated = apply_change_set(
+            updated,
+            change_set,
+            _chunk_ids_by_file(target_docs),
+            CHUNKER_VERSION,
+        )
+
+    save_manifest(manifest_path, updated)
+    print(f"Wrote ingest manifest to {manifest_path}.")
+    return 0
+
+
+def _save_full_build_manifest(manifest_path: Path, built: dict[str, list[Document]]) -> None:
+    """Record what a full build indexed so the next --incremental run diffs against it.
+
+    Entries of the rebuilt targets are replaced wholesale; entries of targets
+    that were not rebuilt are carried over.
+    """
+    project_root = _get_project_root()
+    entries = {
+        rel_path: entry
+        for rel_path, entry in load_manifest(manifest_path).items()
+        if entry.target not in built
+    }
+    discover = {"text": discover_text_sources, "assets": discover_asset_sources}
+    for target, target_docs in built.items():
+        change_set = compute_change_set(
+            target, discover[target](), entries, project_root, CHUNKER_VERSION
+        )
+        entries = apply_change_set(
+            entries, change_set, _chunk_ids_by_file(target_docs), CHUNKER_VERSION
+        )
+    save_manifest(manifest_path, entries)
+    print(f"Wrote ingest manifest to {manifest_path}.")
+
+
 def run(args: argparse.Namespace) -> int:
     """Execute CLI behavior from parsed arguments."""
     if args.check:
         return check_indexes()
 
+    if not 0.0 < args.dedup_threshold <= 1.0:
+        print("Error: --dedup-threshold must be in (0, 1].")
+        return 1
+
     targets = _resolve_targets(args)
+    if args.incremental:
+        if args.sample:
+            print("Error: --incremental cannot be combined with --sample.")
+            return 1
+        return run_incremental(args, targets)
+
     docs = _load_documents(targets, sample=args.sample)
+    if docs.text_docs and args.dedup_mode != "off":
+        text_docs, dedup_report = suppress_near_duplicates(
+            docs.text_docs,
+            threshold=args.dedup_threshold,
+            mode=args.dedup_mode,
+        )
+        docs = LoadedDocuments(text_docs=text_docs, asset_docs=docs.asset_docs)
+        _print_dedup_report(dedup_report)
+
     all_docs = docs.text_docs + docs.asset_docs
     totals = _estimate_documents(all_docs)
     _print_estimate(docs, totals)
@@ -290,13 +529,15 @@ def run(args: argparse.Namespace) -> int:
         return 0
 
     indexer = RAGIndexer()
+    built: dict[str, list[Document]] = {}
 
     if targets.include_text:
         if not docs.text_docs:
             print("No text documents loaded. Skipping text_documents and BM25 builds.")
         else:
             indexer.build_text_index(docs.text_docs)
-            indexer.build_bm25_index(docs.text_docs)
+            indexer.build_bm25_index(docs.text_docs, rebuild=True)
+            built["text"] = docs.text_docs
             print(f"Built text_documents + BM25 from {len(docs.text_docs)} chunks.")
 
     if targets.include_assets:
@@ -304,8 +545,13 @@ def run(args: argparse.Namespace) -> int:
             print("No asset documents loaded. Skipping campaign_assets build.")
         else:
             indexer.build_asset_index(docs.asset_docs)
+            built["assets"] = docs.asset_docs
             print(f"Built campaign_assets from {len(docs.asset_docs)} chunks.")
 
+    # A sample build indexes a subset of the corpus, so it must not claim the full tree.
+    if built and not args.sample:
+        _save_full_build_manifest(_resolve_project_path(args.manifest), built)
+
     return 0
 
 
@@ -0,0 +1,71 @@
+"""Static constants from the generator config, read without importing it.
+
+``data/generators/config.py`` seeds numpy's global RNG and builds dataframes
+at import time, so both the RAG ingest (config fact documents) and the MMM
+scripts (adstock and saturation parameters) parse it with ``ast`` instead.
+Only top-level assignments whose value is a static expression are returned.
+"""
+
+from __future__ import annotations
+
+import ast
+import datetime
+from typing import Any, Dict, Tuple
+
+
+class _UnsupportedConfigNode(ValueError):
+    """Raised when a config assignment is not a static literal."""
+
+
+def _eval_config_node(node: ast.AST, scope: Dict[str, Any]) -> Any:
+    """Evaluate a static config expression without importing the module.
+
+    Supports literals, containers, ``datetime.date(...)`` (rendered as ISO
+    strings), names of previously extracted constants, and ``+`` on them.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Dict):
+        return {
+            _eval_config_node(key, scope): _eval_config_node(value, scope)
+            for key, value in zip(node.keys, node.values)
+            if key is not None
+        }
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = [_eval_config_node(item, scope) for item in node.elts]
+        return values if isinstance(node, ast.List) else tuple(values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_eval_config_node(node.operand, scope)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _eval_config_node(node.left, scope) + _eval_config_node(node.right, scope)
+    if isinstance(node, ast.Name) and node.id in scope:
+        return scope[node.id]
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "date"
+        and not node.keywords
+    ):
+        args = [_eval_config_node(arg, scope) for arg in node.args]
+        return datetime.date(*args).isoformat()
+    raise _UnsupportedConfigNode(ast.dump(node)[:80])
+
+
+def extract_config_constants(source: str) -> Dict[str, Tuple[Any, int]]:
+    """Return ``{name: (value, line)}`` for static top-level config assignments."""
+    constants: Dict[str, Tuple[Any, int]] = {}
+    scope: Dict[str, Any] = {}
+    for stmt in ast.parse(source).body:
+        if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
+            continue
+        target = stmt.targets[0]
+        if not isinstance(target, ast.Name):
+            continue
+        try:
+            value = _eval_config_node(stmt.value, scope)
+        except (_UnsupportedConfigNode, TypeError, ValueError):
+            continue
+        scope[target.id] = value
+        constants[target.id] = (value, stmt.lineno)
+    return constants
+
@@ -0,0 +1,310 @@
+"""Near-duplicate chunk suppression for the RAG ingest pipeline.
+
+Chunks are shingled over normalized tokens, summarized with MinHash
+signatures, and paired through banded LSH.  Numbers are bucketed to two
+significant figures, ISO dates to their month, and identifiers to their shape,
+so chunks that repeat the same campaigns with similar metrics on adjacent days
+hash alike.  Duplicates are only ever grouped within the same source file.
+
+That coarse signature is fine for tagging, but it also matches distinct data
+rows, so ``collapse`` only drops a tabular (CSV or mostly numeric) chunk when
+its whitespace-normalized text is identical to the representative's.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from llama_index.core import Document
+
+logger = logging.getLogger(__name__)
+
+DEDUP_MODES = ("tag", "collapse", "off")
+
+_DEFAULT_THRESHOLD = 0.9
+_DEFAULT_MODE = "tag"
+# Chunks with at least this share of numeric/date tokens count as tabular.
+_TABULAR_NUMERIC_SHARE = 0.5
+_NUM_PERM = 64
+_SHINGLE_SIZE = 2
+_MINHASH_SEED = 1
+_MERSENNE_PRIME = (1 << 31) - 1
+
+_TOKEN_RE = re.compile(r"[^\s,|]+")
+_NUMBER_RE = re.compile(r"^-?\d+(?:\.\d+)?$")
+_DATE_RE = re.compile(r"^(\d{4}-\d{2})-\d{2}$")
+_IDENTIFIER_RE = re.compile(r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z0-9_]{5,}$")
+
+_DEDUP_METADATA_KEYS = ["dup_group", "duplicate_count", "duplicate_row_ranges"]
+_ENTITY_METADATA_KEYS = ("channel", "campaign", "market", "model")
+
+
+@dataclass(frozen=True)
+class DedupReport:
+    """Outcome of a near-duplicate suppression pass."""
+
+    mode: str
+    threshold: float
+    chunks_in: int
+    chunks_out: int
+    duplicate_groups: int
+    duplicates: int
+    tokens_saved: int
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate tokens without API calls using a 4-chars-per-token heuristic."""
+    if not text:
+        return 0
+    return max(1, math.ceil(len(text) / 4))
+
+
+@lru_cache(maxsize=65536)
+def _normalize_token(token: str) -> str:
+    """Map a token to a coarse form so near-identical values compare equal."""
+    date_match = _DATE_RE.match(token)
+    if date_match:
+        return date_match.group(1)
+    if _NUMBER_RE.match(token):
+        value = float(token)
+        if value == 0:
+            return "0"
+        exponent = math.floor(math.log10(abs(value)))
+        return f"{round(value / 10 ** exponent, 1):g}e{exponent}"
+    if _IDENTIFIER_RE.match(token):
+        return re.sub(r"\d+", "#", token)
+    return token.lower()
+
+
+def _is_tabular(doc: Document) -> bool:
+    """True for CSV chunks and chunks whose tokens are mostly numbers or dates."""
+    if (doc.metadata or {}).get("file_type") == "csv":
+        return True
+    tokens = _TOKEN_RE.findall(doc.text or "")
+    if not tokens:
+        return False
+    numeric = sum(1 for token in tokens if _NUMBER_RE.match(token) or _DATE_RE.match(token))
+    return numeric / len(tokens) >= _TABULAR_NUMERIC_SHARE
+
+
+def _exact_text(doc: Document) -> str:
+    return " ".join((doc.text or "").split())
+
+
+def _collapsible(docs: list[Document], members: list[int]) -> list[list[int]]:
+    """Split a near-duplicate group into the subgroups that may be collapsed.
+
+    Prose members collapse together; tabular members only with members whose
+    normalized text is identical.  Each subgroup keeps input order.
+    """
+    prose = [idx for idx in members if not _is_tabular(docs[idx])]
+    identical: dict[str, list[int]] = defaultdict(list)
+    for idx in members:
+        if _is_tabular(docs[idx]):
+            identical[_exact_text(docs[idx])].append(idx)
+    subgroups = [prose, *identical.values()]
+    return sorted((group for group in subgroups if len(group) > 1), key=lambda group: group[0])
+
+
+def _shingles(doc: Document) -> set[int]:
+    """Return hashed token shingles for a chunk, ignoring repeated CSV headers."""
+    text = doc.text or ""
+    if (doc.metadata or {}).get("file_type") == "csv":
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+
+    tokens = [_normalize_token(token) for token in _TOKEN_RE.findall(text)]
+    if not tokens:
+        return set()
+    width = min(_SHINGLE_SIZE, len(tokens))
+    return {
+        zlib.crc32("\x1f".join(tokens[i:i + width]).encode("utf-8"))
+        for i in range(len(tokens) - width + 1)
+    }
+
+
+def _lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Pick ``(bands, rows)`` whose S-curve midpoint sits nearest the threshold."""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def find_near_duplicate_groups(
+    docs: list[Document],
+    threshold: float = _DEFAULT_THRESHOLD,
+    num_perm: int = _NUM_PERM,
+) -> list[list[int]]:
+    """Return index groups of near-duplicate chunks (each group has 2+ members).
+
+    Groups are ordered by their first member and members keep input order, so
+    the first index of each group is the earliest chunk.
+    """
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError("threshold must be in (0, 1]")
+
+    rng = np.random.default_rng(_MINHASH_SEED)
+    coeff_a = rng.integers(1, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+    coeff_b = rng.integers(0, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+    signatures: dict[int, np.ndarray] = {}
+    for idx, doc in enumerate(docs):
+        shingles = _shingles(doc)
+        if not shingles:
+            continue
+        hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        hashes %= np.uint64(_MERSENNE_PRIME)
+        signatures[idx] = ((coeff_a * hashes + coeff_b) % np.uint64(_MERSENNE_PRIME)).min(axis=1)
+
+    bands, rows = _lsh_params(threshold, num_perm)
+    buckets: dict[tuple, list[int]] = defaultdict(list)
+    for idx, signature in signatures.items():
+        source_file = str((docs[idx].metadata or {}).get("source_file", ""))
+        for band in range(bands):
+            key = (source_file, band, signature[band * rows:(band + 1) * rows].tobytes())
+            buckets[key].append(idx)
+
+    parent = {idx: idx for idx in signatures}
+
+    def _find(idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    checked: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        for pos, left in enumerate(members):
+            for right in members[pos + 1:]:
+                if (left, right) in checked:
+                    continue
+                checked.add((left, right))
+                similarity = float(np.mean(signatures[left] == signatures[right]))
+                if similarity >= threshold:
+                    root_left, root_right = _find(left), _find(right)
+                    if root_left != root_right:
+                        parent[max(root_left, root_right)] = min(root_left, root_right)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for idx in sorted(signatures):
+        groups[_find(idx)].append(idx)
+    return [members for _, members in sorted(groups.items()) if len(members) > 1]
+
+
+def _exclude_from_embedding(doc: Document) -> None:
+    """Keep dedup bookkeeping keys out of the embedded text."""
+    for key in _DEDUP_METADATA_KEYS:
+        if key not in doc.excluded_embed_metadata_keys:
+            doc.excluded_embed_metadata_keys.append(key)
+
+
+def _widen_filter_metadata(representative: Document, duplicates: list[Document]) -> None:
+    """Extend the representative's date bounds and entity lists over collapsed chunks.
+
+    Without this, payload filters on a collapsed representative would miss
+    dates and entities that only its duplicates covered.
+    """
+    metadata = representative.metadata
+    members = [metadata] + [doc.metadata or {} for doc in duplicates]
+
+    for bound, pick in (("date_min", min), ("date_max", max)):
+        values = [member[bound] for member in members if member.get(bound)]
+        keys = [member[f"{bound}_key"] for member in members if member.get(f"{bound}_key")]
+        if values:
+            metadata[bound] = pick(values)
+        if keys:
+            metadata[f"{bound}_key"] = pick(keys)
+
+    for key in _ENTITY_METADATA_KEYS:
+        values = {
+            value
+            for member in members
+            if isinstance(member.get(key), list)
+            for value in member[key]
+        }
+        if values:
+            metadata[key] = sorted(values)
+
+
+def suppress_near_duplicates(
+    docs: list[Document],
+    threshold: float = _DEFAULT_THRESHOLD,
+    mode: str = _DEFAULT_MODE,
+) -> tuple[list[Document], DedupReport]:
+    """Tag or collapse near-duplicate chunks before embedding.
+
+    ``tag`` (the default) keeps every chunk and stamps the group's
+    ``dup_group`` id on each member so retrieval can drop clones from results.
+    ``collapse`` keeps the earliest chunk of each collapsible subgroup as the
+    representative and records the dropped members in ``duplicate_count`` and
+    ``duplicate_row_ranges`` (row ranges for CSV chunks, doc ids otherwise);
+    tabular chunks are only collapsed into an identical representative.
+    ``off`` is a no-op.
+    """
+    if mode not in DEDUP_MODES:
+        raise ValueError(f"mode must be one of {', '.join(DEDUP_MODES)}")
+
+    if mode == "off" or not docs:
+        return list(docs), DedupReport(mode, threshold, len(docs), len(docs), 0, 0, 0)
+
+    groups = find_near_duplicate_groups(docs, threshold=threshold)
+    if mode == "collapse":
+        groups = [subgroup for members in groups for subgroup in _collapsible(docs, members)]
+    dropped: set[int] = set()
+
+    for members in groups:
+        representative = docs[members[0]]
+        duplicates = [docs[idx] for idx in members[1:]]
+        if representative.metadata is None:
+            representative.metadata = {}
+
+        if mode == "tag":
+            for doc in [representative] + duplicates:
+                if doc.metadata is None:
+                    doc.metadata = {}
+                doc.metadata["dup_group"] = representative.doc_id
+                _exclude_from_embedding(doc)
+            continue
+
+        _widen_filter_metadata(representative, duplicates)
+        representative.metadata["duplicate_count"] = len(duplicates)
+        representative.metadata["duplicate_row_ranges"] = [
+            str((doc.metadata or {}).get("row_range") or doc.doc_id) for doc in duplicates
+        ]
+        _exclude_from_embedding(representative)
+        dropped.update(members[1:])
+
+    kept = [doc for idx, doc in enumerate(docs) if idx not in dropped]
+    tokens_saved = sum(_estimate_tokens(docs[idx].text) for idx in dropped)
+    report = DedupReport(
+        mode=mode,
+        threshold=threshold,
+        chunks_in=len(docs),
+        chunks_out=len(kept),
+        duplicate_groups=len(groups),
+        duplicates=sum(len(members) - 1 for members in groups),
+        tokens_saved=tokens_saved,
+    )
+    logger.info(
+        "Near-duplicate suppression (%s, threshold=%.2f): %d groups, %d duplicates, "
+        "~%d tokens saved",
+        mode,
+        threshold,
+        report.duplicate_groups,
+        report.duplicates,
+        tokens_saved,
+    )
+    return kept, report
@@ -1,24 +1,73 @@
 """Document loading for the RAG pipeline.
 
 Loads CSV data files, markdown contracts, and config into LlamaIndex Document
-objects with rich metadata for retrieval and filtering.
+objects with rich metadata for retrieval and filtering.  Contracts are split on
+headings and numbered clauses so retrieval returns a few hundred tokens rather
+than a whole agreement; the generator config becomes one small fact document
+per constant.
 """
 
 from __future__ import annotations
 
 import csv
+import datetime
 import io
 import logging
+import re
+import uuid
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from llama_index.core import Document
+from llama_index.core.schema import NodeRelationship, RelatedNodeInfo
+
+from .config_constants import extract_config_constants
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever chunk boundaries, chunk text, or chunk ids change so the ingest
+# manifest treats every previously ingested file as modified.
+CHUNKER_VERSION = "2"
+
 # Number of CSV rows to group into each Document chunk
 _CSV_CHUNK_SIZE = 20
 
+# CSV columns holding ISO dates (``YYYY-MM-DD``) or months (``YYYY-MM``)
+_DATE_COLUMN_RE = re.compile(r"^(?:date|year_month|date_\w+|\w+_date)$")
+
+# Filterable entity metadata key -> CSV columns that supply its values
+_ENTITY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "channel": ("channel",),
+    "campaign": ("campaign_name", "utm_campaign"),
+    "market": ("market",),
+    "model": ("model",),
+}
+
+# Media channel implied by a file that has no ``channel`` column (config.ALL_CHANNELS names)
+_FILE_CHANNELS = {
+    "meta_ads": "meta",
+    "google_ads": "google",
+    "dv360": "dv360",
+    "tiktok_ads": "tiktok",
+    "youtube_ads": "youtube",
+    "linkedin_ads": "linkedin",
+    "tv_performance": "tv",
+    "ooh_performance": "ooh",
+    "print_performance": "print",
+    "radio_performance": "radio",
+    "events": "events",
+}
+
+# Chunk metadata used only for payload filtering; the values already appear in the chunk text.
+_CSV_FILTER_ONLY_KEYS = ["date_min_key", "date_max_key", "campaign", "market", "model"]
+
+# Upper bound on contract chunk size (~400 tokens at 4 chars/token)
+_CONTRACT_CHUNK_MAX_CHARS = 1600
+
+_MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*\S)\s*$")
+_CLAUSE_NUMBER_RE = re.compile(r"^\**\s*(\d+(?:\.\d+)+)\.?\s")
+_SECTION_NUMBER_RE = re.compile(r"^(\d+(?:\.\d+)*)\.?\s")
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -33,6 +82,11 @@ def _get_project_root() -> Path:
     raise FileNotFoundError("Could not find project root (no requirements.txt found)")
 
 
+def _chunk_id(rel_path: str, key: str) -> str:
+    """Return a deterministic chunk id (UUID, as Qdrant requires) for a file-local key."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{rel_path}#{key}"))
+
+
 def _categorize(filename: str) -> str:
     """Return a category string based on the filename."""
     name = filename.lower()
@@ -64,13 +118,82 @@ def _categorize(filename: str) -> str:
 # CSV loading
 # ---------------------------------------------------------------------------
 
+def date_key(value: datetime.date) -> int:
+    """Return the ``YYYYMMDD`` integer stored in ``date_min_key``/``date_max_key`` payloads.
+
+    Query-time date filters (``query_engine``) compare against the same keys.
+    """
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def parse_date_bounds(value: str) -> Tuple[datetime.date, datetime.date] | None:
+    """Parse an ISO date or month into its first and last calendar day, or None."""
+    value = value.strip()
+    try:
+        if len(value) == 7:
+            first = datetime.date.fromisoformat(f"{value}-01")
+            next_month = (first.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+            return first, next_month - datetime.timedelta(days=1)
+        day = datetime.date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+    return day, day
+
+
+def _chunk_filter_metadata(
+    filename: str,
+    header: List[str],
+    rows: List[List[str]],
+) -> Dict[str, Any]:
+    """Derive date bounds and distinct entity values for a CSV chunk.
+
+    Returns ``date_min``/``date_max`` (ISO) with their ``*_key`` integer twins,
+    and sorted value lists for ``channel``, ``campaign``, ``market`` and
+    ``model``.  Keys with no values in the chunk are omitted.
+    """
+    date_indexes = [i for i, column in enumerate(header) if _DATE_COLUMN_RE.match(column)]
+    bounds = [
+        parsed
+        for row in rows
+        for i in date_indexes
+        if i < len(row) and (parsed := parse_date_bounds(row[i]))
+    ]
+
+    metadata: Dict[str, Any] = {}
+    if bounds:
+        date_min = min(first for first, _ in bounds)
+        date_max = max(last for _, last in bounds)
+        metadata.update(
+            date_min=date_min.isoformat(),
+            date_max=date_max.isoformat(),
+            date_min_key=date_key(date_min),
+            date_max_key=date_key(date_max),
+        )
+
+    for key, columns in _ENTITY_COLUMNS.items():
+        indexes = [header.index(column) for column in columns if column in header]
+        values = {
+            row[i].strip()
+            for row in rows
+            for i in indexes
+            if i < len(row) and row[i].strip()
+        }
+        if key == "channel" and not indexes and Path(filename).stem in _FILE_CHANNELS:
+            values = {_FILE_CHANNELS[Path(filename).stem]}
+        if values:
+            metadata[key] = sorted(values)
+
+    return metadata
+
+
 def load_csv_documents(csv_path: Path) -> List[Document]:
     """Load a CSV file and group rows into chunked Documents.
 
     Each Document contains up to ``_CSV_CHUNK_SIZE`` rows formatted as CSV text.
-    Metadata includes source file, category, column names, row range, and total
-    row count.  Embedding-irrelevant metadata keys are excluded from the
-    embedding representation.
+    Metadata includes source file, category, column names, row range, total
+    row count, and the chunk's date bounds and distinct channel, campaign,
+    market and model values for payload filtering.  Embedding-irrelevant
+    metadata keys are excluded from the embedding representation.
     """
     csv_path = Path(csv_path)
     if not csv_path.exists():
@@ -109,6 +232,7 @@ def load_csv_documents(csv_path: Path) -> List[Document]:
         row_end = chunk_end
 
         doc = Document(
+            id_=_chunk_id(rel_path, f"{row_start}-{row_end}"),
             text=chunk_text,
             metadata={
                 "source_file": rel_path,
@@ -117,8 +241,14 @@ def load_csv_documents(csv_path: Path) -> List[Document]:
                 "columns": header,
                 "row_range": f"{row_start}-{row_end}",
                 "total_rows": total_rows,
+                **_chunk_filter_metadata(csv_path.name, header, chunk),
             },
-            excluded_embed_metadata_keys=["source_file", "row_range", "total_rows"],
+            excluded_embed_metadata_keys=[
+                "source_file",
+                "row_range",
+                "total_rows",
+                *_CSV_FILTER_ONLY_KEYS,
+            ],
         )
         documents.append(doc)
 
@@ -130,11 +260,142 @@ def load_csv_documents(csv_path: Path) -> List[Document]:
 # Contract / markdown loading
 # ---------------------------------------------------------------------------
 
-def load_contract_documents(md_path: Path) -> List[Document]:
-    """Load a markdown contract file as a single Document.
+def _split_contract_sections(text: str) -> List[Tuple[str, str, str]]:
+    """Split contract markdown into ``(section, section_number, body)`` tuples.
 
-    The vendor name is extracted from the filename by stripping the extension
-    and replacing underscores with spaces.
+    ``##`` headings open a new section; deeper headings open a subsection
+    labelled ``"<parent> > <child>"``.  Text before the first ``##`` heading
+    (title, parties, effective dates) becomes the ``"Preamble"`` section.
+    """
+    sections: List[Tuple[str, str, str]] = []
+    parent_heading = ""
+    heading = "Preamble"
+    number = ""
+    buffer: List[str] = []
+
+    def _flush() -> None:
+        body = "\n".join(line for line in buffer if line.strip() != "---").strip()
+        if body:
+            sections.append((heading, number, body))
+
+    for line in text.splitlines():
+        match = _MD_HEADING_RE.match(line)
+        if match is None or len(match.group(1)) < 2:
+            buffer.append(line)
+            continue
+
+        _flush()
+        buffer = []
+        level, title = len(match.group(1)), match.group(2).strip()
+        if level == 2:
+            parent_heading = title
+            heading = title
+        else:
+            heading = f"{parent_heading} > {title}" if parent_heading else title
+        number_match = _SECTION_NUMBER_RE.match(title)
+        number = number_match.group(1) if number_match else ""
+
+    _flush()
+    return sections
+
+
+def _split_clauses(body: str) -> List[Tuple[str, str]]:
+    """Split a section body into ``(clause_id, text)`` blocks at numbered clauses.
+
+    Text preceding the first numbered clause is returned with an empty id.
+    """
+    blocks: List[Tuple[str, str]] = []
+    clause_id = ""
+    buffer: List[str] = []
+
+    for line in body.splitlines():
+        match = _CLAUSE_NUMBER_RE.match(line)
+        if match is not None:
+            block = "\n".join(buffer).strip()
+            if block:
+                blocks.append((clause_id, block))
+            clause_id = match.group(1)
+            buffer = [line]
+        else:
+            buffer.append(line)
+
+    block = "\n".join(buffer).strip()
+    if block:
+        blocks.append((clause_id, block))
+    return blocks
+
+
+def _pack_clauses(
+    blocks: List[Tuple[str, str]],
+    max_chars: int,
+) -> List[Tuple[List[str], str]]:
+    """Greedily pack consecutive clause blocks into chunks of at most ``max_chars``.
+
+    Clauses are never split mid-paragraph; a single clause larger than the
+    budget is broken on blank lines instead, and an oversized paragraph (e.g.
+    a long schedule table) on line boundaries.
+    """
+    pieces: List[Tuple[str, str]] = []
+    for clause_id, text in blocks:
+        if len(text) <= max_chars:
+            pieces.append((clause_id, text))
+            continue
+        for paragraph in text.split("\n\n"):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if len(paragraph) <= max_chars:
+                pieces.append((clause_id, paragraph))
+                continue
+            lines: List[str] = []
+            for line in paragraph.splitlines():
+                if lines and sum(len(part) + 1 for part in lines) + len(line) > max_chars:
+                    pieces.append((clause_id, "\n".join(lines)))
+                    lines = []
+                lines.append(line)
+            if lines:
+                pieces.append((clause_id, "\n".join(lines)))
+
+    chunks: List[Tuple[List[str], str]] = []
+    chunk_ids: List[str] = []
+    chunk_parts: List[str] = []
+    chunk_len = 0
+    for clause_id, text in pieces:
+        if chunk_parts and chunk_len + len(text) + 2 > max_chars:
+            chunks.append((chunk_ids, "\n\n".join(chunk_parts)))
+            chunk_ids, chunk_parts, chunk_len = [], [], 0
+        if clause_id and clause_id not in chunk_ids:
+            chunk_ids.append(clause_id)
+        chunk_parts.append(text)
+        chunk_len += len(text) + 2
+
+    if chunk_parts:
+        chunks.append((chunk_ids, "\n\n".join(chunk_parts)))
+    return chunks
+
+
+def _format_clause_id(clause_ids: List[str], section_number: str) -> str:
+    """Render a chunk's clause id as a single clause, a range, or the section number."""
+    if not clause_ids:
+        return section_number
+    if len(clause_ids) == 1:
+        return clause_ids[0]
+    return f"{clause_ids[0]}-{clause_ids[-1]}"
+
+
+def load_contract_documents(md_path: Path) -> List[Document]:
+    """Load a markdown contract file as clause-aware chunked Documents.
+
+    The contract is split on its ``##``/``###`` headings and numbered clauses
+    (``2.3``, ``5.1.2`` ...), then consecutive clauses are packed into chunks
+    of at most ``_CONTRACT_CHUNK_MAX_CHARS`` characters.  Each chunk text is
+    prefixed with the vendor and section heading so it stands on its own.
+
+    Metadata includes ``section`` and ``clause_id`` (a single clause, a range
+    such as ``"3.1-3.4"``, or the section number), plus ``parent_doc_id``
+    linking every chunk back to the whole contract.  The vendor name is
+    extracted from the filename by stripping the extension and replacing
+    underscores with spaces.
     """
     md_path = Path(md_path)
     if not md_path.exists():
@@ -147,28 +408,128 @@ def load_contract_documents(md_path: Path) -> List[Document]:
 
     text = md_path.read_text(encoding="utf-8")
 
-    doc = Document(
-        text=text,
-        metadata={
-            "source_file": rel_path,
-            "file_type": "contract",
-            "category": "contracts",
-            "vendor": vendor,
-        },
+    chunks: List[Tuple[str, str, str]] = []
+    for section, section_number, body in _split_contract_sections(text):
+        for clause_ids, chunk_body in _pack_clauses(
+            _split_clauses(body), _CONTRACT_CHUNK_MAX_CHARS
+        ):
+            clause_id = _format_clause_id(clause_ids, section_number)
+            chunks.append((section, clause_id, f"{vendor} — {section}\n\n{chunk_body}"))
+
+    documents: List[Document] = []
+    for chunk_index, (section, clause_id, chunk_text) in enumerate(chunks):
+        doc = Document(
+            id_=_chunk_id(rel_path, str(chunk_index)),
+            text=chunk_text,
+            metadata={
+                "source_file": rel_path,
+                "file_type": "contract",
+                "category": "contracts",
+                "vendor": vendor,
+                "section": section,
+                "clause_id": clause_id,
+                "parent_doc_id": rel_path,
+                "chunk_index": chunk_index,
+                "total_chunks": len(chunks),
+            },
+            excluded_embed_metadata_keys=["parent_doc_id", "chunk_index", "total_chunks"],
+            relationships={NodeRelationship.SOURCE: RelatedNodeInfo(node_id=rel_path)},
+        )
+        documents.append(doc)
+
+    logger.info(
+        "Loaded %d clause chunks from contract %s (vendor=%s)",
+        len(documents),
+        rel_path,
+        vendor,
     )
-    logger.info("Loaded contract: %s (vendor=%s)", rel_path, vendor)
-    return [doc]
+    return documents
 
 
 # ---------------------------------------------------------------------------
 # Config loading
 # ---------------------------------------------------------------------------
 
-def load_config_document() -> Document:
-    """Load data/generators/config.py as a Document with key values extracted.
-
-    Extracts budget totals, channel list, seasonal multipliers, vehicle models,
-    and date range into the document text and metadata.
+# Top-level config constants turned into fact documents, with a short
+# human-readable description.  Mappings listed in ``_CONFIG_PER_ENTRY_KEYS``
+# get one document per entry (e.g. one per vehicle model).
+_CONFIG_FACT_KEYS = {
+    "START_DATE": "Start of the synthetic data date range",
+    "END_DATE": "End of the synthetic data date range",
+    "UK_LAUNCH_DATE": "DEEPAL S07 UK launch date",
+    "S05_PREVIEW_DATE": "DEEPAL S05 preview / pre-order date",
+    "AVATR_12_LAUNCH": "AVATR 12 UK launch date",
+    "AVATR_11_LAUNCH": "AVATR 11 UK launch date",
+    "MARKETS": "Markets and their share of the total budget",
+    "UK_TOTAL_ANNUAL_BUDGET": "Total UK annual media budget (GBP)",
+    "CHANNEL_BUDGETS_GBP": "UK annual media budget per channel (GBP)",
+    "DIGITAL_CHANNELS": "Digital media channels",
+    "TRADITIONAL_CHANNELS": "Traditional media channels",
+    "ALL_CHANNELS": "All media channels",
+    "SEASONAL_MULTIPLIERS": "Monthly seasonal spend multipliers (1.0 = average month)",
+    "VEHICLE_MODELS": "Vehicle model specification",
+    "DIGITAL_BENCHMARKS": "Digital channel benchmark ranges (min, max)",
+    "WEEKEND_SPEND_FACTORS": "Weekend spend as a fraction of weekday spend",
+    "TRADITIONAL_BENCHMARKS": "Traditional channel benchmark ranges (min, max)",
+    "STAGE_CONVERSION_RATES": "Sales pipeline stage conversion rates",
+    "FINANCE_DISTRIBUTION": "Vehicle finance type distribution",
+    "ADSTOCK_DECAY_RATES": "MMM adstock decay rate per channel",
+    "SATURATION_PARAMS": "MMM saturation (Hill) parameters per channel",
+}
+
+_CONFIG_PER_ENTRY_KEYS = {"VEHICLE_MODELS", "DIGITAL_BENCHMARKS", "TRADITIONAL_BENCHMARKS"}
+
+
+def _format_config_value(value: Any, indent: str = "") -> List[str]:
+    """Render a config value as indented ``- key: value`` lines."""
+    if isinstance(value, dict):
+        lines: List[str] = []
+        for key, item in value.items():
+            if isinstance(item, dict):
+                lines.append(f"{indent}- {key}:")
+                lines.extend(_format_config_value(item, indent + "  "))
+            else:
+                lines.append(f"{indent}- {key}: {_format_config_scalar(item)}")
+        return lines
+    return [f"{indent}{_format_config_scalar(value)}"]
+
+
+def _format_config_scalar(value: Any) -> str:
+    """Render a scalar, list, or ``(min, max)`` range for fact text."""
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, int):
+        return f"{value:,}"
+    if isinstance(value, tuple) and len(value) == 2:
+        return f"{_format_config_scalar(value[0])} to {_format_config_scalar(value[1])}"
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_format_config_scalar(item) for item in value)
+    return str(value)
+
+
+def _config_value_type(value: Any) -> str:
+    """Return a coarse type label for a config value."""
+    if isinstance(value, dict):
+        return "mapping"
+    if isinstance(value, (list, tuple)):
+        return "list"
+    if isinstance(value, str) and len(value) == 10 and value[4] == "-":
+        return "date"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return "number"
+    return "text"
+
+
+def load_config_documents() -> List[Document]:
+    """Load data/generators/config.py as small typed fact Documents.
+
+    The module is parsed with ``ast`` rather than imported (importing it seeds
+    RNGs, creates output directories and builds the dealer table).  Each key
+    in ``_CONFIG_FACT_KEYS`` — budget totals, channel budgets, seasonal
+    multipliers, vehicle models, launch dates, benchmarks, adstock decay and
+    saturation parameters — becomes one Document carrying ``config_key`` in
+    its metadata; keys in ``_CONFIG_PER_ENTRY_KEYS`` get one Document per
+    entry with ``config_entry`` set as well.
     """
     root = _get_project_root()
     config_path = root / "data" / "generators" / "config.py"
@@ -176,19 +537,42 @@ def load_config_document() -> Document:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    text = config_path.read_text(encoding="utf-8")
     rel_path = str(config_path.relative_to(root))
+    constants = extract_config_constants(config_path.read_text(encoding="utf-8"))
 
-    doc = Document(
-        text=text,
-        metadata={
-            "source_file": rel_path,
-            "file_type": "config",
-            "category": "config",
-        },
-    )
-    logger.info("Loaded config document: %s", rel_path)
-    return doc
+    documents: List[Document] = []
+    for config_key, description in _CONFIG_FACT_KEYS.items():
+        if config_key not in constants:
+            logger.warning("Config key %s not found in %s", config_key, rel_path)
+            continue
+        value, line = constants[config_key]
+
+        if config_key in _CONFIG_PER_ENTRY_KEYS and isinstance(value, dict):
+            entries = [(str(entry), entry_value) for entry, entry_value in value.items()]
+        else:
+            entries = [("", value)]
+
+        for config_entry, entry_value in entries:
+            title = f"{config_key}.{config_entry}" if config_entry else config_key
+            body = "\n".join(_format_config_value(entry_value))
+            doc = Document(
+                id_=_chunk_id(rel_path, title),
+                text=f"Config {title} — {description}\n{body}",
+                metadata={
+                    "source_file": rel_path,
+                    "file_type": "config",
+                    "category": "config",
+                    "config_key": config_key,
+                    "config_entry": config_entry,
+                    "value_type": _config_value_type(entry_value),
+                    "line": line,
+                },
+                excluded_embed_metadata_keys=["source_file", "value_type", "line"],
+            )
+            documents.append(doc)
+
+    logger.info("Loaded %d config fact documents from %s", len(documents), rel_path)
+    return documents
 
 
 # ---------------------------------------------------------------------------
@@ -216,12 +600,13 @@ def load_asset_documents() -> List[Document]:
     reader = csv.DictReader(io.StringIO(text))
 
     documents: List[Document] = []
-    for row in reader:
+    for row_number, row in enumerate(reader, start=1):
         description = row.get("description", "")
         if not description:
             continue
 
         doc = Document(
+            id_=_chunk_id(rel_path, str(row_number)),
             text=description,
             metadata={
                 "source_file": rel_path,
@@ -243,11 +628,11 @@ def load_asset_documents() -> List[Document]:
 
 
 # ---------------------------------------------------------------------------
-# Aggregate loader
+# Source discovery + aggregate loaders
 # ---------------------------------------------------------------------------
 
-def load_all_text_documents() -> List[Document]:
-    """Load all CSV data, contracts, and config into a combined Document list.
+def discover_text_sources() -> List[Path]:
+    """Return every existing source file that feeds the text index.
 
     Scans:
     - ``data/raw/*.csv``
@@ -255,25 +640,51 @@ def load_all_text_documents() -> List[Document]:
     - ``data/generators/config.py``
     """
     root = _get_project_root()
-    documents: List[Document] = []
-
-    # CSVs
     raw_dir = root / "data" / "raw"
+    sources: List[Path] = []
+
     if raw_dir.exists():
-        for csv_file in sorted(raw_dir.glob("*.csv")):
-            documents.extend(load_csv_documents(csv_file))
+        sources.extend(sorted(raw_dir.glob("*.csv")))
 
-    # Contracts
     contracts_dir = raw_dir / "contracts"
     if contracts_dir.exists():
-        for md_file in sorted(contracts_dir.glob("*.md")):
-            documents.extend(load_contract_documents(md_file))
+        sources.extend(sorted(contracts_dir.glob("*.md")))
 
-    # Config
-    try:
-        documents.append(load_config_document())
-    except FileNotFoundError:
-        logger.warning("Config file not found — skipping")
+    config_path = root / "data" / "generators" / "config.py"
+    if config_path.exists():
+        sources.append(config_path)
+
+    return sources
+
+
+def discover_asset_sources() -> List[Path]:
+    """Return the asset manifest path when it exists."""
+    manifest_path = _get_project_root() / "data" / "assets" / "asset_manifest.csv"
+    return [manifest_path] if manifest_path.exists() else []
+
+
+def load_source_documents(path: Path) -> List[Document]:
+    """Load the Documents for one discovered source file, dispatching on its kind."""
+    path = Path(path)
+    root = _get_project_root()
+    if path == root / "data" / "generators" / "config.py":
+        return load_config_documents()
+    if path == root / "data" / "assets" / "asset_manifest.csv":
+        return load_asset_documents()
+    if path.suffix.lower() == ".md":
+        return load_contract_documents(path)
+    return load_csv_documents(path)
+
+
+def load_all_text_documents() -> List[Document]:
+    """Load all CSV data, contracts, and config into a combined Document list.
+
+    Sources are the files returned by ``discover_text_sources`` (config.py is
+    loaded as fact documents).
+    """
+    documents: List[Document] = []
+    for source in discover_text_sources():
+        documents.extend(load_source_documents(source))
 
     logger.info("Total documents loaded: %d", len(documents))
     return documents
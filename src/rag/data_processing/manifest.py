@@ -0,0 +1,241 @@
+"""Per-file ingest manifest and change detection for incremental index builds.
+
+The manifest records, for every ingested source file, its size, mtime, content
+hash, the chunk ids it produced, and the chunker version that produced them.
+Comparing the current source tree against it yields a ``ChangeSet`` so builds
+only re-read and re-chunk files that were added or modified, and only delete
+the chunks of files that were modified or removed.
+
+A file whose size and mtime match its entry is trusted without hashing; a file
+whose stat changed is hashed and only counts as modified when its content did.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_TARGETS = ("text", "assets")
+
+_MANIFEST_FORMAT = 1
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Stat and content identity of one source file."""
+
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """What the last successful build ingested from one source file."""
+
+    target: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    chunker_version: str
+    chunk_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Add/modify/remove delta between the source tree and the manifest for one target."""
+
+    target: str
+    added: tuple[str, ...]
+    modified: tuple[str, ...]
+    removed: tuple[str, ...]
+    unchanged: tuple[str, ...]
+    removed_chunk_ids: tuple[str, ...]
+    fingerprints: dict[str, FileFingerprint] = field(default_factory=dict)
+
+    @property
+    def has_changes(self) -> bool:
+        """Return True when any file was added, modified, or removed."""
+        return bool(self.added or self.modified or self.removed)
+
+    @property
+    def changed(self) -> tuple[str, ...]:
+        """Files that must be (re)loaded and chunked."""
+        return self.added + self.modified
+
+
+def content_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path) -> dict[str, ManifestEntry]:
+    """Load manifest entries keyed by project-relative path.
+
+    A missing, unreadable, or foreign-format manifest yields an empty mapping,
+    which makes the next build treat every file as added.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("format") != _MANIFEST_FORMAT:
+            raise ValueError(f"unsupported manifest format {payload.get('format')!r}")
+        return {
+            rel_path: ManifestEntry(
+                target=str(raw["target"]),
+                size=int(raw["size"]),
+                mtime_ns=int(raw["mtime_ns"]),
+                content_hash=str(raw["content_hash"]),
+                chunker_version=str(raw["chunker_version"]),
+                chunk_ids=tuple(str(chunk_id) for chunk_id in raw["chunk_ids"]),
+            )
+            for rel_path, raw in payload["files"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        logger.warning("Ignoring unreadable ingest manifest '%s': %s", path, exc)
+        return {}
+
+
+def save_manifest(path: Path, entries: dict[str, ManifestEntry]) -> None:
+    """Atomically write manifest entries so an interrupted build never leaves a torn file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format": _MANIFEST_FORMAT,
+        "files": {
+            rel_path: {
+                "target": entry.target,
+                "size": entry.size,
+                "mtime_ns": entry.mtime_ns,
+                "content_hash": entry.content_hash,
+                "chunker_version": entry.chunker_version,
+                "chunk_ids": list(entry.chunk_ids),
+            }
+            for rel_path, entry in sorted(entries.items())
+        },
+    }
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def compute_change_set(
+    target: str,
+    sources: list[Path],
+    entries: dict[str, ManifestEntry],
+    root: Path,
+    chunker_version: str,
+) -> ChangeSet:
+    """Diff the current ``sources`` for ``target`` against the manifest entries.
+
+    Files ingested by an older chunker version count as modified even when
+    their bytes are unchanged, since their chunk ids and text may differ.
+    """
+    if target not in MANIFEST_TARGETS:
+        raise ValueError(f"target must be one of {', '.join(MANIFEST_TARGETS)}")
+
+    added: list[str] = []
+    modified: list[str] = []
+    unchanged: list[str] = []
+    removed_chunk_ids: list[str] = []
+    fingerprints: dict[str, FileFingerprint] = {}
+    seen: set[str] = set()
+
+    for source in sources:
+        rel_path = str(Path(source).relative_to(root))
+        seen.add(rel_path)
+        stat = Path(source).stat()
+        entry = entries.get(rel_path)
+
+        if entry is None or entry.target != target:
+            added.append(rel_path)
+            fingerprints[rel_path] = FileFingerprint(
+                stat.st_size, stat.st_mtime_ns, content_hash(source)
+            )
+            continue
+
+        stat_matches = entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns
+        digest = entry.content_hash if stat_matches else content_hash(source)
+        fingerprints[rel_path] = FileFingerprint(stat.st_size, stat.st_mtime_ns, digest)
+
+        if digest == entry.content_hash and entry.chunker_version == chunker_version:
+            unchanged.append(rel_path)
+        else:
+            modified.append(rel_path)
+            removed_chunk_ids.extend(entry.chunk_ids)
+
+    removed = sorted(
+        rel_path
+        for rel_path, entry in entries.items()
+        if entry.target == target and rel_path not in seen
+    )
+    for rel_path in removed:
+        removed_chunk_ids.extend(entries[rel_path].chunk_ids)
+
+    return ChangeSet(
+        target=target,
+        added=tuple(added),
+        modified=tuple(modified),
+        removed=tuple(removed),
+        unchanged=tuple(unchanged),
+        removed_chunk_ids=tuple(removed_chunk_ids),
+        fingerprints=fingerprints,
+    )
+
+
+def apply_change_set(
+    entries: dict[str, ManifestEntry],
+    change_set: ChangeSet,
+    chunk_ids_by_file: dict[str, list[str]],
+    chunker_version: str,
+) -> dict[str, ManifestEntry]:
+    """Return the manifest entries that describe the tree after ``change_set`` is ingested.
+
+    Entries for other targets are carried over untouched; unchanged files keep
+    their chunk ids but pick up refreshed stat values so the next run can skip
+    hashing them.
+    """
+    updated = {
+        rel_path: entry
+        for rel_path, entry in entries.items()
+        if rel_path not in change_set.removed
+    }
+
+    for rel_path in change_set.unchanged:
+        fingerprint = change_set.fingerprints[rel_path]
+        previous = updated[rel_path]
+        updated[rel_path] = ManifestEntry(
+            target=previous.target,
+            size=fingerprint.size,
+            mtime_ns=fingerprint.mtime_ns,
+            content_hash=previous.content_hash,
+            chunker_version=previous.chunker_version,
+            chunk_ids=previous.chunk_ids,
+        )
+
+    for rel_path in change_set.changed:
+        fingerprint = change_set.fingerprints[rel_path]
+        updated[rel_path] = ManifestEntry(
+            target=change_set.target,
+            size=fingerprint.size,
+            mtime_ns=fingerprint.mtime_ns,
+            content_hash=fingerprint.content_hash,
+            chunker_version=chunker_version,
+            chunk_ids=tuple(chunk_ids_by_file.get(rel_path, [])),
+        )
+
+    return updated
@@ -8,10 +8,13 @@ import os
 from pathlib import Path
 
 from llama_index.core import Document, StorageContext, VectorStoreIndex
+from llama_index.core.schema import BaseNode
+from llama_index.core.vector_stores.utils import metadata_dict_to_node
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.retrievers.bm25 import BM25Retriever
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 from qdrant_client import QdrantClient
+from qdrant_client.models import PayloadSchemaType
 
 from src.rag.data_processing.ingest import load_all_text_documents, load_asset_documents
 
@@ -23,6 +26,17 @@ _DEFAULT_QDRANT_PATH = "data/qdrant_db"
 _DEFAULT_BM25_PATH = "data/index/bm25"
 _DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
 _EMBEDDING_COST_PER_1M_TOKENS_USD = 0.13
+# Payload fields that search_text filters on; indexed so server Qdrant narrows
+# candidates before vector scoring.
+_TEXT_PAYLOAD_INDEXES = [
+    {"field_name": field_name, "field_schema": PayloadSchemaType.KEYWORD}
+    for field_name in ("category", "source_file", "channel", "campaign", "market", "model")
+] + [
+    {"field_name": field_name, "field_schema": PayloadSchemaType.INTEGER}
+    for field_name in ("date_min_key", "date_max_key")
+]
+# Tracked placeholder that must survive BM25 artifact resets.
+_BM25_KEEP_FILES = {".gitkeep"}
 
 
 def _get_project_root() -> Path:
@@ -77,6 +91,38 @@ class RAGIndexer:
         """Return True when the persisted BM25 directory already has index artifacts."""
         return self.bm25_path.exists() and any(self.bm25_path.iterdir())
 
+    def _clear_bm25_artifacts(self) -> None:
+        """Remove persisted BM25 files so the next persist starts from a clean directory."""
+        for artifact in self.bm25_path.iterdir():
+            if artifact.is_file() and artifact.name not in _BM25_KEEP_FILES:
+                artifact.unlink()
+
+    def _update_collection(
+        self,
+        collection_name: str,
+        docs: list[Document],
+        removed_ids: list[str],
+    ) -> None:
+        """Delete stale chunks from and embed new chunks into an existing collection."""
+        vector_store = QdrantVectorStore(
+            client=self.qdrant_client,
+            collection_name=collection_name,
+        )
+        if removed_ids:
+            vector_store.delete_nodes(node_ids=list(removed_ids))
+        if docs:
+            index = VectorStoreIndex.from_vector_store(
+                vector_store,
+                embed_model=self.embedding,
+            )
+            index.insert_nodes(docs)
+        logger.info(
+            "Updated collection '%s': removed %d chunks, inserted %d chunks",
+            collection_name,
+            len(removed_ids),
+            len(docs),
+        )
+
     @staticmethod
     def _estimate_tokens(text: str) -> int:
         """Estimate tokens without API calls using a 4-chars-per-token heuristic."""
@@ -94,15 +140,17 @@ class RAGIndexer:
         vector_store = QdrantVectorStore(
             client=self.qdrant_client,
             collection_name=_TEXT_COLLECTION,
+            payload_indexes=_TEXT_PAYLOAD_INDEXES,
         )
         storage_context = StorageContext.from_defaults(vector_store=vector_store)
 
-        # Keep ingest.py as the only chunking layer; do not apply extra split transforms.
-        index = VectorStoreIndex.from_documents(
-            docs,
+        # Keep ingest.py as the only chunking layer: index the Documents as nodes so
+        # no split transforms run and chunk ids become Qdrant point ids, which lets
+        # incremental builds delete exactly the chunks a manifest change set lists.
+        index = VectorStoreIndex(
+            nodes=docs,
             storage_context=storage_context,
             embed_model=self.embedding,
-            transformations=[],
         )
         logger.info(
             "Built text index collection '%s' with %d documents",
@@ -111,6 +159,18 @@ class RAGIndexer:
         )
         return index
 
+    def update_text_index(self, docs: list[Document], removed_ids: list[str]) -> None:
+        """Apply an incremental change set to the text collection.
+
+        Chunks listed in ``removed_ids`` are deleted before ``docs`` are
+        embedded; a missing collection is built from ``docs`` instead.
+        """
+        if not self.qdrant_client.collection_exists(_TEXT_COLLECTION):
+            if docs:
+                self.build_text_index(docs)
+            return
+        self._update_collection(_TEXT_COLLECTION, docs, removed_ids)
+
     def index_text(self) -> VectorStoreIndex:
         """Load all text documents via ingest and build the text index."""
         docs = load_all_text_documents()
@@ -134,11 +194,10 @@ class RAGIndexer:
         )
         storage_context = StorageContext.from_defaults(vector_store=vector_store)
 
-        index = VectorStoreIndex.from_documents(
-            docs,
+        index = VectorStoreIndex(
+            nodes=docs,
             storage_context=storage_context,
             embed_model=self.embedding,
-            transformations=[],
         )
         logger.info(
             "Built asset index collection '%s' with %d documents",
@@ -147,6 +206,19 @@ class RAGIndexer:
         )
         return index
 
+    def update_asset_index(self, docs: list[Document], removed_ids: list[str]) -> None:
+        """Apply an incremental change set to the asset collection."""
+        for doc in docs:
+            if doc.metadata is None:
+                doc.metadata = {}
+            doc.metadata.setdefault("image_path", "")
+
+        if not self.qdrant_client.collection_exists(_ASSET_COLLECTION):
+            if docs:
+                self.build_asset_index(docs)
+            return
+        self._update_collection(_ASSET_COLLECTION, docs, removed_ids)
+
     def index_assets(self) -> VectorStoreIndex:
         """Load asset documents via ingest and build the asset index."""
         docs = load_asset_documents()
@@ -162,9 +234,14 @@ class RAGIndexer:
             "estimated_cost_usd": round(estimated_cost, 8),
         }
 
-    def build_bm25_index(self, docs: list[Document]) -> BM25Retriever:
-        """Build or load the persisted BM25 retriever for lexical text search."""
-        if self._has_bm25_artifacts():
+    def build_bm25_index(self, docs: list[Document], rebuild: bool = False) -> BM25Retriever:
+        """Build or load the persisted BM25 retriever for lexical text search.
+
+        ``rebuild`` discards any persisted artifacts and rebuilds from ``docs``.
+        """
+        if rebuild:
+            self._clear_bm25_artifacts()
+        elif self._has_bm25_artifacts():
             logger.info("Loading BM25 retriever from '%s'", self.bm25_path)
             return BM25Retriever.from_persist_dir(str(self.bm25_path))
 
@@ -179,3 +256,45 @@ class RAGIndexer:
             self.bm25_path,
         )
         return bm25_retriever
+
+    def update_bm25_index(
+        self,
+        docs: list[Document],
+        removed_ids: list[str],
+    ) -> BM25Retriever | None:
+        """Rebuild BM25 from the persisted corpus minus ``removed_ids`` plus ``docs``.
+
+        BM25 term statistics are corpus-wide, so the retriever is refit, but
+        unchanged chunks come from the persisted corpus rather than being
+        re-read and re-chunked from source files.
+        """
+        nodes: list[BaseNode] = []
+        if self._has_bm25_artifacts() and (self.bm25_path / "retriever.json").exists():
+            corpus = BM25Retriever.from_persist_dir(str(self.bm25_path)).corpus
+            if corpus is None:
+                raise RuntimeError(
+                    f"BM25 artifacts in '{self.bm25_path}' have no persisted corpus; "
+                    "run a full rebuild."
+                )
+            dropped = set(removed_ids) | {doc.doc_id for doc in docs}
+            nodes = [
+                node
+                for node in (metadata_dict_to_node(entry) for entry in corpus)
+                if node.node_id not in dropped
+            ]
+        nodes.extend(docs)
+
+        self._clear_bm25_artifacts()
+        if not nodes:
+            logger.info("BM25 corpus is empty after update; cleared '%s'", self.bm25_path)
+            return None
+
+        bm25_retriever = BM25Retriever.from_defaults(nodes=nodes)
+        bm25_retriever.persist(str(self.bm25_path))
+        logger.info(
+            "Updated BM25 index: removed %d chunks, added %d chunks, %d total",
+            len(removed_ids),
+            len(docs),
+            len(nodes),
+        )
+        return bm25_retriever
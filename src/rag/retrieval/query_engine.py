@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import datetime
+import hashlib
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -12,12 +15,19 @@ from llama_index.core.llms.mock import MockLLM
 from llama_index.core.retrievers import QueryFusionRetriever
 from llama_index.core.retrievers.fusion_retriever import FUSION_MODES
 from llama_index.core.schema import MetadataMode, NodeWithScore
-from llama_index.core.vector_stores.types import ExactMatchFilter, MetadataFilters
+from llama_index.core.vector_stores.types import (
+    ExactMatchFilter,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.retrievers.bm25 import BM25Retriever
 from llama_index.vector_stores.qdrant import QdrantVectorStore
 from qdrant_client import QdrantClient
 
+from src.rag.data_processing.ingest import date_key, parse_date_bounds
+
 _TEXT_COLLECTION = "text_documents"
 _ASSET_COLLECTION = "campaign_assets"
 _DEFAULT_QDRANT_PATH = "data/qdrant_db"
@@ -57,6 +67,122 @@ def _build_category_filters(category: str | None) -> MetadataFilters | None:
     )
 
 
+def _parse_date_filter(value: str | None, name: str, end: bool) -> datetime.date | None:
+    """Parse an ISO ``YYYY-MM-DD`` or ``YYYY-MM`` bound; months expand to their first/last day."""
+    if value is None or not value.strip():
+        return None
+    raw = value.strip()
+    bounds = parse_date_bounds(raw) if len(raw) in (7, 10) else None
+    if bounds is None:
+        raise ValueError(f"{name} must be an ISO date (YYYY-MM-DD) or month (YYYY-MM)")
+    return bounds[1] if end else bounds[0]
+
+
+@dataclass(frozen=True)
+class _TextFilters:
+    """Date-range and entity filters pushed down to both text retrieval legs.
+
+    A chunk matches the date range when its ``[date_min, date_max]`` span
+    overlaps it; chunks without dates (contracts, config) never match a date
+    filter.  Entity values match exactly as ingested (e.g. ``market="GB"``,
+    ``model="DEEPAL S07"``).
+    """
+
+    date_from_key: int | None = None
+    date_to_key: int | None = None
+    entities: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def active(self) -> bool:
+        """Return True when any date or entity filter is set."""
+        return bool(self.entities) or self.date_from_key is not None or self.date_to_key is not None
+
+    def metadata_filters(self) -> list[MetadataFilter]:
+        """Express the filters as Qdrant-translatable LlamaIndex metadata filters."""
+        filters = [
+            MetadataFilter(key=key, value=value, operator=FilterOperator.EQ)
+            for key, value in self.entities.items()
+        ]
+        if self.date_from_key is not None:
+            filters.append(
+                MetadataFilter(
+                    key="date_max_key", value=self.date_from_key, operator=FilterOperator.GTE
+                )
+            )
+        if self.date_to_key is not None:
+            filters.append(
+                MetadataFilter(
+                    key="date_min_key", value=self.date_to_key, operator=FilterOperator.LTE
+                )
+            )
+        return filters
+
+    def matches(self, metadata: dict[str, Any]) -> bool:
+        """Evaluate the filters against one node's metadata (BM25 corpus or results)."""
+        for key, expected in self.entities.items():
+            actual = metadata.get(key)
+            values = actual if isinstance(actual, list) else [actual]
+            if expected not in values:
+                return False
+        if self.date_from_key is not None:
+            date_max_key = metadata.get("date_max_key")
+            if date_max_key is None or int(date_max_key) < self.date_from_key:
+                return False
+        if self.date_to_key is not None:
+            date_min_key = metadata.get("date_min_key")
+            if date_min_key is None or int(date_min_key) > self.date_to_key:
+                return False
+        return True
+
+
+def _build_text_filters(
+    date_from: str | None,
+    date_to: str | None,
+    entities: dict[str, str | None],
+) -> _TextFilters:
+    """Validate and normalize search_text date-range and entity filter arguments."""
+    start = _parse_date_filter(date_from, "date_from", end=False)
+    end = _parse_date_filter(date_to, "date_to", end=True)
+    if start and end and start > end:
+        raise ValueError("date_from must be on or before date_to")
+
+    return _TextFilters(
+        date_from_key=date_key(start) if start else None,
+        date_to_key=date_key(end) if end else None,
+        entities={
+            key: value.strip()
+            for key, value in entities.items()
+            if value is not None and value.strip()
+        },
+    )
+
+
+def _combine_filters(
+    category_filters: MetadataFilters | None,
+    text_filters: _TextFilters,
+) -> MetadataFilters | None:
+    """Merge the category filter with date/entity filters into one AND filter set."""
+    if not text_filters.active:
+        return category_filters
+    combined = list(category_filters.filters) if category_filters else []
+    combined.extend(text_filters.metadata_filters())
+    return MetadataFilters(filters=combined)
+
+
+def _apply_bm25_mask(bm25_retriever: BM25Retriever, text_filters: _TextFilters) -> None:
+    """Zero BM25 weights of corpus entries outside the filters before scoring.
+
+    Retrievers loaded from snapshots without a persisted corpus cannot be
+    masked; their results are still filtered after fusion.
+    """
+    corpus = getattr(bm25_retriever, "corpus", None)
+    if not text_filters.active or not corpus:
+        return
+    bm25_retriever.corpus_weight_mask = [
+        1 if text_filters.matches(entry) else 0 for entry in corpus
+    ]
+
+
 def _normalize_optional_filter(value: str | None) -> str | None:
     """Normalize optional filter input for case-insensitive matching."""
     if value is None:
@@ -105,6 +231,20 @@ def _matches_channel(node_with_score: NodeWithScore, channel: str | None) -> boo
     return actual == expected
 
 
+def _drop_tagged_duplicates(nodes: list[NodeWithScore]) -> list[NodeWithScore]:
+    """Keep only the best-ranked node of each ingest-time ``dup_group``."""
+    seen_groups: set[str] = set()
+    unique_nodes: list[NodeWithScore] = []
+    for node in nodes:
+        group = (node.node.metadata or {}).get("dup_group")
+        if group:
+            if group in seen_groups:
+                continue
+            seen_groups.add(group)
+        unique_nodes.append(node)
+    return unique_nodes
+
+
 def _serialize_asset_node(node_with_score: NodeWithScore) -> dict[str, Any]:
     """Serialize asset results and guarantee image_path key presence."""
     payload = _serialize_node(node_with_score)
@@ -140,17 +280,58 @@ def _bm25_top_k(bm25_retriever: BM25Retriever, requested_top_k: int) -> int:
     return min(requested_top_k, num_docs)
 
 
+def index_version() -> str:
+    """Cheap fingerprint of the persisted indexes (file sizes and mtimes only).
+
+    Changes whenever ``build_index.py`` rewrites the Qdrant store or the BM25
+    snapshot, so callers can key caches on it without opening either index.
+    """
+    qdrant_path = _resolve_project_path(os.getenv("QDRANT_PATH", _DEFAULT_QDRANT_PATH))
+    bm25_path = _resolve_project_path(_DEFAULT_BM25_PATH)
+
+    parts: list[str] = []
+    for root, pattern in (
+        (qdrant_path, "meta.json"),
+        (qdrant_path, "collection/*/storage.sqlite"),
+        (bm25_path, "*"),
+    ):
+        for path in sorted(root.glob(pattern)):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            parts.append(f"{path.relative_to(root)}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
 def search_text(
     query: str,
     top_k: int = 5,
     category: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    channel: str | None = None,
+    campaign: str | None = None,
+    market: str | None = None,
+    model: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Run hybrid text retrieval (dense + BM25) with reciprocal reranking."""
+    """Run hybrid text retrieval (dense + BM25) with reciprocal reranking.
+
+    ``date_from``/``date_to`` (ISO date or month) and the channel, campaign,
+    market and model filters restrict both legs before scoring: the dense leg
+    through Qdrant payload filters and the BM25 leg through a corpus weight
+    mask.
+    """
     query_text = query.strip()
     if not query_text:
         raise ValueError("query must be a non-empty string")
     if top_k <= 0:
         raise ValueError("top_k must be > 0")
+    text_filters = _build_text_filters(
+        date_from,
+        date_to,
+        {"channel": channel, "campaign": campaign, "market": market, "model": model},
+    )
 
     qdrant_path = _resolve_project_path(os.getenv("QDRANT_PATH", _DEFAULT_QDRANT_PATH))
     bm25_path = _resolve_project_path(_DEFAULT_BM25_PATH)
@@ -165,7 +346,7 @@ def search_text(
         or os.getenv("EMBED_MODEL", _DEFAULT_EMBEDDING_MODEL)
     )
     embedding = OpenAIEmbedding(model=embedding_model_name)
-    filters = _build_category_filters(category)
+    filters = _combine_filters(_build_category_filters(category), text_filters)
 
     qdrant_client = QdrantClient(path=str(qdrant_path))
     try:
@@ -191,6 +372,7 @@ def search_text(
 
         bm25_retriever = BM25Retriever.from_persist_dir(str(bm25_path))
         bm25_retriever.similarity_top_k = _bm25_top_k(bm25_retriever, top_k)
+        _apply_bm25_mask(bm25_retriever, text_filters)
 
         fusion_retriever = QueryFusionRetriever(
             retrievers=[vector_retriever, bm25_retriever],
@@ -202,7 +384,13 @@ def search_text(
         )
 
         nodes = fusion_retriever.retrieve(query_text)
-        filtered_nodes = [node for node in nodes if _matches_category(node, category)]
+        filtered_nodes = [
+            node
+            for node in nodes
+            if _matches_category(node, category)
+            and text_filters.matches(node.node.metadata or {})
+        ]
+        filtered_nodes = _drop_tagged_duplicates(filtered_nodes)
         return [_serialize_node(node) for node in filtered_nodes[:top_k]]
     finally:
         qdrant_client.close()
@@ -9,6 +9,40 @@ from fastapi.testclient import TestClient
 from src.platform.api.main import app
 
 
+@pytest.fixture(autouse=True)
+def _isolated_session_state(tmp_path, monkeypatch):
+    """Keep chat transcripts written by router tests out of data/processed."""
+    from src.platform.api.agents import rag_router
+    from src.platform.api.agents.session_state import SessionStateStore
+
+    monkeypatch.setattr(
+        rag_router,
+        "_session_state",
+        SessionStateStore(
+            tmp_path / "chat_sessions.sqlite3", max_turns_per_session=50, retention_seconds=86400
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_profile_cache(tmp_path, monkeypatch):
+    """Keep per-file profile caches written by scans out of data/processed."""
+    from src.platform.api import data_profiles
+
+    monkeypatch.setattr(data_profiles, "PROFILE_CACHE_PATH", tmp_path / "raw_profile_cache.json")
+    # Tests patch _load_rules; start each one without a previously compiled plan.
+    monkeypatch.setattr(data_profiles, "_compiled_rules", None)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_row_index(tmp_path, monkeypatch):
+    """Keep preview row indexes out of data/processed and out of other tests."""
+    from src.platform.api import raw_preview
+
+    monkeypatch.setattr(raw_preview, "ROW_INDEX_DIR", tmp_path / "row_index")
+    monkeypatch.setattr(raw_preview, "_indexes", {})
+
+
 @pytest.fixture()
 def client():
     return TestClient(app)
@@ -0,0 +1,111 @@
+"""Tests for the warm agent client pool in src.platform.api.agents.pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+from src.platform.api.agents.pool import ClientPool
+from src.platform.api.agents.sessions import SessionStore
+
+
+class _StandInClient:
+    """Local stand-in for ClaudeSDKClient: connected on creation, tracks disconnect."""
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.disconnected = False
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+class _Factory:
+    def __init__(self, fail_first: int = 0) -> None:
+        self.created: list[_StandInClient] = []
+        self.fail_first = fail_first
+        self.calls = 0
+
+    async def __call__(self) -> _StandInClient:
+        self.calls += 1
+        if self.calls <= self.fail_first:
+            raise ConnectionError("CLI not ready")
+        await asyncio.sleep(0)
+        client = _StandInClient(len(self.created))
+        self.created.append(client)
+        return client
+
+
+def test_pool_prewarms_and_serves_warm_checkouts():
+    factory = _Factory()
+    pool = ClientPool(factory, warm_size=2)
+
+    async def _scenario():
+        pool.start()
+        await pool.wait_warm()
+        assert len(pool) == 2
+
+        first = await pool.checkout()
+        second = await pool.checkout()
+        assert factory.calls == 2  # both served from the warm pool
+        await pool.wait_warm()
+        return first, second
+
+    first, second = asyncio.run(_scenario())
+
+    assert (first.number, second.number) == (0, 1)
+    assert len(pool) == 2
+    metrics = pool.metrics()
+    assert metrics["warm_checkouts"] == 2
+    assert metrics["cold_checkouts"] == 0
+    assert metrics["refilled"] == 4
+
+
+def test_drained_pool_connects_cold_and_refill_retries_failures():
+    factory = _Factory(fail_first=1)
+    pool = ClientPool(factory, warm_size=1, refill_backoff_seconds=0)
+
+    async def _scenario():
+        pool.start()
+        await pool.wait_warm()
+        return await pool.checkout()
+
+    client = asyncio.run(_scenario())
+
+    assert client.number == 0
+    assert pool.metrics()["refill_failures"] == 1
+
+
+def test_close_stops_refill_and_disconnects_idle_clients():
+    factory = _Factory()
+    pool = ClientPool(factory, warm_size=3)
+
+    async def _scenario():
+        pool.start()
+        await pool.wait_warm()
+        await pool.close()
+
+    asyncio.run(_scenario())
+
+    assert len(pool) == 0
+    assert all(client.disconnected for client in factory.created)
+
+
+def test_sessions_check_out_warm_clients_from_pool():
+    factory = _Factory()
+    pool = ClientPool(factory, warm_size=1)
+    store = SessionStore(pool.checkout, max_sessions=4, idle_ttl_seconds=60)
+
+    async def _scenario():
+        pool.start()
+        await pool.wait_warm()
+        async with store.lease("session-a") as client:
+            assert factory.calls == 1
+            assert client is factory.created[0]
+        await pool.wait_warm()
+        await store.close()
+        await pool.close()
+
+    asyncio.run(_scenario())
+
+    assert pool.metrics()["warm_checkouts"] == 1
+    assert all(client.disconnected for client in factory.created)
@@ -0,0 +1,130 @@
+"""Tests for the bounded agent session store in src.platform.api.agents.sessions."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.platform.api.agents.sessions import SessionCapacityError, SessionStore
+
+
+class _FakeClient:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.disconnected = False
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _store(clock: _Clock, created: list[_FakeClient], **kwargs) -> SessionStore:
+    async def _factory() -> _FakeClient:
+        client = _FakeClient(f"client-{len(created)}")
+        created.append(client)
+        return client
+
+    kwargs.setdefault("max_sessions", 2)
+    kwargs.setdefault("idle_ttl_seconds", 60)
+    return SessionStore(_factory, clock=clock, **kwargs)
+
+
+async def _use(store: SessionStore, session_id: str):
+    async with store.lease(session_id) as client:
+        return client
+
+
+def test_lease_reuses_client_and_evicts_least_recently_used():
+    clock, created = _Clock(), []
+    store = _store(clock, created)
+
+    async def _scenario():
+        first = await _use(store, "a")
+        assert await _use(store, "a") is first
+        await _use(store, "b")
+        await _use(store, "a")
+        await _use(store, "c")  # evicts "b", the least recently used
+        return first
+
+    first = asyncio.run(_scenario())
+
+    assert "a" in store and "c" in store and "b" not in store
+    assert created[1].disconnected is True
+    assert first.disconnected is False
+    metrics = store.metrics()
+    assert metrics["live_sessions"] == 2
+    assert metrics["evicted_lru"] == 1
+    assert metrics["created"] == 3
+
+
+def test_idle_sessions_expire_and_count_reconnects():
+    clock, created = _Clock(), []
+    store = _store(clock, created, idle_ttl_seconds=30)
+
+    async def _scenario():
+        await _use(store, "a")
+        clock.now = 31
+        assert await store.sweep() == 1
+        await _use(store, "a")
+
+    asyncio.run(_scenario())
+
+    assert created[0].disconnected is True
+    assert store.metrics()["evicted_idle"] == 1
+    assert store.metrics()["reconnects"] == 1
+
+
+def test_leased_clients_are_never_evicted_and_cap_rejects():
+    clock, created = _Clock(), []
+    store = _store(clock, created, max_sessions=1)
+
+    async def _scenario():
+        async with store.lease("a") as held:
+            with pytest.raises(SessionCapacityError):
+                await _use(store, "b")
+            return held
+
+    held = asyncio.run(_scenario())
+
+    assert held.disconnected is False
+    assert store.metrics()["capacity_rejections"] == 1
+
+
+def test_failed_lease_discards_client_and_close_disconnects_all():
+    clock, created = _Clock(), []
+    store = _store(clock, created)
+
+    async def _scenario():
+        with pytest.raises(RuntimeError):
+            async with store.lease("a"):
+                raise RuntimeError("agent crashed")
+        await _use(store, "b")
+        await store.close()
+
+    asyncio.run(_scenario())
+
+    assert all(client.disconnected for client in created)
+    assert len(store) == 0
+    assert store.metrics()["discarded"] == 1
+
+
+@patch(
+    "src.platform.api.agents.rag_router.ask_with_routing",
+    new_callable=AsyncMock,
+    side_effect=SessionCapacityError("all 32 agent clients are busy"),
+)
+def test_rag_chat_returns_503_with_retry_after_when_at_capacity(mock_route, client):
+    resp = client.post("/api/rag/chat", json={"message": "Hello"})
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "5"
+    assert "at capacity" in resp.json()["detail"]
@@ -0,0 +1,95 @@
+"""Tests for chat admission control in src.platform.api.agents.admission."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.platform.api.agents.admission import AdmissionController, AdmissionRejected
+
+
+def test_same_session_requests_run_one_at_a_time():
+    controller = AdmissionController(max_concurrent=4, max_queue=4)
+    order: list[str] = []
+
+    async def _turn(name: str) -> None:
+        async with controller.admit("session-a"):
+            order.append(f"{name}:start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}:end")
+
+    async def _scenario():
+        await asyncio.gather(_turn("first"), _turn("second"))
+
+    asyncio.run(_scenario())
+
+    assert order == ["first:start", "first:end", "second:start", "second:end"]
+    metrics = controller.metrics()
+    assert metrics["queued_total"] == 1
+    assert metrics["wait_ms_max"] > 0
+    assert metrics["in_flight"] == metrics["queue_depth"] == 0
+
+
+def test_global_cap_queues_then_rejects_when_queue_is_full():
+    controller = AdmissionController(max_concurrent=1, max_queue=1, retry_after_seconds=7)
+
+    async def _scenario():
+        gate = asyncio.Event()
+
+        async def _hold(session_id: str) -> None:
+            async with controller.admit(session_id):
+                await gate.wait()
+
+        running = asyncio.create_task(_hold("a"))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(_hold("b"))
+        await asyncio.sleep(0)
+        assert controller.metrics()["queue_depth"] == 1
+
+        with pytest.raises(AdmissionRejected) as excinfo:
+            async with controller.admit("c"):
+                pass
+        gate.set()
+        await asyncio.gather(running, queued)
+        return excinfo.value
+
+    rejected = asyncio.run(_scenario())
+
+    assert rejected.retry_after_seconds == 7
+    metrics = controller.metrics()
+    assert metrics["rejected_queue_full"] == 1
+    assert metrics["admitted"] == 2
+
+
+def test_queue_wait_times_out():
+    controller = AdmissionController(max_concurrent=1, max_queue=4, queue_timeout_seconds=0.01)
+
+    async def _scenario():
+        async with controller.admit("a"):
+            with pytest.raises(AdmissionRejected):
+                async with controller.admit("b"):
+                    pass
+        # The timed-out waiter released everything it held.
+        async with controller.admit("b"):
+            pass
+
+    asyncio.run(_scenario())
+
+    metrics = controller.metrics()
+    assert metrics["rejected_timeout"] == 1
+    assert metrics["queue_depth"] == 0
+
+
+@patch(
+    "src.platform.api.agents.rag_router.ask_with_routing",
+    new_callable=AsyncMock,
+    side_effect=AdmissionRejected("8 chats running and 16 queued", retry_after_seconds=2),
+)
+def test_rag_chat_returns_429_with_retry_after_when_saturated(mock_route, client):
+    resp = client.post("/api/rag/chat", json={"message": "Hello"})
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+    assert "Too many concurrent chats" in resp.json()["detail"]
@@ -3,6 +3,8 @@ profiling, check handlers, and orchestration helpers."""
 
 from __future__ import annotations
 
+import os
+import threading
 from datetime import datetime
 from unittest.mock import patch
 
@@ -10,8 +12,11 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from src.platform.api import data_profiles
 from src.platform.api.data_profiles import (
+    OverviewCache,
     ProfileError,
+    _RuleContext,
     _build_file_profile,
     _check_date_range,
     _check_exists,
@@ -23,16 +28,23 @@ from src.platform.api.data_profiles import (
     _check_row_count,
     _coerce_check_value,
     _column_profile,
+    _column_profiles,
+    _date_bounds,
     _evaluate_check,
+    _evaluate_plan,
+    _load_rules,
     _looks_like_date_series,
-    _parse_dates,
     _parse_rule_date,
     _safe_json_value,
+    _scan_file,
     _to_python_value,
     build_overview,
     evaluate_rules,
-    load_preview,
+    compile_rules,
+    load_rule_plan,
+    raw_fingerprint,
     resolve_raw_path,
+    scan_raw_directory,
     RAW_DATA_DIR,
 )
 
@@ -131,26 +143,34 @@ def test_looks_like_date_series_negative():
     assert _looks_like_date_series(s) is False
 
 
-def test_parse_dates_iso():
-    s = pd.Series(["2025-01-01", "2025-01-02", "2025-01-03"])
-    result = _parse_dates(s)
-    assert result is not None
-    assert len(result) == 3
+def test_looks_like_date_series_skips_numeric_dtype():
+    s = pd.Series([17261543, 7694424], name="impressions")
+    assert _looks_like_date_series(s) is False
+
+
+def test_date_bounds_iso():
+    s = pd.Series(["2025-01-03", "2025-01-01", "2025-01-02", "2025-01-01", None])
+    result = _date_bounds(s)
+    assert result == (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-03"))
 
 
-def test_parse_dates_month():
+def test_date_bounds_month():
     s = pd.Series(["2025-01", "2025-02", "2025-03"])
-    result = _parse_dates(s)
-    assert result is not None
-    assert len(result) == 3
+    result = _date_bounds(s)
+    assert result == (pd.Timestamp("2025-01-01"), pd.Timestamp("2025-03-01"))
 
 
-def test_parse_dates_empty():
+def test_date_bounds_empty():
     s = pd.Series([], dtype=str)
-    result = _parse_dates(s)
+    result = _date_bounds(s)
     assert result is None
 
 
+def test_date_bounds_rejects_identifiers():
+    s = pd.Series([f"ME{n}" for n in range(24541, 24600)], name="campaign_id")
+    assert _date_bounds(s) is None
+
+
 # ── C. Column profiling ─────────────────────────────────────────────────
 
 
@@ -181,6 +201,24 @@ def test_column_profile_text():
     assert "date_min" not in profile
 
 
+def test_column_profiles_single_pass_matches_per_column_contract():
+    df = pd.DataFrame({
+        "date": ["2025-01-02", "2025-01-01", None],
+        "spend": [10.5, None, 3.0],
+        "label": ["a", "a", "b"],
+    })
+    profiles = _column_profiles(df)
+
+    assert [p["name"] for p in profiles] == ["date", "spend", "label"]
+    assert profiles[0]["null_count"] == 1
+    assert profiles[0]["date_min"].startswith("2025-01-01")
+    assert profiles[1]["numeric_min"] == 3.0 and profiles[1]["numeric_max"] == 10.5
+    assert "date_min" not in profiles[1]
+    assert profiles[2]["distinct_count"] == 2
+    assert profiles[2]["sample_values"] == ["a", "b"]
+    assert profiles == [_column_profile(df[name]) for name in df.columns]
+
+
 # ── D. File profiling ───────────────────────────────────────────────────
 
 
@@ -204,6 +242,133 @@ def test_build_file_profile_contract(tmp_path):
     assert "rows" not in profile
 
 
+def test_scan_raw_directory_reads_each_csv_once(tmp_path):
+    (tmp_path / "a.csv").write_text("date,spend\n2025-01-01,100\n")
+    (tmp_path / "b.csv").write_text("x\n1\n2\n")
+    (tmp_path / "broken.csv").write_bytes(b"")
+    (tmp_path / "contracts").mkdir()
+    (tmp_path / "contracts" / "vendor.md").write_text("terms")
+    (tmp_path / ".gitkeep").write_text("")
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path), \
+         patch("src.platform.api.data_profiles.pd.read_csv", wraps=pd.read_csv) as read_csv:
+        profiles, frames = scan_raw_directory()
+
+    assert read_csv.call_count == 3
+    assert sorted(profiles) == ["a.csv", "b.csv", "broken.csv", os.path.join("contracts", "vendor.md")]
+    assert sorted(frames) == ["a.csv", "b.csv"]
+    assert profiles["b.csv"]["rows"] == 2
+    assert profiles["a.csv"]["date_columns"]["date"]["min"].startswith("2025-01-01")
+    assert profiles["broken.csv"]["error"] == "unable to parse"
+    assert profiles[os.path.join("contracts", "vendor.md")]["is_csv"] is False
+
+
+def test_scan_reuses_cached_profiles_for_unchanged_files(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a.csv").write_text("x\n1\n2\n")
+    (raw / "b.csv").write_text("y\n3\n")
+    (raw / "gone.csv").write_text("z\n4\n")
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", raw), \
+         patch("src.platform.api.data_profiles._scan_file", wraps=_scan_file) as scan_file:
+        first, _ = scan_raw_directory()
+        assert scan_file.call_count == 3
+
+        # Touch without changing bytes: the content hash keeps the cached profile.
+        stat = (raw / "a.csv").stat()
+        os.utime(raw / "a.csv", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (raw / "b.csv").write_text("y\n3\n5\n")
+        (raw / "gone.csv").unlink()
+        second, frames = scan_raw_directory()
+
+    assert [call.args[0].name for call in scan_file.call_args_list[3:]] == ["b.csv"]
+    assert sorted(second) == ["a.csv", "b.csv"]
+    assert second["a.csv"]["column_profiles"] == first["a.csv"]["column_profiles"]
+    assert second["a.csv"]["last_modified"] != first["a.csv"]["last_modified"]
+    assert second["b.csv"]["rows"] == 2
+    # Cached files' frames are read on first use by a rule.
+    assert "a.csv" in frames
+    assert frames.get("a.csv")["x"].tolist() == [1, 2]
+    assert frames.get("gone.csv") is None
+
+
+def test_large_files_use_streaming_profiler_and_flag_approximate_stats(tmp_path):
+    rows = 5_000
+    df = pd.DataFrame({
+        "date": pd.date_range("2025-01-01", periods=rows, freq="h").strftime("%Y-%m-%d"),
+        "spend": np.arange(rows, dtype=float),
+        "channel": ["meta", "tv", None, "ooh"] * (rows // 4),
+    })
+    csv = tmp_path / "big.csv"
+    df.to_csv(csv, index=False)
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path):
+        exact = _build_file_profile(csv)
+        with patch("src.platform.api.data_profiles._STREAM_PROFILE_BYTES", 1), \
+             patch("src.platform.api.data_profiles._STREAM_CHUNK_ROWS", 700):
+            streamed = _build_file_profile(csv)
+            profiles, frames = scan_raw_directory()
+
+    assert exact["profile_mode"] == "exact" and exact["approximate_stats"] == []
+    assert streamed["profile_mode"] == "streaming"
+    assert streamed["approximate_stats"] == ["distinct_count", "quantiles", "sample_values"]
+    for key in ("rows", "columns", "column_names", "overall_missing_ratio", "date_columns"):
+        assert streamed[key] == exact[key]
+    spend = streamed["column_profiles"][1]
+    assert (spend["numeric_min"], spend["numeric_max"]) == (0.0, rows - 1.0)
+    assert abs(spend["quantiles"]["p50"] - (rows - 1) / 2) < rows * 0.02
+    channel = streamed["column_profiles"][2]
+    assert channel["null_count"] == rows // 4
+    assert channel["distinct_count"] == 3
+    assert set(channel["sample_values"]) <= {"meta", "tv", "ooh"}
+    # Indexing still reads the frame on demand, but it is never cached.
+    assert profiles["big.csv"]["profile_mode"] == "streaming"
+    assert len(frames["big.csv"]) == rows
+    assert frames.streamed_path("big.csv") == csv
+    assert "big.csv" not in frames._loaded
+
+
+def test_rules_on_streamed_files_fold_columns_chunk_by_chunk(tmp_path):
+    rows = 3_000
+    (tmp_path / "dealers.csv").write_text("dealer_id\nD1\nD2\nD3\n")
+    pd.DataFrame({
+        "dealer_id": ["D1", "D2", "D9", None] * (rows // 4),
+        "channel": ["meta", "tv", None, "ooh"] * (rows // 4),
+        "spend": np.arange(rows, dtype=float),
+    }).to_csv(tmp_path / "leads.csv", index=False)
+    plan = compile_rules({
+        "files": [{"file": "leads.csv", "checks": [
+            {"id": "channels", "type": "required_values", "column": "channel", "values": ["meta", "tv"], "min_ratio": 0.2},
+            {"id": "spend", "type": "numeric_range", "column": "spend", "min": 0, "max": rows},
+            {"id": "channel_filled", "type": "min_non_null_ratio", "column": "channel", "min_ratio": 0.7},
+        ]}],
+        "cross_file_checks": [
+            {"id": "fk", "type": "foreign_key_reference", "source_file": "dealers.csv", "source_column": "dealer_id",
+             "target_file": "leads.csv", "target_column": "dealer_id", "min_match_ratio": 0.5},
+            {"id": "fk_nulls", "type": "foreign_key_reference", "source_file": "dealers.csv", "source_column": "dealer_id",
+             "target_file": "leads.csv", "target_column": "dealer_id", "ignore_nulls": False},
+        ],
+    })
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path):
+        profiles, frames = scan_raw_directory()
+        exact = _evaluate_plan(plan, profiles, frames)
+        with patch("src.platform.api.data_profiles.PROFILE_CACHE_PATH", tmp_path / "streamed_cache.json"), \
+             patch("src.platform.api.data_profiles._STREAM_PROFILE_BYTES", 1024), \
+             patch("src.platform.api.data_profiles._STREAM_CHUNK_ROWS", 700):
+            profiles, frames = scan_raw_directory()
+            with patch("src.platform.api.data_profiles._read_csv", wraps=data_profiles._read_csv) as read:
+                streamed = _evaluate_plan(plan, profiles, frames)
+
+    assert profiles["leads.csv"]["profile_mode"] == "streaming"
+    read.assert_not_called()
+    assert frames.streamed_path("leads.csv") is not None and "leads.csv" not in frames._loaded
+    assert streamed == exact
+    assert [exact[i]["status"] for i in range(len(plan.checks))] == ["pass", "pass", "pass", "pass", "fail"]
+    assert exact[3]["details"] == f"matched {rows // 2}/{rows * 3 // 4} target references"
+
+
 def test_resolve_raw_path():
     result = resolve_raw_path("test.csv")
     assert result == (RAW_DATA_DIR / "test.csv").resolve()
@@ -471,26 +636,199 @@ def test_build_overview():
     assert overview["summary"]["passing_checks"] == 1
 
 
-def test_load_preview_csv(tmp_path):
-    csv = tmp_path / "demo.csv"
-    csv.write_text("a,b\n1,2\n3,4\n")
-    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path):
-        result = load_preview("demo.csv", rows=10)
-    assert result["rows"] == 2
-    assert result["columns"] == ["a", "b"]
-    assert len(result["preview_rows"]) == 2
-
-
-def test_load_preview_markdown(tmp_path):
-    md = tmp_path / "note.md"
-    md.write_text("# Title\nLine 2\nLine 3\n")
-    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path):
-        result = load_preview("note.md")
-    assert result["rows"] == 3
-    assert result["columns"] == ["text"]
-
-
-def test_load_preview_nonexistent(tmp_path):
-    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path):
-        with pytest.raises(ProfileError):
-            load_preview("no_such_file.csv")
+def test_rule_plan_recompiles_only_when_yaml_changes(tmp_path):
+    rules = tmp_path / "rules.yml"
+    rules.write_text(
+        "files:\n"
+        "  - file: b.csv\n"
+        "    checks:\n"
+        "      - {id: b_rows, type: row_count_between, min: 1, max: 5}\n"
+        "  - file: a.csv\n"
+        "    checks:\n"
+        "      - {id: a_exists, type: exists}\n"
+        "cross_file_checks:\n"
+        "  - {id: fk, type: foreign_key_reference, source_file: a.csv, source_column: k,\n"
+        "     target_file: b.csv, target_column: k}\n"
+    )
+    with patch("src.platform.api.data_profiles.RULES_PATH", rules), \
+         patch("src.platform.api.data_profiles._load_rules", wraps=_load_rules) as load:
+        plan = load_rule_plan()
+        assert load_rule_plan() is plan
+        assert load.call_count == 1
+
+        stat = rules.stat()
+        os.utime(rules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_rule_plan() is not plan
+        assert load.call_count == 2
+
+    assert [check["id"] for check in plan.checks] == ["b_rows", "a_exists", "fk"]
+    # Execution is grouped by file: a.csv first, then both b.csv checks.
+    assert [plan.checks[i]["id"] for i in plan.execution_order] == ["a_exists", "b_rows", "fk"]
+
+
+def test_foreign_key_check_shares_source_keys_across_rules():
+    frames = _RuleContext({
+        "leads.csv": pd.DataFrame({"lead_id": ["L1", "L2", None]}),
+        "test_drives.csv": pd.DataFrame({"lead_id": ["L1", "L1", "L3", None]}),
+        "sales.csv": pd.DataFrame({"lead_id": ["L2", None]}),
+    })
+    base = {"source_file": "leads.csv", "source_column": "lead_id", "target_column": "lead_id"}
+
+    drives = _check_foreign_key_reference({**base, "target_file": "test_drives.csv"}, None, frames)
+    sales = _check_foreign_key_reference({**base, "target_file": "sales.csv"}, None, frames)
+    with_nulls = _check_foreign_key_reference(
+        {**base, "target_file": "sales.csv", "ignore_nulls": False}, None, frames
+    )
+
+    assert drives["observed"] == round(2 / 3, 6)
+    assert drives["details"] == "matched 2/3 target references"
+    assert sales["status"] == "pass"
+    assert with_nulls["observed"] == 0.5
+    assert frames.key_index("leads.csv", "lead_id") is frames.key_index("leads.csv", "lead_id")
+
+
+# ── G. Overview snapshot cache ──────────────────────────────────────────
+
+
+def test_raw_fingerprint_tracks_files_and_rules(tmp_path):
+    raw = tmp_path / "raw"
+    (raw / "contracts").mkdir(parents=True)
+    (raw / "a.csv").write_text("x\n1\n")
+    (raw / "contracts" / "c.md").write_text("terms")
+    (raw / ".gitkeep").write_text("")
+    rules = tmp_path / "rules.yml"
+    rules.write_text("files: []\n")
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", raw), \
+         patch("src.platform.api.data_profiles.RULES_PATH", rules):
+        first = raw_fingerprint()
+        assert [name for name, _, _ in first[0]] == ["a.csv", os.path.join("contracts", "c.md")]
+        assert raw_fingerprint() == first
+
+        (raw / "a.csv").write_text("x\n1\n2\n")
+        changed = raw_fingerprint()
+        assert changed != first
+
+        stat = rules.stat()
+        os.utime(rules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert raw_fingerprint() != changed
+
+
+def test_overview_cache_serves_snapshot_until_fingerprint_changes():
+    now = [0.0]
+    fingerprint = ["v1"]
+    builds = []
+
+    def _build():
+        builds.append(fingerprint[0])
+        return {"summary": {"scanned_at": fingerprint[0]}}
+
+    cache = OverviewCache(_build, lambda: fingerprint[0], check_interval_seconds=1.0, clock=lambda: now[0])
+
+    first = cache.get()
+    assert cache.get() is first
+    now[0] = 5.0
+    assert cache.get() is first
+    assert builds == ["v1"]
+
+    # Changed data: the stale snapshot is served while a background thread rebuilds.
+    fingerprint[0] = "v2"
+    now[0] = 10.0
+    assert cache.get() is first
+    cache.wait_for_refresh(5)
+    assert cache.get()["summary"]["scanned_at"] == "v2"
+    assert builds == ["v1", "v2"]
+    metrics = cache.metrics()
+    assert metrics["stale_hits"] == 1
+    assert metrics["rebuilds"] == 2
+
+
+def test_overview_cache_builds_once_for_concurrent_cold_requests():
+    release = threading.Event()
+    builds = []
+
+    def _build():
+        builds.append(1)
+        release.wait(5)
+        return {"summary": {}}
+
+    cache = OverviewCache(_build, lambda: "v1", check_interval_seconds=1.0)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(builds) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+
+
+def test_overview_cache_serves_only_published_snapshots_while_watched():
+    fingerprint = ["v1"]
+    builds = []
+
+    def _build():
+        builds.append(fingerprint[0])
+        return {"summary": {"scanned_at": fingerprint[0]}}
+
+    cache = OverviewCache(_build, lambda: fingerprint[0], check_interval_seconds=0.0)
+    cache.serve_published_only(True)
+
+    # A cold request waits for the watcher's first publish instead of scanning.
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(cache.get()))
+    waiter.start()
+    published = {"summary": {"scanned_at": "watcher"}}
+    while cache.metrics()["publish_waits"] == 0:
+        threading.Event().wait(0.01)
+    cache.publish(published, "v1")
+    waiter.join(5)
+    assert results == [published]
+
+    # Data changes before the next publish: still no fingerprint-driven rebuild.
+    fingerprint[0] = "v2"
+    assert cache.get() is published
+    cache.refresh_in_background()
+    cache.wait_for_refresh(5)
+    assert builds == []
+
+    # Once the watcher lets go, the cache notices the change itself.
+    cache.serve_published_only(False)
+    assert cache.get() is published
+    cache.wait_for_refresh(5)
+    assert builds == ["v2"]
+
+
+def test_overview_cache_builds_when_no_publish_arrives():
+    cache = OverviewCache(lambda: {"summary": {}}, lambda: "v1", check_interval_seconds=1.0, publish_wait_seconds=0.01)
+    cache.serve_published_only(True)
+
+    assert cache.get() == {"summary": {}}
+    assert cache.metrics()["publish_wait_timeouts"] == 1
+    assert cache.metrics()["rebuilds"] == 1
+
+
+def test_profile_cache_saves_from_concurrent_threads(tmp_path, caplog):
+    path = tmp_path / "processed" / "profile_cache.json"
+    source = tmp_path / "a.csv"
+    source.write_text("x\n1\n")
+
+    def _save(index):
+        cache = data_profiles._ProfileCache(path, tmp_path)
+        cache.store(f"{index}.csv", source, source.stat(), {"rows": index}, True)
+        for _ in range(20):
+            cache.dirty = True
+            cache.save()
+
+    threads = [threading.Thread(target=_save, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert "Could not write profile cache" not in caplog.text
+    saved = data_profiles._ProfileCache(path, tmp_path).entries
+    assert saved and set(saved) <= {f"{index}.csv" for index in range(4)}
+    assert list(path.parent.glob("*.tmp")) == []
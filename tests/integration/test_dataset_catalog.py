@@ -0,0 +1,59 @@
+"""Tests for the pandas-free dataset catalog behind /api/data/datasets."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.platform.api import dataset_catalog
+from src.platform.api.dataset_catalog import list_datasets
+
+
+@pytest.fixture()
+def raw_dir(tmp_path, monkeypatch):
+    raw = tmp_path / "raw"
+    (raw / "contracts").mkdir(parents=True)
+    (raw / "contracts" / "agreement.md").write_text("# terms\n")
+    (raw / "meta_ads.csv").write_text('date,note\n2025-01-01,"two\nlines"\n\n2025-01-02,plain\n')
+    (raw / "custom.csv").write_text("a\n1\n2\n3\n")
+    monkeypatch.setattr(dataset_catalog, "_entries", {})
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", raw):
+        yield raw
+
+
+def test_catalog_lists_csvs_with_category_rows_size_and_freshness(raw_dir):
+    with patch("pandas.read_csv", side_effect=AssertionError("catalog must not parse")), \
+         patch("src.platform.api.data_profiles.build_overview") as build:
+        datasets = list_datasets()
+
+    build.assert_not_called()
+    by_name = {d["name"]: d for d in datasets}
+    assert list(by_name) == ["custom.csv", "meta_ads.csv"]
+    meta = by_name["meta_ads.csv"]
+    assert meta["category"] == "Digital Media" and by_name["custom.csv"]["category"] == "Other"
+    assert meta["rows"] == len(pd.read_csv(raw_dir / "meta_ads.csv")) == 2
+    assert meta["columns"] == 2
+    assert meta["size_bytes"] == (raw_dir / "meta_ads.csv").stat().st_size
+    assert meta["updated"] == meta["modified_at"][:10]
+    assert meta["status"] == "ready" and meta["age_seconds"] >= 0
+
+
+def test_catalog_recounts_only_changed_files_and_drops_deleted_ones(raw_dir):
+    with patch.object(dataset_catalog, "row_index", wraps=dataset_catalog.row_index) as count:
+        list_datasets()
+        list_datasets()
+        assert count.call_count == 2
+
+        custom = raw_dir / "custom.csv"
+        before = custom.stat().st_mtime_ns
+        custom.write_text("a\n1\n2\n3\n4\n")
+        os.utime(custom, ns=(before, before + 1_000_000))
+        (raw_dir / "meta_ads.csv").unlink()
+        datasets = list_datasets()
+
+    assert count.call_count == 3
+    assert [(d["name"], d["rows"]) for d in datasets] == [("custom.csv", 4)]
+    assert set(dataset_catalog._entries) == {"custom.csv"}
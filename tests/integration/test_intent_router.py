@@ -0,0 +1,245 @@
+"""Tests for the local intent fast path (agents.intent + rag_router routing)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from claude_agent_sdk import AssistantMessage, TextBlock
+
+from src.platform.api import main
+from src.platform.api.agents import rag_router
+from src.platform.api.agents.intent import IntentClassifier, IntentDecision, load_intent_examples
+from src.platform.api.agents.sessions import SessionStore
+
+
+@pytest.fixture(scope="module")
+def classifier() -> IntentClassifier:
+    return IntentClassifier(*load_intent_examples())
+
+
+def test_seed_examples_do_not_include_eval_questions():
+    lookups, full_routing = load_intent_examples()
+    eval_path = Path(__file__).resolve().parents[1] / "evaluation" / "qa_dataset.json"
+    eval_questions = {item["question"] for item in json.loads(eval_path.read_text())["items"]}
+
+    assert lookups and full_routing
+    assert eval_questions.isdisjoint(question for question, _ in lookups)
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "What is the total value of the ITV airtime purchase agreement?",
+        "How many dealers are there?",
+        "What is the budget for TikTok?",
+    ],
+)
+def test_simple_lookups_take_fast_path(classifier, question):
+    decision = classifier.classify(question)
+
+    assert decision.fast_path is True
+    assert decision.confidence >= classifier.min_confidence
+
+
+@pytest.mark.parametrize(
+    "question, reason",
+    [
+        ("How should we reallocate the budget across channels?", "escalation keyword"),
+        ("What about radio?", "escalation keyword"),
+        ("Hello there", "no lookup pattern"),
+        ("What is the capital of France?", "low confidence"),
+    ],
+)
+def test_uncertain_or_analytical_questions_use_full_routing(classifier, question, reason):
+    decision = classifier.classify(question)
+
+    assert decision.fast_path is False
+    assert decision.reason == reason
+
+
+@pytest.mark.parametrize(
+    "question",
+    ["How many leads did it generate?", "What is the budget for those channels?"],
+)
+def test_pronouns_escalate_only_when_the_session_has_history(classifier, question):
+    fresh = classifier.classify(question)
+    follow_up = classifier.classify(question, has_history=True)
+
+    assert fresh.reason != "refers to an earlier turn"
+    assert follow_up.fast_path is False
+    assert follow_up.reason == "refers to an earlier turn"
+
+
+def test_plain_words_that_used_to_escalate_no_longer_do(classifier):
+    decision = classifier.classify("What is the budget for the media plan vs last year?")
+
+    assert decision.reason != "escalation keyword"
+
+
+def test_classifier_without_training_data_never_takes_fast_path():
+    decision = IntentClassifier([]).classify("What is the total budget?")
+
+    assert decision.fast_path is False
+    assert decision.reason == "no training data"
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    async def query(self, prompt: str) -> None:
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        yield AssistantMessage(content=[TextBlock(text="ITV is worth £3.3M.")], model="claude")
+
+    async def disconnect(self) -> None:
+        pass
+
+
+_LOOKUP = IntentDecision(True, "contracts", 0.9, "lookup", 0.5)
+_RESULTS = [
+    {
+        "score": 0.8,
+        "text": "ITV airtime purchase agreement total value £3,300,000",
+        "metadata": {"source_file": "itv_airtime_agreement.md"},
+    }
+]
+
+
+async def _run(client: _RecordingClient) -> list[dict]:
+    async def _factory():
+        return client
+
+    store = SessionStore(_factory, max_sessions=2, idle_ttl_seconds=60)
+    with patch.object(rag_router, "_sessions", store):
+        return [event async for event in rag_router.stream_with_routing("ITV value?", "s-1")]
+
+
+@patch.object(rag_router, "_route", return_value=_LOOKUP)
+@patch.object(rag_router, "_local_search", new_callable=AsyncMock, return_value=_RESULTS)
+def test_fast_path_sends_retrieved_context_in_one_query(mock_search, mock_route):
+    client = _RecordingClient()
+
+    events = asyncio.run(_run(client))
+
+    assert [event["type"] for event in events] == [
+        "session", "tool_start", "tool_end", "text", "final",
+    ]
+    assert events[2]["results"] == _RESULTS
+    assert len(client.queries) == 1
+    assert "ITV airtime purchase agreement total value" in client.queries[0]
+    assert "[itv_airtime_agreement.md]" in client.queries[0]
+    final = events[-1]
+    assert final["agent_used"] == "rag-fast-path"
+    assert final["sources"] == ["itv_airtime_agreement.md"]
+    assert final["route"]["path"] == "fast"
+
+
+@patch.object(rag_router, "_route", return_value=_LOOKUP)
+@patch.object(rag_router, "_local_search", new_callable=AsyncMock, side_effect=FileNotFoundError)
+def test_fast_path_search_failure_falls_back_to_full_routing(mock_search, mock_route):
+    client = _RecordingClient()
+
+    events = asyncio.run(_run(client))
+
+    assert client.queries == ["ITV value?"]
+    assert events[2]["is_error"] is True
+    assert events[-1]["agent_used"] == "rag-analyst"
+    assert events[-1]["route"]["path"] == "full"
+
+
+def test_router_passes_session_history_to_the_classifier():
+    async def _factory():
+        return _RecordingClient()
+
+    async def _run_twice():
+        store = SessionStore(_factory, max_sessions=2, idle_ttl_seconds=60)
+        with patch.object(rag_router, "_sessions", store), \
+             patch.object(rag_router, "_session_state") as state, \
+             patch.object(rag_router, "_route", wraps=rag_router._route) as route:
+            state.history.return_value = []
+            state.append_turn.return_value = 1
+            fresh = await rag_router._has_history("s-new")
+            async for _ in rag_router.stream_with_routing("How many dealers are there?", "s-new"):
+                pass
+            return fresh, await rag_router._has_history("s-new"), route.call_args.args
+
+    fresh, live, route_args = asyncio.run(_run_twice())
+
+    assert fresh is False and live is True
+    assert route_args == ("How many dealers are there?", False)
+
+
+def test_intent_warmup_failure_is_logged_and_awaited_on_shutdown(caplog):
+    async def _lifecycle():
+        with patch.object(rag_router._intent, "prepare", side_effect=RuntimeError("no sklearn")), \
+             patch.object(rag_router, "_FAST_PATH_ENABLED", True), \
+             patch.object(rag_router._pool, "start"), \
+             patch.object(rag_router._pool, "close", new_callable=AsyncMock), \
+             patch.object(rag_router._sessions, "close", new_callable=AsyncMock), \
+             patch.object(rag_router, "shutdown_tool_executor"):
+            rag_router.start_intent_warmup()
+            warmup = rag_router._intent_warmup
+            await asyncio.wait([warmup])
+            await asyncio.sleep(0)
+            await rag_router.shutdown_sessions()
+            return warmup
+
+    with caplog.at_level(logging.WARNING, logger=rag_router.logger.name):
+        warmup = asyncio.run(_lifecycle())
+
+    assert warmup.done()
+    assert rag_router._intent_warmup is None
+    assert "Intent model warm-up failed" in caplog.text
+
+
+def test_lifespan_warms_intent_model_without_a_warm_client_pool():
+    prepare = MagicMock()
+
+    async def _startup():
+        with patch.object(main, "_WARM_AGENT_CLIENTS", 0), \
+             patch.object(main, "_WARM_INTENT_MODEL", True), \
+             patch.object(main, "start_raw_watcher", return_value=True), \
+             patch.object(main, "stop_raw_watcher"), \
+             patch.object(rag_router, "_FAST_PATH_ENABLED", True), \
+             patch.object(rag_router._intent, "prepare", prepare), \
+             patch.object(rag_router._pool, "start") as pool_start, \
+             patch.object(rag_router._pool, "close", new_callable=AsyncMock), \
+             patch.object(rag_router._sessions, "close", new_callable=AsyncMock), \
+             patch.object(rag_router, "shutdown_tool_executor"):
+            async with main._lifespan(main.app):
+                await asyncio.wait([rag_router._intent_warmup])
+            return pool_start
+
+    pool_start = asyncio.run(_startup())
+
+    prepare.assert_called_once_with()
+    pool_start.assert_not_called()
+    assert rag_router._intent_warmup is None
+
+
+def test_routing_runs_off_the_event_loop():
+    loop_threads: list[bool] = []
+
+    def _route(question, has_history=False):
+        loop_threads.append(_on_loop())
+        return _LOOKUP
+
+    def _on_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    with patch.object(rag_router, "_route", side_effect=_route), \
+         patch.object(rag_router, "_local_search", new_callable=AsyncMock, return_value=_RESULTS):
+        asyncio.run(_run(_RecordingClient()))
+
+    assert loop_threads == [False]
@@ -7,10 +7,12 @@ from unittest.mock import patch
 import pytest
 
 from src.platform.api.data_profiles import ProfileError
+from src.platform.api.raw_preview import PreviewQueryError
 
 
-OVERVIEW_MOCK_TARGET = "src.platform.api.main.build_overview"
-PREVIEW_MOCK_TARGET = "src.platform.api.main.load_preview"
+OVERVIEW_MOCK_TARGET = "src.platform.api.main.get_overview"
+PREVIEW_MOCK_TARGET = "src.platform.api.main.query_preview"
+DATASETS_MOCK_TARGET = "src.platform.api.main.list_datasets"
 
 
 # ── Health & root ────────────────────────────────────────────────────────
@@ -104,19 +106,53 @@ def test_file_preview_not_found(mock_load, client):
     assert "missing.csv" in resp.json()["detail"]
 
 
+@patch(PREVIEW_MOCK_TARGET)
+def test_file_preview_forwards_paging_projection_filters_and_sort(mock_load, client):
+    mock_load.return_value = {"file_name": "test.csv", "rows": 5, "columns": ["a"], "preview_rows": []}
+    resp = client.get(
+        "/api/raw/dashboard/file/test.csv",
+        params=[("rows", 50), ("offset", 100), ("columns", "a,b"),
+                ("filter", "market:eq:GB"), ("filter", "spend:gt:10"), ("sort", "-spend,a")],
+    )
+    assert resp.status_code == 200
+    mock_load.assert_called_once_with(
+        "test.csv",
+        offset=100,
+        limit=50,
+        columns=["a", "b"],
+        filters=["market:eq:GB", "spend:gt:10"],
+        sort=["-spend", "a"],
+    )
+
+
+def test_file_preview_negative_offset(client):
+    resp = client.get("/api/raw/dashboard/file/test.csv?offset=-1")
+    assert resp.status_code == 400
+
+
+@patch(PREVIEW_MOCK_TARGET, side_effect=PreviewQueryError("unknown columns: nope"))
+def test_file_preview_bad_query(mock_load, client):
+    resp = client.get("/api/raw/dashboard/file/test.csv?columns=nope")
+    assert resp.status_code == 400
+    assert "nope" in resp.json()["detail"]
+
+
 # ── Dataset list ────────────────────────────────────────────────────────
 
 
 @patch(OVERVIEW_MOCK_TARGET)
-def test_data_datasets(mock_build, client, mock_overview):
-    mock_build.return_value = mock_overview
+@patch(DATASETS_MOCK_TARGET)
+def test_data_datasets(mock_list, mock_overview_fn, client):
+    mock_list.return_value = [{
+        "name": "test.csv", "category": "Other", "rows": 3, "columns": 2, "size_bytes": 20,
+        "modified_at": "2025-01-01T00:00:00", "updated": "2025-01-01", "status": "ready", "age_seconds": 5,
+    }]
     resp = client.get("/api/data/datasets")
     assert resp.status_code == 200
     datasets = resp.json()
-    assert isinstance(datasets, list)
-    csv_names = [d["name"] for d in datasets]
-    assert "test.csv" in csv_names
-    assert all("contracts" not in n for n in csv_names)
+    assert [d["name"] for d in datasets] == ["test.csv"]
+    assert datasets[0]["rows"] == 3
+    mock_overview_fn.assert_not_called()
 
 
 # ── __init__.py coverage ────────────────────────────────────────────────
@@ -0,0 +1,112 @@
+"""Tests for the in-process MMM agent tools (agents.tools + mmm_scripts.fitted_model)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.platform.api.agents import tools
+from src.platform.api.agents.tool_executor import ToolExecutor
+from src.platform.api.mmm_scripts import fitted_model
+
+_CHANNELS = fitted_model.CHANNELS
+
+
+def _write_model_ready(path, weeks: int = 40, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"week_start": pd.date_range("2025-01-06", periods=weeks, freq="W-MON")})
+    for ch in _CHANNELS:
+        df[f"spend_{ch}"] = rng.uniform(1000, 20000, weeks).round(2)
+        df[f"adstock_{ch}"] = (df[f"spend_{ch}"] * rng.uniform(1.1, 2.0)).round(2)
+    df["spend_total"] = df[[f"spend_{ch}" for ch in _CHANNELS]].sum(axis=1)
+    df["consumer_confidence_index"] = rng.normal(100, 3, weeks)
+    df["bank_rate_pct"] = rng.uniform(4, 5.5, weeks)
+    df["competitor_spend_weekly"] = rng.uniform(1e5, 3e5, weeks)
+    units = (df["adstock_tv"] * 0.002 + df["adstock_meta"] * 0.003 + rng.normal(20, 5, weeks)).round()
+    units[:8] = 0
+    df["units_sold"] = units
+    df["revenue"] = units * 32000.0
+    df.to_csv(path, index=False)
+
+
+def _call_all() -> list[dict]:
+    async def _scenario():
+        return [
+            await tools.run_regression.handler({}),
+            await tools.run_roi_analysis.handler({}),
+            await tools.run_budget_optimizer.handler({}),
+            await tools.run_adstock_curves.handler({}),
+        ]
+
+    return asyncio.run(_scenario())
+
+
+def test_mmm_tools_share_one_fit_and_refit_when_data_changes(tmp_path):
+    data_path = tmp_path / "model_ready.csv"
+    _write_model_ready(data_path)
+    executor = ToolExecutor(max_workers=2, max_pending=4, default_timeout_seconds=60)
+
+    with (
+        patch.object(fitted_model, "DATA_PATH", data_path),
+        patch.object(tools, "_shared_mmm", tools._SharedMMM()),
+        patch.object(tools, "_tool_executor", executor),
+        patch.object(fitted_model, "fit_mmm", wraps=fitted_model.fit_mmm) as fit,
+    ):
+        first = _call_all()
+        again = _call_all()
+        assert fit.call_count == 1
+
+        _write_model_ready(data_path, seed=1)
+        stat = data_path.stat()
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        refreshed = asyncio.run(tools.run_regression.handler({}))
+        assert fit.call_count == 2
+
+    assert all("isError" not in result for result in first)
+    assert again == first
+    regression = json.loads(first[0]["content"][0]["text"])
+    assert 0 <= regression["r_squared"] <= 1
+    roi = json.loads(first[1]["content"][0]["text"])
+    assert {row["name"] for row in roi["channels"]} == set(_CHANNELS)
+    assert refreshed != first[0]
+    executor.shutdown()
+
+
+def test_mmm_tool_without_model_ready_returns_structured_error(tmp_path):
+    with (
+        patch.object(fitted_model, "DATA_PATH", tmp_path / "missing.csv"),
+        patch.object(tools, "_shared_mmm", tools._SharedMMM()),
+    ):
+        result = asyncio.run(tools.run_roi_analysis.handler({}))
+
+    assert result["isError"] is True
+    error = json.loads(result["content"][0]["text"])["error"]
+    assert error["tool"] == "run_roi_analysis"
+
+
+def test_adstock_curves_reads_generator_config_without_importing_it(tmp_path):
+    data_path = tmp_path / "model_ready.csv"
+    _write_model_ready(data_path)
+    np.random.seed(1234)
+    expected_draw = np.random.random()
+    np.random.seed(1234)
+    path_before = list(sys.path)
+
+    with (
+        patch.object(fitted_model, "DATA_PATH", data_path),
+        patch.object(tools, "_shared_mmm", tools._SharedMMM()),
+    ):
+        result = asyncio.run(tools.run_adstock_curves.handler({}))
+
+    assert np.random.random() == expected_draw
+    assert sys.path == path_before
+    assert "config" not in sys.modules
+    channels = {row["name"]: row for row in json.loads(result["content"][0]["text"])["channels"]}
+    assert channels["tv"]["decay_rate"] == 0.85
+    assert channels["google"]["saturation_alpha"] == 0.75
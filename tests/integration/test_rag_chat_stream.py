@@ -0,0 +1,165 @@
+"""Tests for streamed chat responses (rag_router.stream_with_routing + /api/rag/chat/stream)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+from claude_agent_sdk import (
+    AssistantMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from src.platform.api.agents import rag_router
+from src.platform.api.agents.sessions import SessionCapacityError, SessionStore
+
+
+class _ScriptedClient:
+    """Stand-in for ClaudeSDKClient that replays a fixed message sequence."""
+
+    def __init__(self, messages: list, fail_after: int | None = None) -> None:
+        self.messages = messages
+        self.fail_after = fail_after
+        self.queries: list[str] = []
+        self.disconnected = False
+
+    async def query(self, prompt: str) -> None:
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        for index, message in enumerate(self.messages):
+            if self.fail_after is not None and index == self.fail_after:
+                raise ConnectionError("CLI exited")
+            yield message
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+def _store_for(client: _ScriptedClient) -> SessionStore:
+    async def _factory():
+        return client
+
+    return SessionStore(_factory, max_sessions=4, idle_ttl_seconds=60)
+
+
+def _tool_round_trip() -> list:
+    return [
+        AssistantMessage(
+            content=[ToolUseBlock(id="tool-1", name="mcp__rag__search_data", input={"query": "tv"})],
+            model="claude",
+        ),
+        UserMessage(content=[ToolResultBlock(tool_use_id="tool-1", content="rows", is_error=False)]),
+        AssistantMessage(content=[TextBlock(text="TV spend peaked in March")], model="claude"),
+        AssistantMessage(content=[TextBlock(text="(see tv_performance.csv)")], model="claude"),
+    ]
+
+
+async def _collect(question: str, session_id: str | None = None) -> list[dict]:
+    return [event async for event in rag_router.stream_with_routing(question, session_id)]
+
+
+def test_stream_emits_session_tool_text_and_final_events():
+    client = _ScriptedClient(_tool_round_trip())
+
+    with patch.object(rag_router, "_sessions", _store_for(client)):
+        events = asyncio.run(_collect("When did TV spend peak?", "s-1"))
+
+    assert [event["type"] for event in events] == [
+        "session", "tool_start", "tool_end", "text", "text", "final",
+    ]
+    assert events[1]["name"] == "mcp__rag__search_data"
+    assert events[2] == {
+        "type": "tool_end", "id": "tool-1", "name": "mcp__rag__search_data", "is_error": False,
+    }
+    final = events[-1]
+    assert final["reply"] == "TV spend peaked in March\n(see tv_performance.csv)"
+    assert final["sources"] == ["tv_performance.csv"]
+    assert final["agent_used"] == "rag-analyst"
+    assert final["timing"]["first_text_ms"] <= final["timing"]["total_ms"]
+    assert client.queries == ["When did TV spend peak?"]
+
+
+def test_ask_with_routing_wraps_stream_final_event():
+    client = _ScriptedClient(_tool_round_trip())
+
+    with patch.object(rag_router, "_sessions", _store_for(client)):
+        result = asyncio.run(rag_router.ask_with_routing("When did TV spend peak?", "s-1"))
+
+    assert result == {
+        "reply": "TV spend peaked in March\n(see tv_performance.csv)",
+        "sources": ["tv_performance.csv"],
+        "session_id": "s-1",
+        "agent_used": "rag-analyst",
+    }
+
+
+def test_failure_after_partial_text_emits_error_without_fallback():
+    client = _ScriptedClient(_tool_round_trip(), fail_after=3)
+
+    with patch.object(rag_router, "_sessions", _store_for(client)):
+        events = asyncio.run(_collect("When did TV spend peak?", "s-1"))
+
+    assert [event["type"] for event in events][-2:] == ["error", "final"]
+    assert events[-1]["agent_used"] == "rag-analyst"
+    assert events[-1]["reply"] == "TV spend peaked in March"
+    assert client.disconnected is True
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    parsed = []
+    for frame in body.strip().split("\n\n"):
+        name_line, data_line = frame.split("\n")
+        parsed.append((name_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return parsed
+
+
+async def _fake_stream(question: str, session_id: str | None = None):
+    yield {"type": "session", "session_id": session_id or "generated"}
+    yield {"type": "text", "text": f"echo: {question}"}
+    yield {"type": "final", "reply": f"echo: {question}", "sources": [], "agent_used": "rag-analyst"}
+
+
+@patch("src.platform.api.agents.rag_router.stream_with_routing", new=_fake_stream)
+def test_stream_endpoint_emits_server_sent_events(client):
+    resp = client.post("/api/rag/chat/stream", json={"message": "Hi", "session_id": "s-9"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(resp.text)
+    assert [name for name, _ in events] == ["session", "text", "final"]
+    assert events[0][1]["session_id"] == "s-9"
+    assert events[-1][1]["reply"] == "echo: Hi"
+
+
+@patch("src.platform.api.agents.rag_router.stream_with_routing", new=_fake_stream)
+def test_stream_endpoint_supports_ndjson(client):
+    resp = client.post("/api/rag/chat/stream?format=ndjson", json={"message": "Hi"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [event["type"] for event in lines] == ["session", "text", "final"]
+
+
+async def _busy_stream(question: str, session_id: str | None = None):
+    raise SessionCapacityError("all 32 agent clients are busy")
+    yield  # pragma: no cover - makes this an async generator
+
+
+@patch("src.platform.api.agents.rag_router.stream_with_routing", new=_busy_stream)
+def test_stream_endpoint_returns_503_before_streaming_when_at_capacity(client):
+    resp = client.post("/api/rag/chat/stream", json={"message": "Hi"})
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "5"
+
+
+def test_stream_endpoint_rejects_empty_message(client):
+    resp = client.post("/api/rag/chat/stream", json={"message": "  "})
+
+    assert resp.status_code == 400
@@ -0,0 +1,139 @@
+"""Tests for the row-offset index and the paged/filtered/sorted raw file preview."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.platform.api import raw_preview
+from src.platform.api.data_profiles import ProfileError
+from src.platform.api.raw_preview import (
+    PreviewQueryError,
+    build_row_index,
+    parse_filter,
+    query_preview,
+    row_index,
+)
+
+
+@pytest.fixture()
+def raw_dir(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", raw):
+        yield raw
+
+
+def _write_sales(path, rows: int = 50) -> pd.DataFrame:
+    df = pd.DataFrame({
+        "id": [f"S{i:03d}" for i in range(rows)],
+        "market": ["GB", "DE", "FR", "GB", None] * (rows // 5),
+        "spend": [float((i * 37) % 101) for i in range(rows)],
+        "note": [f'line "{i}"\nsecond, part' if i % 7 == 0 else f"n{i}" for i in range(rows)],
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_preview_csv(raw_dir):
+    (raw_dir / "demo.csv").write_text("a,b\n1,2\n3,4\n")
+    result = query_preview("demo.csv", limit=10)
+    assert result["rows"] == 2
+    assert result["columns"] == ["a", "b"]
+    assert result["preview_rows"] == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    assert result["has_more"] is False
+
+
+def test_preview_markdown(raw_dir):
+    (raw_dir / "note.md").write_text("# Title\nLine 2\nLine 3\n")
+    result = query_preview("note.md")
+    assert result["rows"] == 3
+    assert result["columns"] == ["text"]
+
+
+def test_preview_nonexistent(raw_dir):
+    with pytest.raises(ProfileError):
+        query_preview("no_such_file.csv")
+
+
+def test_row_index_counts_rows_across_quoted_newlines_and_blank_lines(tmp_path):
+    csv = tmp_path / "quoted.csv"
+    csv.write_bytes(b'id,text\r\n1,"multi\nline, ""quoted"""\r\n\r\n2,plain\n\n3,last')
+
+    with patch.object(raw_preview, "_INDEX_STRIDE", 2):
+        index = build_row_index(csv, csv.stat())
+
+    assert index.columns == ["id", "text"]
+    assert index.rows == len(pd.read_csv(csv)) == 3
+    assert len(index.offsets) == 2
+
+
+def test_pages_seek_from_the_index(raw_dir):
+    df = _write_sales(raw_dir / "sales.csv", rows=50)
+
+    with patch.object(raw_preview, "_INDEX_STRIDE", 8):
+        pages = [query_preview("sales.csv", offset=offset, limit=9) for offset in range(0, 50, 9)]
+
+    assert [page["rows"] for page in pages] == [50] * 6
+    assert [row["id"] for page in pages for row in page["preview_rows"]] == df["id"].tolist()
+    assert pages[0]["preview_rows"][0]["note"] == 'line "0"\nsecond, part'
+    assert pages[-1]["has_more"] is False and pages[0]["has_more"] is True
+    assert query_preview("sales.csv", offset=60)["preview_rows"] == []
+
+
+def test_row_index_is_persisted_and_rebuilt_only_when_the_file_changes(raw_dir):
+    csv = raw_dir / "sales.csv"
+    _write_sales(csv, rows=20)
+
+    with patch.object(raw_preview, "build_row_index", wraps=build_row_index) as build:
+        assert row_index(csv).rows == 20
+        raw_preview._indexes.clear()  # a fresh worker loads the persisted index
+        assert row_index(csv).rows == 20
+        assert build.call_count == 1
+
+        _write_sales(csv, rows=25)
+        stat = csv.stat()
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert row_index(csv).rows == 25
+        assert build.call_count == 2
+
+
+def test_filters_sort_and_projection(raw_dir):
+    df = _write_sales(raw_dir / "sales.csv", rows=50)
+
+    with patch.object(raw_preview, "_QUERY_CHUNK_ROWS", 7):
+        result = query_preview(
+            "sales.csv",
+            offset=2,
+            limit=4,
+            columns=["id", "spend"],
+            filters=["market:eq:GB", "spend:ge:20"],
+            sort=["-spend", "id"],
+        )
+
+    expected = (
+        df[(df["market"] == "GB") & (df["spend"] >= 20)]
+        .sort_values(["spend", "id"], ascending=[False, True])
+    )
+    assert result["columns"] == ["id", "spend"]
+    assert result["rows"] == 50
+    assert result["matched_rows"] == len(expected)
+    assert [row["id"] for row in result["preview_rows"]] == expected["id"].iloc[2:6].tolist()
+    assert set(result["preview_rows"][0]) == {"id", "spend"}
+
+    contains = query_preview("sales.csv", filters=["note:contains:SECOND"], limit=50)
+    assert contains["matched_rows"] == int(df["note"].str.contains("second").sum())
+
+
+def test_invalid_queries_raise_preview_query_error(raw_dir):
+    _write_sales(raw_dir / "sales.csv", rows=10)
+
+    with pytest.raises(PreviewQueryError, match="unknown columns: nope"):
+        query_preview("sales.csv", columns=["id", "nope"])
+    with pytest.raises(PreviewQueryError, match="invalid value"):
+        query_preview("sales.csv", filters=["spend:gt:lots"])
+    with pytest.raises(PreviewQueryError, match="unknown filter op"):
+        parse_filter("spend:between:1")
@@ -0,0 +1,103 @@
+"""Tests for the declared raw/MMM CSV schemas and the typed loaders built on them."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.platform.api.data_profiles import (
+    RAW_DATA_DIR,
+    _build_file_profile,
+    _load_rules,
+)
+from src.platform.api.raw_preview import query_preview
+from src.platform.api.raw_schemas import MODEL_READY_SCHEMA, RAW_SCHEMAS, raw_schema
+
+_META_CSV = (
+    "date,campaign_name,campaign_id,platform,objective,market,model,impressions,clicks,spend\n"
+    "2025-01-02,META_A,ME1,Instagram,awareness,GB,DEEPAL S07,1000,10,25.5\n"
+    "2025-01-01,META_B,ME2,Facebook,leads,GB,AVATR 11,2000,20,40.0\n"
+)
+
+
+def test_registry_declares_every_column_the_prd_checks_use():
+    rules = _load_rules()
+    for entry in rules["files"]:
+        if not entry["file"].endswith(".csv"):
+            continue
+        schema = RAW_SCHEMAS[entry["file"]]
+        for check in entry.get("checks", []):
+            referenced = [*check.get("columns", []), *([check["column"]] if "column" in check else [])]
+            assert set(referenced) <= set(schema.columns), check["id"]
+            if check["type"] == "date_range":
+                assert check["column"] in schema.dates, check["id"]
+    for check in rules.get("cross_file_checks", []):
+        if check["type"] == "date_range":
+            assert check["column"] in RAW_SCHEMAS[check["file"]].dates, check["id"]
+        for side in ("source", "target"):
+            if f"{side}_file" in check:
+                assert check[f"{side}_column"] in RAW_SCHEMAS[check[f"{side}_file"]].columns, check["id"]
+
+
+@pytest.mark.parametrize("name", sorted(RAW_SCHEMAS))
+def test_committed_raw_files_read_cleanly_with_their_schema(name):
+    path = RAW_DATA_DIR / name
+    if not path.is_file():
+        pytest.skip(f"{name} not generated")
+    schema = RAW_SCHEMAS[name]
+    df = schema.read_csv(path)
+
+    assert sorted(df.columns) == sorted(schema.columns)
+    for column in schema.categoricals:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    for column in schema.dates:
+        assert pd.api.types.is_datetime64_any_dtype(df[column])
+
+
+def test_declared_schema_types_profile_without_date_sniffing(tmp_path):
+    csv = tmp_path / "meta_ads.csv"
+    csv.write_text(_META_CSV)
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path), \
+         patch("src.platform.api.data_profiles._looks_like_date_series") as sniff:
+        profile = _build_file_profile(csv)
+        preview = query_preview("meta_ads.csv")
+
+    sniff.assert_not_called()
+    columns = {col["name"]: col for col in profile["column_profiles"]}
+    assert columns["market"]["dtype"] == "category"
+    assert columns["impressions"]["dtype"] == "int64"
+    assert columns["date"]["dtype"].startswith("datetime64")
+    assert columns["date"]["sample_values"] == ["2025-01-02", "2025-01-01"]
+    assert list(profile["date_columns"]) == ["date"]
+    assert profile["global_date_min"].startswith("2025-01-01")
+    assert preview["preview_rows"][0]["date"] == "2025-01-02"
+
+
+def test_schema_drift_falls_back_to_inferred_types(tmp_path, caplog):
+    csv = tmp_path / "meta_ads.csv"
+    # A blank in an int64 column no longer matches the declaration.
+    csv.write_text(_META_CSV + "2025-01-03,META_C,ME3,Instagram,awareness,GB,DEEPAL S07,,5,1.0\n")
+
+    with patch("src.platform.api.data_profiles.RAW_DATA_DIR", tmp_path):
+        profile = _build_file_profile(csv)
+
+    assert "error" not in profile
+    assert "does not match its declared schema" in caplog.text
+    columns = {col["name"]: col for col in profile["column_profiles"]}
+    assert columns["impressions"]["dtype"] == "float64"
+    assert columns["impressions"]["null_count"] == 1
+    assert profile["date_columns"]["date"]["max"].startswith("2025-01-03")
+
+
+def test_model_ready_schema_parses_week_start_and_tolerates_missing_columns(tmp_path):
+    csv = tmp_path / "model_ready.csv"
+    csv.write_text("week_start,spend_tv,units_sold\n2025-01-06,100,0\n2025-01-13,250.5,3\n")
+
+    df = MODEL_READY_SCHEMA.read_csv(csv)
+
+    assert pd.api.types.is_datetime64_any_dtype(df["week_start"])
+    assert df["units_sold"].dtype == "float64"
+    assert raw_schema("model_ready.csv") is None
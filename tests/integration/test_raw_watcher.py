@@ -0,0 +1,242 @@
+"""Tests for the incremental raw-data state, the watcher, and the SSE change feed."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.platform.api import data_profiles, raw_watcher
+from src.platform.api.data_profiles import RawDataState, build_overview
+from src.platform.api.raw_watcher import ChangeFeed, RawDataWatcher
+
+_RULES = """
+files:
+  - file: dealers.csv
+    checks:
+      - id: dealers_rows
+        type: row_count_between
+        min: 2
+        max: 10
+  - file: leads.csv
+    checks:
+      - id: leads_rows
+        type: row_count_between
+        min: 1
+        max: 10
+cross_file_checks:
+  - id: leads_dealer_fk
+    type: foreign_key_reference
+    source_file: dealers.csv
+    source_column: dealer_id
+    target_file: leads.csv
+    target_column: dealer_id
+"""
+
+
+@pytest.fixture()
+def raw_dir(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    rules = tmp_path / "dashboard_checks.yml"
+    rules.write_text(_RULES)
+    (raw / "dealers.csv").write_text("dealer_id,name\nD1,North\nD2,South\n")
+    (raw / "leads.csv").write_text("lead_id,dealer_id\nL1,D1\nL2,D2\n")
+    with patch.object(data_profiles, "RAW_DATA_DIR", raw), patch.object(data_profiles, "RULES_PATH", rules):
+        yield raw
+
+
+def _write(path, text: str) -> None:
+    """Write and move the mtime forward, so coarse filesystem clocks still see a change."""
+    existed = path.exists()
+    before = path.stat().st_mtime_ns if existed else 0
+    path.write_text(text)
+    stat = path.stat()
+    if existed and stat.st_mtime_ns <= before:
+        os.utime(path, ns=(stat.st_atime_ns, before + 1_000_000))
+
+
+def _statuses(checks):
+    return {check["id"]: check["status"] for check in checks}
+
+
+def _without_timestamps(overview):
+    return {**overview, "summary": {k: v for k, v in overview["summary"].items() if k != "scanned_at"}}
+
+
+def test_apply_reprofiles_and_rechecks_only_the_changed_file(raw_dir):
+    state = RawDataState()
+    assert _statuses(state.load()["checks"]) == {"dealers_rows": "pass", "leads_rows": "pass", "leads_dealer_fk": "pass"}
+
+    _write(raw_dir / "leads.csv", "lead_id,dealer_id\nL1,D1\nL2,D9\n")
+    with patch.object(data_profiles, "_scan_file", wraps=data_profiles._scan_file) as scan, \
+         patch.object(data_profiles, "_evaluate_check", wraps=data_profiles._evaluate_check) as evaluate:
+        diff = state.apply(["leads.csv"])
+
+    assert [call.args[0].name for call in scan.call_args_list] == ["leads.csv"]
+    assert sorted(call.args[0]["id"] for call in evaluate.call_args_list) == ["leads_dealer_fk", "leads_rows"]
+    assert (diff["created"], diff["modified"], diff["deleted"]) == ([], ["leads.csv"], [])
+    assert [profile["file_name"] for profile in diff["files"]] == ["leads.csv"]
+    assert _statuses(diff["checks"]) == {"leads_dealer_fk": "fail"}
+    assert diff["summary"]["failing_checks"] == 1
+    assert _without_timestamps(state.overview()) == _without_timestamps(build_overview())
+
+
+def test_apply_handles_created_deleted_and_touched_files(raw_dir):
+    state = RawDataState()
+    state.load()
+
+    (raw_dir / "dealers.csv").unlink()
+    (raw_dir / "notes.md").write_text("# notes\n")
+    diff = state.apply(["dealers.csv", "notes.md"])
+    assert (diff["created"], diff["deleted"]) == (["notes.md"], ["dealers.csv"])
+    assert _statuses(diff["checks"]) == {"dealers_rows": "fail", "leads_dealer_fk": "fail"}
+    assert diff["summary"]["total_files"] == 2
+
+    stat = (raw_dir / "leads.csv").stat()
+    os.utime(raw_dir / "leads.csv", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    with patch.object(data_profiles, "_scan_file") as scan:
+        touched = state.apply(["leads.csv"])
+    scan.assert_not_called()
+    assert touched["modified"] == [] and touched["checks"] == []
+    assert _without_timestamps(state.overview()) == _without_timestamps(build_overview())
+
+
+def test_watcher_sync_publishes_diffs_and_snapshots(raw_dir):
+    feed = ChangeFeed()
+    published = []
+    watcher = RawDataWatcher(feed, publish_snapshot=lambda snapshot, fingerprint: published.append(fingerprint))
+
+    assert watcher.sync() is None
+    assert published == [data_profiles.raw_fingerprint()]
+    assert watcher.sync() is None and len(published) == 1
+
+    _write(raw_dir / "dealers.csv", "dealer_id,name\nD1,North\n")
+    event = watcher.sync()
+    assert event["type"] == "diff" and event["id"] == f"{feed.epoch}-1"
+    assert event["modified"] == ["dealers.csv"]
+    assert _statuses(event["checks"]) == {"dealers_rows": "fail", "leads_dealer_fk": "fail"}
+    assert published[-1] == data_profiles.raw_fingerprint()
+
+    rules = data_profiles.RULES_PATH
+    _write(rules, _RULES.replace("min: 2", "min: 1"))
+    event = watcher.sync()
+    assert event["rules_changed"] is True
+    assert _statuses(event["checks"]) == {"dealers_rows": "pass"}
+
+
+def test_polling_watcher_thread_pushes_a_new_file(raw_dir):
+    feed = ChangeFeed()
+    snapshots = []
+    watcher = RawDataWatcher(
+        feed,
+        backend="polling",
+        poll_seconds=0.05,
+        publish_snapshot=lambda snapshot, fingerprint: snapshots.append(snapshot),
+    )
+    watcher.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not snapshots and time.monotonic() < deadline:
+            time.sleep(0.02)
+        (raw_dir / "extra.csv").write_text("a\n1\n")
+        while len(snapshots) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        watcher.stop()
+
+    assert watcher.backend_name == "polling"
+    assert "extra.csv" in [item["file_name"] for item in snapshots[-1]["files"]]
+
+
+def test_inotify_backend_wakes_on_writes_in_new_subdirectories(tmp_path):
+    try:
+        backend = raw_watcher._InotifyBackend(tmp_path, tmp_path)
+    except OSError:
+        pytest.skip("inotify unavailable")
+    try:
+        assert backend.wait(0.01) is False
+        (tmp_path / "nested").mkdir()
+        assert backend.wait(1.0) is True
+        backend.settle(0.05)
+        (tmp_path / "nested" / "file.csv").write_text("a\n1\n")
+        assert backend.wait(1.0) is True
+    finally:
+        backend.close()
+
+
+def test_feed_fans_out_replays_and_resets():
+    feed = ChangeFeed(history=2, queue_size=2)
+
+    async def _collect(stream, count):
+        return [await anext(stream) for _ in range(count)]
+
+    async def _run():
+        live = feed.subscribe()
+        first = asyncio.ensure_future(_collect(live, 2))
+        await asyncio.sleep(0)
+        publisher = threading.Thread(target=lambda: [feed.publish("diff", {"n": n}) for n in (1, 2)])
+        publisher.start()
+        received = await asyncio.wait_for(first, 5)
+        publisher.join()
+
+        feed.publish("diff", {"n": 3})
+        replay = await _collect(feed.subscribe(f"{feed.epoch}-1"), 2)
+        too_old = await _collect(feed.subscribe(f"{feed.epoch}-0"), 1)
+        foreign = await _collect(feed.subscribe("elsewhere-3"), 1)
+        idle = await _collect(feed.subscribe(keepalive_seconds=0.01), 1)
+        await live.aclose()
+        return received, replay, too_old, foreign, idle
+
+    received, replay, too_old, foreign, idle = asyncio.run(_run())
+    assert [event["n"] for event in received] == [1, 2]
+    assert [event["n"] for event in replay] == [2, 3]
+    assert too_old[0]["type"] == "reset" and foreign[0]["type"] == "reset"
+    assert idle == [None]
+    assert feed.subscribers == 0
+
+
+def test_feed_resets_a_subscriber_that_falls_behind():
+    feed = ChangeFeed(queue_size=2)
+
+    async def _run():
+        stream = feed.subscribe()
+        waiting = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        first = feed.publish("diff", {"n": 1})
+        assert (await waiting)["seq"] == first["seq"]
+        for n in range(2, 6):
+            feed.publish("diff", {"n": n})
+        await asyncio.sleep(0)
+        event = await anext(stream)
+        await stream.aclose()
+        return event
+
+    assert asyncio.run(_run())["type"] == "reset"
+
+
+def test_events_endpoint_streams_feed_events(client):
+    with patch("src.platform.api.main.watcher_running", return_value=False):
+        assert client.get("/api/raw/dashboard/events").status_code == 503
+
+    feed = ChangeFeed()
+    event = feed.publish("diff", {"created": ["a.csv"]})
+
+    async def _finite(last_event_id=None):
+        assert last_event_id == "seen-0"
+        yield None
+        yield event
+
+    with patch("src.platform.api.main.watcher_running", return_value=True), \
+         patch.object(feed, "subscribe", _finite), \
+         patch("src.platform.api.main.change_feed", return_value=feed):
+        resp = client.get("/api/raw/dashboard/events", headers={"Last-Event-ID": "seen-0"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text.startswith(": keepalive\n\n")
+    assert f"id: {event['id']}\nevent: diff\ndata: " in resp.text
@@ -0,0 +1,103 @@
+"""Tests for the deterministic retrieval-backed fallback (agents.fallback + rag_router)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from src.platform.api.agents import rag_router
+from src.platform.api.agents.fallback import answer_from_retrieval, format_answer, wants_assets
+from src.platform.api.agents.sessions import SessionStore
+
+_TEXT_HITS = [
+    {
+        "score": 0.9,
+        "text": "ITV airtime purchase agreement.\n  Total value: £3,300,000 (July-December 2025).",
+        "metadata": {"source_file": "data/raw/contracts/itv_airtime_agreement.md", "category": "contracts"},
+    },
+    {
+        "score": 0.7,
+        "text": "date,channel,spend\n2025-07-07,tv,120000",
+        "metadata": {
+            "source_file": "data/raw/tv_performance.csv",
+            "category": "traditional_media",
+            "date_min": "2025-07-07",
+            "date_max": "2025-07-27",
+            "row_range": "1-3",
+        },
+    },
+]
+_ASSET_HITS = [
+    {
+        "score": 0.8,
+        "text": "DEEPAL S07 hero shot on a coastal road",
+        "metadata": {
+            "source_file": "data/assets/manifest.csv",
+            "image_path": "data/assets/meta/s07_hero.png",
+            "channel": "meta",
+            "vehicle_model": "DEEPAL S07",
+        },
+    }
+]
+
+
+def test_format_answer_renders_markdown_with_numbered_citations():
+    answer = format_answer(_TEXT_HITS, _ASSET_HITS)
+
+    assert answer.sources == ["itv_airtime_agreement.md", "tv_performance.csv", "manifest.csv"]
+    assert "1. **itv_airtime_agreement.md** (contracts) — ITV airtime purchase agreement. Total value" in answer.reply
+    assert "(traditional_media, 2025-07-07 to 2025-07-27, rows 1-3)" in answer.reply
+    assert "`data/assets/meta/s07_hero.png` (meta, DEEPAL S07)" in answer.reply
+    assert answer.reply.endswith(
+        "**Sources:** [1] itv_airtime_agreement.md · [2] tv_performance.csv · [3] manifest.csv"
+    )
+
+
+def test_format_answer_without_hits_apologises():
+    answer = format_answer([], [])
+
+    assert answer.sources == []
+    assert "no matching records" in answer.reply
+
+
+async def _inline(tool_name, fn):
+    return fn()
+
+
+def test_answer_from_retrieval_searches_assets_only_for_asset_questions():
+    with (
+        patch("src.rag.retrieval.query_engine.search_text", return_value=_TEXT_HITS) as text,
+        patch("src.rag.retrieval.query_engine.search_assets", return_value=_ASSET_HITS) as assets,
+    ):
+        plain = asyncio.run(answer_from_retrieval("What is the ITV deal worth?", _inline))
+        visual = asyncio.run(answer_from_retrieval("Show me S07 creatives", _inline))
+
+    assert text.call_count == 2
+    assert assets.call_count == 1
+    assert "manifest.csv" not in plain.sources
+    assert "manifest.csv" in visual.sources
+    assert wants_assets("any banner ads?") and wants_assets("Show the Meta ad creative")
+    assert not wants_assets("total TV budget")
+    assert not wants_assets("Which Meta ads drove the most leads?")
+    assert not wants_assets("What was the CPC on Google Ads in March?")
+
+
+def test_router_falls_back_to_retrieval_when_agent_cannot_connect():
+    async def _failing_factory():
+        raise ConnectionError("CLI not found")
+
+    store = SessionStore(_failing_factory, max_sessions=2, idle_ttl_seconds=60)
+
+    async def _scenario():
+        return await rag_router.ask_with_routing("What is the ITV deal worth?", "s-1")
+
+    with (
+        patch.object(rag_router, "_sessions", store),
+        patch.object(rag_router, "_FAST_PATH_ENABLED", False),
+        patch("src.rag.retrieval.query_engine.search_text", return_value=_TEXT_HITS),
+    ):
+        result = asyncio.run(_scenario())
+
+    assert result["agent_used"] == "retrieval-fallback"
+    assert result["sources"] == ["itv_airtime_agreement.md", "tv_performance.csv"]
+    assert "£3,300,000" in result["reply"]
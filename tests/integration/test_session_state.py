@@ -0,0 +1,155 @@
+"""Tests for durable chat transcripts (agents.session_state + rag_router rehydration)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from claude_agent_sdk import AssistantMessage, TextBlock
+
+from src.platform.api.agents import rag_router
+from src.platform.api.agents.session_state import SessionStateStore, compact_transcript
+from src.platform.api.agents.sessions import SessionStore
+
+
+class _EchoClient:
+    def __init__(self, reply: str) -> None:
+        self.reply = reply
+        self.queries: list[str] = []
+
+    async def query(self, prompt: str) -> None:
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        yield AssistantMessage(content=[TextBlock(text=self.reply)], model="claude")
+
+    async def disconnect(self) -> None:
+        pass
+
+
+def _worker_store(client: _EchoClient) -> SessionStore:
+    async def _factory():
+        return client
+
+    return SessionStore(_factory, max_sessions=4, idle_ttl_seconds=60)
+
+
+async def _collect(question: str) -> list[dict]:
+    return [event async for event in rag_router.stream_with_routing(question, "s-1")]
+
+
+def test_store_is_shared_across_instances_and_trims_old_turns(tmp_path):
+    path = tmp_path / "sessions.sqlite3"
+    writer = SessionStateStore(path, max_turns_per_session=2, retention_seconds=60)
+    reader = SessionStateStore(path, max_turns_per_session=2, retention_seconds=60)
+
+    for n in range(3):
+        writer.append_turn("s-1", f"question {n}", f"reply {n}", "rag-analyst")
+
+    turns = reader.history("s-1")
+    assert [turn.seq for turn in turns] == [2, 3]
+    assert turns[-1].question == "question 2"
+    assert reader.history("unknown") == []
+    assert compact_transcript(turns[-1:], reply_chars=4) == "User: question 2\nAssistant: rep…"
+
+
+def test_prune_drops_sessions_idle_past_retention(tmp_path):
+    now = [1000.0]
+    store = SessionStateStore(
+        tmp_path / "sessions.sqlite3", max_turns_per_session=5, retention_seconds=60,
+        clock=lambda: now[0],
+    )
+    store.append_turn("old", "q", "r", "rag-analyst")
+    now[0] += 120
+    store.append_turn("new", "q", "r", "rag-analyst")
+
+    assert store.prune() == 1
+    assert store.history("old") == []
+    metrics = store.metrics()
+    assert metrics["stored_sessions"] == 1
+    assert metrics["stored_turns"] == 1
+    assert metrics["pruned_sessions"] == 1
+
+
+def test_second_worker_rehydrates_session_from_shared_store(tmp_path):
+    shared = SessionStateStore(tmp_path / "sessions.sqlite3", max_turns_per_session=10, retention_seconds=60)
+    first = _EchoClient("Meta had the best CPL in March (meta_ads.csv)")
+    second = _EchoClient("TikTok CPL was higher")
+
+    async def _ask(question: str):
+        return await rag_router.ask_with_routing(question, "s-1")
+
+    with (
+        patch.object(rag_router, "_session_state", shared),
+        patch.object(rag_router, "_FAST_PATH_ENABLED", False),
+    ):
+        with patch.object(rag_router, "_sessions", _worker_store(first)):
+            asyncio.run(_ask("Which channel had the best CPL in March?"))
+        # A different worker (its own SessionStore) receives the follow-up.
+        with patch.object(rag_router, "_sessions", _worker_store(second)):
+            events = asyncio.run(_collect("How does TikTok compare?"))
+
+    assert first.queries == ["Which channel had the best CPL in March?"]
+    replayed = second.queries[0]
+    assert "User: Which channel had the best CPL in March?" in replayed
+    assert "Assistant: Meta had the best CPL in March" in replayed
+    assert replayed.rstrip().endswith("How does TikTok compare?")
+    assert events[-1]["rehydrated"] is True
+    assert [turn.question for turn in shared.history("s-1")] == [
+        "Which channel had the best CPL in March?",
+        "How does TikTok compare?",
+    ]
+
+
+def test_live_session_is_not_replayed(tmp_path):
+    shared = SessionStateStore(tmp_path / "sessions.sqlite3", max_turns_per_session=10, retention_seconds=60)
+    client = _EchoClient("ok")
+
+    async def _scenario():
+        first = await rag_router.ask_with_routing("first question", "s-1")
+        events = [event async for event in rag_router.stream_with_routing("second question", "s-1")]
+        return first, events
+
+    with (
+        patch.object(rag_router, "_session_state", shared),
+        patch.object(rag_router, "_FAST_PATH_ENABLED", False),
+        patch.object(rag_router, "_sessions", _worker_store(client)),
+    ):
+        _, events = asyncio.run(_scenario())
+
+    assert client.queries == ["first question", "second question"]
+    assert events[-1]["rehydrated"] is False
+
+
+def test_live_client_catches_up_on_turns_served_by_another_worker(tmp_path):
+    shared = SessionStateStore(tmp_path / "sessions.sqlite3", max_turns_per_session=10, retention_seconds=60)
+    client_a = _EchoClient("reply from A")
+    client_b = _EchoClient("Radio CPL was 41 GBP")
+    worker_a, worker_b = _worker_store(client_a), _worker_store(client_b)
+
+    async def _turn(store: SessionStore, question: str) -> list[dict]:
+        with patch.object(rag_router, "_sessions", store):
+            return [event async for event in rag_router.stream_with_routing(question, "s-1")]
+
+    async def _scenario():
+        await _turn(worker_a, "turn one")
+        await _turn(worker_a, "turn two")
+        await _turn(worker_b, "What about radio?")
+        return await _turn(worker_a, "And versus TV?"), await _turn(worker_a, "turn five")
+
+    with (
+        patch.object(rag_router, "_session_state", shared),
+        patch.object(rag_router, "_FAST_PATH_ENABLED", False),
+    ):
+        caught_up, next_turn = asyncio.run(_scenario())
+
+    assert client_a.queries[:2] == ["turn one", "turn two"]
+    catch_up = client_a.queries[2]
+    assert "User: What about radio?" in catch_up
+    assert "Assistant: Radio CPL was 41 GBP" in catch_up
+    assert "turn two" not in catch_up
+    assert catch_up.rstrip().endswith("And versus TV?")
+    assert caught_up[-1]["rehydrated"] is True
+    assert client_a.queries[3] == "turn five"
+    assert next_turn[-1]["rehydrated"] is False
+    assert shared.history("s-1", after_seq=3)[0].question == "And versus TV?"
@@ -0,0 +1,52 @@
+"""Tests for the streaming sketches in src/platform/api/sketches.py."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.platform.api.sketches import HyperLogLog, Reservoir, TDigest
+
+
+def test_hyperloglog_estimates_distinct_counts_across_chunks():
+    values = pd.Series(np.arange(200_000) % 50_000)
+    sketch = HyperLogLog()
+    for start in range(0, len(values), 30_000):
+        sketch.add(values.iloc[start:start + 30_000])
+
+    assert abs(sketch.count() - 50_000) / 50_000 < 0.05
+    small = HyperLogLog()
+    small.add(pd.Series(["a", "b", "b", None, "c"]))
+    assert small.count() == 3
+
+
+def test_hyperloglog_hashes_ints_and_floats_alike():
+    sketch = HyperLogLog()
+    sketch.add(pd.Series([1, 2, 3]))
+    sketch.add(pd.Series([1.0, 2.0, np.nan]))
+    assert sketch.count() == 3
+
+
+def test_tdigest_quantiles_track_exact_values():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=200_000)
+    digest = TDigest()
+    for chunk in np.array_split(values, 8):
+        digest.add(chunk)
+
+    for q in (0.05, 0.5, 0.95):
+        exact = np.quantile(values, q)
+        assert abs(digest.quantile(q) - exact) / exact < 0.02
+    assert digest.count == len(values)
+    assert TDigest().quantile(0.5) is None
+
+
+def test_reservoir_keeps_bounded_uniform_sample():
+    reservoir = Reservoir(10, seed=1)
+    for start in range(0, 100_000, 7_000):
+        reservoir.add(pd.Series(np.arange(start, min(start + 7_000, 100_000))))
+
+    assert len(reservoir.values) == 10
+    assert reservoir.seen == 100_000
+    # A uniform sample of 10 from 0..99999 almost surely reaches past the first chunk.
+    assert max(reservoir.values) > 7_000
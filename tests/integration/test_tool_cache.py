@@ -0,0 +1,90 @@
+"""Tests for the shared MCP tool result cache (agents.tool_cache + agents.tools)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.platform.api.agents import tool_cache, tools
+from src.platform.api.agents.tool_cache import ToolResultCache
+
+
+def test_cache_evicts_least_recently_used_by_entries_and_bytes():
+    cache = ToolResultCache(max_entries=2, max_bytes=10)
+    a, b, c = (cache.key("search_data", {"query": q}, "v1") for q in "abc")
+
+    cache.put(a, "aaaa")
+    cache.put(b, "bbbb")
+    assert cache.get(a) == "aaaa"
+    cache.put(c, "cccc")  # over max_entries: evicts b
+    assert cache.get(b) is None
+
+    cache.put(b, "bbbbbbb")  # 3 entries and 15 bytes: evicts a, then c
+    assert len(cache) == 1
+    assert cache.metrics()["bytes"] == 7
+    assert cache.metrics()["evictions"] == 3
+
+
+def test_key_depends_on_index_version_and_argument_values():
+    key = ToolResultCache.key
+
+    assert key("search_data", {"top_k": 5, "query": "tv"}, "v1") == key(
+        "search_data", {"query": "tv", "top_k": 5}, "v1"
+    )
+    assert key("search_data", {"query": "tv"}, "v1") != key("search_data", {"query": "tv"}, "v2")
+    assert key("search_data", {"query": "tv"}, "v1") != key("search_assets", {"query": "tv"}, "v1")
+
+
+@pytest.fixture()
+def fresh_cache():
+    cache = ToolResultCache(max_entries=8, max_bytes=1024 * 1024)
+    with patch.object(tool_cache, "shared_cache", cache):
+        yield cache
+
+
+def test_search_data_reuses_payload_until_index_version_changes(fresh_cache):
+    calls: list[dict] = []
+
+    def _fake_search_text(**kwargs):
+        calls.append(kwargs)
+        return [{"score": 1.0, "text": "TV spend", "metadata": {"source_file": "tv_performance.csv"}}]
+
+    version = {"value": "v1"}
+    with (
+        patch("src.rag.retrieval.query_engine.search_text", side_effect=_fake_search_text),
+        patch("src.rag.retrieval.query_engine.index_version", side_effect=lambda: version["value"]),
+    ):
+        first = asyncio.run(tools.search_data.handler({"query": "tv spend"}))
+        second = asyncio.run(tools.search_data.handler({"query": "tv spend", "top_k": 5, "channel": ""}))
+        version["value"] = "v2"
+        asyncio.run(tools.search_data.handler({"query": "tv spend"}))
+
+    assert first == second
+    assert json.loads(first["content"][0]["text"])[0]["metadata"]["source_file"] == "tv_performance.csv"
+    assert len(calls) == 2
+    assert fresh_cache.metrics()["hits"] == 1
+
+
+def test_search_errors_are_not_cached(fresh_cache):
+    with (
+        patch("src.rag.retrieval.query_engine.search_assets", side_effect=FileNotFoundError("no index")),
+        patch("src.rag.retrieval.query_engine.index_version", return_value="v1"),
+    ):
+        result = asyncio.run(tools.search_assets.handler({"query": "s07", "top_k": 3, "channel": "meta"}))
+
+    assert result["isError"] is True
+    assert len(fresh_cache) == 0
+
+
+def test_rag_metrics_reads_the_shared_cache_from_tool_cache(client, fresh_cache):
+    from src.platform.api.agents import rag_router
+
+    fresh_cache.put(fresh_cache.key("search_data", {"query": "tv"}, "v1"), "{}")
+    with patch("src.platform.api.main._loaded_rag_router", return_value=rag_router):
+        metrics = client.get("/api/rag/metrics").json()
+
+    assert metrics["tool_cache"]["entries"] == 1
+    assert not hasattr(rag_router, "tool_cache_metrics")
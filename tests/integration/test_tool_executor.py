@@ -0,0 +1,119 @@
+"""Tests for bounded tool execution (agents.tool_executor + agents.tools)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.platform.api import main
+from src.platform.api.agents import tool_cache, tools
+from src.platform.api.agents.tool_cache import ToolResultCache
+from src.platform.api.agents.tool_executor import ToolBusyError, ToolExecutor, ToolTimeoutError
+
+
+def test_run_returns_result_off_the_event_loop():
+    executor = ToolExecutor(max_workers=1, max_pending=0, default_timeout_seconds=5)
+    loop_thread = threading.get_ident()
+
+    result = asyncio.run(executor.run("search_data", threading.get_ident))
+
+    assert result != loop_thread
+    assert executor.metrics()["completed"] == 1
+    executor.shutdown()
+
+
+def test_deadline_raises_timeout_and_busy_pool_rejects():
+    executor = ToolExecutor(
+        max_workers=1, max_pending=0, default_timeout_seconds=5, timeouts={"slow": 0.05}
+    )
+    release = threading.Event()
+
+    async def _scenario():
+        with pytest.raises(ToolTimeoutError) as excinfo:
+            await executor.run("slow", lambda: release.wait(5))
+        # The timed-out call still occupies the only worker (and its slot) until it returns.
+        assert executor.metrics()["in_flight"] == 1
+        with pytest.raises(ToolBusyError):
+            await executor.run("other", lambda: None)
+        release.set()
+        deadline = time.monotonic() + 5
+        while executor.metrics()["in_flight"] and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert await executor.run("other", lambda: "ok") == "ok"
+        return excinfo.value
+
+    timeout = asyncio.run(_scenario())
+
+    assert timeout.timeout_seconds == 0.05
+    metrics = executor.metrics()
+    assert metrics["timeouts"] == 1
+    assert metrics["rejected_busy"] == 1
+    assert metrics["in_flight"] == 0
+    executor.shutdown()
+
+
+def test_cancelled_call_never_starts_when_still_queued():
+    executor = ToolExecutor(max_workers=1, max_pending=4, default_timeout_seconds=5)
+    release = threading.Event()
+    started: list[str] = []
+
+    async def _scenario():
+        running = asyncio.ensure_future(executor.run("a", lambda: release.wait(5)))
+        queued = asyncio.ensure_future(executor.run("b", lambda: started.append("b")))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await running
+
+    asyncio.run(_scenario())
+    time.sleep(0.05)
+
+    assert started == []
+    assert executor.metrics()["cancelled"] == 1
+    assert executor.metrics()["in_flight"] == 0
+    executor.shutdown()
+
+
+def test_search_tool_timeout_returns_structured_error():
+    executor = ToolExecutor(
+        max_workers=1, max_pending=0, default_timeout_seconds=5, timeouts={"search_data": 0.01}
+    )
+    with (
+        patch.object(tools, "_tool_executor", executor),
+        patch.object(tool_cache, "shared_cache", ToolResultCache(max_entries=4, max_bytes=1024)),
+        patch("src.rag.retrieval.query_engine.search_text", side_effect=lambda **_: time.sleep(0.2)),
+        patch("src.rag.retrieval.query_engine.index_version", return_value="v1"),
+    ):
+        result = asyncio.run(tools.search_data.handler({"query": "tv spend"}))
+
+    assert result["isError"] is True
+    error = json.loads(result["content"][0]["text"])["error"]
+    assert error["type"] == "timeout"
+    assert error["retryable"] is True
+    assert error["timeout_seconds"] == 0.01
+    executor.shutdown()
+
+
+class _DisconnectedRequest:
+    async def is_disconnected(self) -> bool:
+        return True
+
+
+def test_chat_run_is_cancelled_when_client_disconnects():
+    async def _scenario():
+        run = asyncio.ensure_future(asyncio.sleep(10))
+        with patch.object(main, "_DISCONNECT_POLL_SECONDS", 0.01):
+            cancelled = await main._cancel_on_disconnect(_DisconnectedRequest(), run)
+        return cancelled, run
+
+    cancelled, run = asyncio.run(_scenario())
+
+    assert cancelled is True
+    assert run.cancelled()
@@ -9,6 +9,7 @@ from qdrant_client import QdrantClient
 from qdrant_client.http.models import Distance, VectorParams
 
 from src.rag.data_processing import build_index
+from src.rag.embeddings.indexer import RAGIndexer
 
 
 def test_help_documents_all_flags():
@@ -21,6 +22,9 @@ def test_help_documents_all_flags():
     assert "--assets" in help_text
     assert "--check" in help_text
     assert "--sample" in help_text
+    assert "--dedup-mode" in help_text
+    assert "--dedup-threshold" in help_text
+    assert parser.parse_args([]).dedup_mode == "tag"
 
 
 def test_dry_run_prints_estimate_without_build(monkeypatch, capsys):
@@ -72,7 +76,7 @@ def test_max_cost_guard_aborts_before_build(monkeypatch, capsys):
         def build_text_index(self, docs: list[Document]) -> None:
             build_calls.append(f"text:{len(docs)}")
 
-        def build_bm25_index(self, docs: list[Document]) -> None:
+        def build_bm25_index(self, docs: list[Document], rebuild: bool = False) -> None:
             build_calls.append(f"bm25:{len(docs)}")
 
     monkeypatch.setattr(build_index, "RAGIndexer", _FakeIndexer)
@@ -95,7 +99,21 @@ def test_max_cost_guard_aborts_before_build(monkeypatch, capsys):
     assert build_calls == []
 
 
-def test_text_flag_builds_text_and_bm25_only(monkeypatch):
+def test_dedup_threshold_out_of_range_aborts(monkeypatch, capsys):
+    monkeypatch.setattr(
+        build_index,
+        "load_all_text_documents",
+        lambda: (_ for _ in ()).throw(AssertionError("loader should not run")),
+    )
+
+    exit_code = build_index.main(["--dry-run", "--dedup-threshold", "0"])
+    output = capsys.readouterr().out
+
+    assert exit_code == 1
+    assert "--dedup-threshold must be in (0, 1]" in output
+
+
+def test_text_flag_builds_text_and_bm25_only(tmp_path, monkeypatch):
     calls: list[str] = []
     docs = [Document(text="Meta CPM benchmark", metadata={"source_file": "meta_ads.csv"})]
 
@@ -104,8 +122,9 @@ def test_text_flag_builds_text_and_bm25_only(monkeypatch):
             assert passed_docs == docs
             calls.append("text")
 
-        def build_bm25_index(self, passed_docs: list[Document]) -> None:
+        def build_bm25_index(self, passed_docs: list[Document], rebuild: bool = False) -> None:
             assert passed_docs == docs
+            assert rebuild
             calls.append("bm25")
 
         def build_asset_index(self, passed_docs: list[Document]) -> None:
@@ -120,13 +139,37 @@ def test_text_flag_builds_text_and_bm25_only(monkeypatch):
         lambda: (_ for _ in ()).throw(AssertionError("assets loader should not run")),
     )
 
-    exit_code = build_index.main(["--text"])
+    monkeypatch.setattr(build_index, "discover_text_sources", lambda: [])
+    exit_code = build_index.main(["--text", "--manifest", str(tmp_path / "manifest.json")])
 
     assert exit_code == 0
     assert calls == ["text", "bm25"]
 
 
-def test_assets_flag_builds_assets_only(monkeypatch):
+def test_full_build_replaces_existing_bm25_artifacts(tmp_path, monkeypatch):
+    bm25_dir = tmp_path / "bm25"
+    stale = Document(id_="stale", text="Radio airtime contract", metadata={"source_file": "radio.md"})
+    RAGIndexer(qdrant_path=str(tmp_path / "qdrant"), bm25_path=str(bm25_dir)).build_bm25_index([stale])
+    docs = [Document(id_="fresh", text="Meta CPM benchmark", metadata={"source_file": "meta_ads.csv"})]
+
+    class _TextlessIndexer(RAGIndexer):
+        def __init__(self) -> None:
+            super().__init__(qdrant_path=str(tmp_path / "qdrant"), bm25_path=str(bm25_dir))
+
+        def build_text_index(self, passed_docs: list[Document]) -> None:
+            _ = passed_docs
+
+    monkeypatch.setattr(build_index, "RAGIndexer", _TextlessIndexer)
+    monkeypatch.setattr(build_index, "load_all_text_documents", lambda: docs)
+    monkeypatch.setattr(build_index, "discover_text_sources", lambda: [])
+    argv = ["--text", "--dedup-mode", "off", "--manifest", str(tmp_path / "manifest.json")]
+
+    assert build_index.main(argv) == 0
+    reloaded = _TextlessIndexer().build_bm25_index([])
+    assert {result.node.node_id for result in reloaded.retrieve("Meta CPM radio airtime")} == {"fresh"}
+
+
+def test_assets_flag_builds_assets_only(tmp_path, monkeypatch):
     calls: list[str] = []
     docs = [
         Document(
@@ -140,7 +183,7 @@ def test_assets_flag_builds_assets_only(monkeypatch):
             _ = passed_docs
             calls.append("text")
 
-        def build_bm25_index(self, passed_docs: list[Document]) -> None:
+        def build_bm25_index(self, passed_docs: list[Document], rebuild: bool = False) -> None:
             _ = passed_docs
             calls.append("bm25")
 
@@ -156,7 +199,8 @@ def test_assets_flag_builds_assets_only(monkeypatch):
     )
     monkeypatch.setattr(build_index, "load_asset_documents", lambda: docs)
 
-    exit_code = build_index.main(["--assets"])
+    monkeypatch.setattr(build_index, "discover_asset_sources", lambda: [])
+    exit_code = build_index.main(["--assets", "--manifest", str(tmp_path / "manifest.json")])
 
     assert exit_code == 0
     assert calls == ["assets"]
@@ -175,12 +219,14 @@ def test_sample_mode_uses_predefined_files(monkeypatch):
         observed_contract_files.append(md_path.name)
         return [Document(text=md_path.name, metadata={"source_file": str(md_path)})]
 
-    def _fake_config_loader() -> Document:
+    def _fake_config_loader() -> list[Document]:
         observed["config_calls"] += 1
-        return Document(
-            text="config",
-            metadata={"source_file": "data/generators/config.py"},
-        )
+        return [
+            Document(
+                text="config",
+                metadata={"source_file": "data/generators/config.py"},
+            )
+        ]
 
     def _fake_asset_loader() -> list[Document]:
         observed["asset_calls"] += 1
@@ -193,7 +239,7 @@ def test_sample_mode_uses_predefined_files(monkeypatch):
 
     monkeypatch.setattr(build_index, "load_csv_documents", _fake_csv_loader)
     monkeypatch.setattr(build_index, "load_contract_documents", _fake_contract_loader)
-    monkeypatch.setattr(build_index, "load_config_document", _fake_config_loader)
+    monkeypatch.setattr(build_index, "load_config_documents", _fake_config_loader)
     monkeypatch.setattr(build_index, "load_asset_documents", _fake_asset_loader)
 
     exit_code = build_index.main(["--dry-run", "--sample"])
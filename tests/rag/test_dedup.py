@@ -0,0 +1,132 @@
+"""Tests for near-duplicate suppression in src.rag.data_processing.dedup."""
+
+from __future__ import annotations
+
+import pytest
+from llama_index.core import Document
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from src.rag.data_processing import dedup
+from src.rag.retrieval import query_engine
+
+_HEADER = "date,campaign_name,campaign_id,platform,spend,clicks\n"
+
+
+def _csv_chunk(day: int, spend: float, source_file: str = "data/raw/meta_ads.csv") -> Document:
+    rows = "".join(
+        f"2025-03-{day:02d},META_GB_S07_AWR_{name}_202503{day:02d},ME{10000 + i + day},"
+        f"Facebook,{spend + i},{120 + i}\n"
+        for i, name in enumerate(["YOUNG", "CONQUEST", "FAMILY", "LUXURY", "EV"])
+    )
+    return Document(
+        text=_HEADER + rows,
+        metadata={
+            "source_file": source_file,
+            "file_type": "csv",
+            "row_range": f"{day * 5 - 4}-{day * 5}",
+        },
+    )
+
+
+def _distinct_chunk() -> Document:
+    return Document(
+        text=_HEADER + "2025-11-28,TT_GB_S05_CNV_BLACKFRIDAY,TT998877,TikTok,98765.4,4321\n",
+        metadata={"source_file": "data/raw/meta_ads.csv", "file_type": "csv", "row_range": "99-99"},
+    )
+
+
+def _repeat(doc: Document, row_range: str) -> Document:
+    return Document(text=doc.text, metadata={**doc.metadata, "row_range": row_range})
+
+
+def test_collapse_keeps_representative_with_row_range_links():
+    first = _csv_chunk(3, 250.0)
+    docs = [first, _repeat(first, "16-20"), _distinct_chunk()]
+
+    kept, report = dedup.suppress_near_duplicates(docs, threshold=0.8, mode="collapse")
+
+    assert kept == [docs[0], docs[2]]
+    assert docs[0].metadata["duplicate_count"] == 1
+    assert docs[0].metadata["duplicate_row_ranges"] == ["16-20"]
+    assert "duplicate_row_ranges" in docs[0].excluded_embed_metadata_keys
+    assert report.duplicates == 1
+    assert report.chunks_out == 2
+    assert report.tokens_saved > 0
+
+
+def test_collapse_never_drops_similar_but_different_tabular_chunks():
+    docs = [_csv_chunk(3, 250.0), _csv_chunk(4, 251.0), _distinct_chunk()]
+    assert dedup.find_near_duplicate_groups(docs, threshold=0.8) == [[0, 1]]
+
+    kept, report = dedup.suppress_near_duplicates(docs, threshold=0.8, mode="collapse")
+
+    assert kept == docs
+    assert report.duplicates == 0 and report.tokens_saved == 0
+    assert "duplicate_count" not in docs[0].metadata
+
+
+def test_collapse_still_merges_near_duplicate_prose():
+    text = "The agency shall invoice monthly in arrears and payment is due within thirty days of invoice. "
+    docs = [
+        Document(text=text * 3, metadata={"source_file": "contracts/terms.md", "file_type": "md"}),
+        Document(text=text * 3 + "Signed.", metadata={"source_file": "contracts/terms.md", "file_type": "md"}),
+    ]
+
+    kept, _ = dedup.suppress_near_duplicates(docs, threshold=0.8, mode="collapse")
+
+    assert kept == [docs[0]]
+
+
+def test_collapse_widens_representative_date_range_and_entities():
+    first = _csv_chunk(3, 250.0)
+    second = _repeat(first, "16-20")
+    first.metadata.update(
+        date_min="2025-03-03", date_max="2025-03-03", date_min_key=20250303,
+        date_max_key=20250303, campaign=["META_A"], market=["GB"],
+    )
+    second.metadata.update(
+        date_min="2025-03-04", date_max="2025-03-04", date_min_key=20250304,
+        date_max_key=20250304, campaign=["META_B"], market=["GB"],
+    )
+
+    kept, _ = dedup.suppress_near_duplicates([first, second], threshold=0.8, mode="collapse")
+
+    assert len(kept) == 1
+    assert (kept[0].metadata["date_min"], kept[0].metadata["date_max"]) == (
+        "2025-03-03",
+        "2025-03-04",
+    )
+    assert kept[0].metadata["date_max_key"] == 20250304
+    assert kept[0].metadata["campaign"] == ["META_A", "META_B"]
+    assert kept[0].metadata["market"] == ["GB"]
+
+
+def test_duplicates_are_not_grouped_across_source_files():
+    docs = [_csv_chunk(3, 250.0), _csv_chunk(4, 251.0, source_file="data/raw/google_ads.csv")]
+
+    assert dedup.find_near_duplicate_groups(docs, threshold=0.8) == []
+
+
+def test_tag_is_the_default_and_search_drops_clones():
+    docs = [_csv_chunk(3, 250.0), _csv_chunk(4, 251.0), _distinct_chunk()]
+
+    kept, report = dedup.suppress_near_duplicates(docs, threshold=0.8)
+
+    assert kept == docs
+    assert report.tokens_saved == 0
+    assert docs[0].metadata["dup_group"] == docs[1].metadata["dup_group"] == docs[0].doc_id
+    assert "dup_group" not in docs[2].metadata
+
+    nodes = [
+        NodeWithScore(node=TextNode(text=doc.text, metadata=dict(doc.metadata)), score=1.0)
+        for doc in docs
+    ]
+    unique = query_engine._drop_tagged_duplicates(nodes)
+    assert [node.node.text for node in unique] == [docs[0].text, docs[2].text]
+
+
+def test_invalid_mode_and_threshold_are_rejected():
+    with pytest.raises(ValueError, match="mode must be one of"):
+        dedup.suppress_near_duplicates([_distinct_chunk()], mode="drop")
+    with pytest.raises(ValueError, match="threshold must be in"):
+        dedup.find_near_duplicate_groups([_distinct_chunk()], threshold=1.5)
@@ -29,30 +29,30 @@ def test_build_asset_index_sets_image_path_metadata(tmp_path: Path, monkeypatch)
     def _fake_reset(collection_name: str) -> None:
         calls["collection_name"] = collection_name
 
-    def _fake_from_documents(
-        documents: list[Document],
+    def _fake_vector_store_index(
+        nodes: list[Document],
         storage_context,
         embed_model,
-        transformations,
     ) -> str:
-        calls["from_documents_called"] = True
+        calls["index_called"] = True
         assert storage_context is not None
         assert embed_model is not None
-        assert transformations == []
-        assert all("image_path" in doc.metadata for doc in documents)
+        # Documents are indexed as-is so no extra chunking runs and ids are kept.
+        assert nodes is docs
+        assert all("image_path" in doc.metadata for doc in nodes)
         return "asset-index"
 
     monkeypatch.setattr(indexer, "_reset_collection", _fake_reset)
     monkeypatch.setattr(
-        "src.rag.embeddings.indexer.VectorStoreIndex.from_documents",
-        _fake_from_documents,
+        "src.rag.embeddings.indexer.VectorStoreIndex",
+        _fake_vector_store_index,
     )
 
     result = indexer.build_asset_index(docs)
 
     assert result == "asset-index"
     assert calls["collection_name"] == "campaign_assets"
-    assert calls["from_documents_called"] is True
+    assert calls["index_called"] is True
     assert docs[0].metadata["image_path"] == "s07.png"
     assert docs[1].metadata["image_path"] == ""
 
@@ -0,0 +1,50 @@
+"""Tests for config fact extraction in src.rag.data_processing.ingest."""
+
+from __future__ import annotations
+
+from src.rag.data_processing import ingest
+from src.rag.data_processing.config_constants import extract_config_constants
+
+
+def test_extract_config_constants_evaluates_static_assignments():
+    source = (
+        "import datetime\n"
+        "START = datetime.date(2025, 9, 1)\n"
+        "A = ['tv']\n"
+        "B = ['meta']\n"
+        "ALL = A + B\n"
+        "RANGE = (-15, -5)\n"
+        "DYNAMIC = len(A)\n"
+    )
+    constants = extract_config_constants(source)
+
+    assert constants["START"] == ("2025-09-01", 2)
+    assert constants["ALL"][0] == ["tv", "meta"]
+    assert constants["RANGE"][0] == (-15, -5)
+    assert "DYNAMIC" not in constants
+
+
+def test_load_config_documents_emits_small_keyed_facts():
+    docs = ingest.load_config_documents()
+    by_title = {
+        (doc.metadata["config_key"], doc.metadata["config_entry"]): doc for doc in docs
+    }
+
+    assert all(len(doc.text) < 1000 for doc in docs)
+    assert all(doc.metadata["category"] == "config" for doc in docs)
+
+    budgets = by_title[("CHANNEL_BUDGETS_GBP", "")]
+    assert budgets.metadata["value_type"] == "mapping"
+    assert "- tv: 6,000,000" in budgets.text
+
+    launch = by_title[("UK_LAUNCH_DATE", "")]
+    assert launch.metadata["value_type"] == "date"
+    assert "2025-09-01" in launch.text
+
+    s07 = by_title[("VEHICLE_MODELS", "DEEPAL_S07")]
+    assert "price_gbp: 27,990" in s07.text
+
+    assert ("SEASONAL_MULTIPLIERS", "") in by_title
+    assert ("ADSTOCK_DECAY_RATES", "") in by_title
+    assert ("SATURATION_PARAMS", "") in by_title
+    assert ("DIGITAL_BENCHMARKS", "meta") in by_title
@@ -0,0 +1,81 @@
+"""Tests for clause-aware contract chunking in src.rag.data_processing.ingest."""
+
+from __future__ import annotations
+
+from src.rag.data_processing import ingest
+
+_SAMPLE_CONTRACT = """\
+# AIRTIME PURCHASE AGREEMENT
+
+**Between:** Broadcaster and Advertiser
+
+---
+
+## 1. DEFINITIONS
+
+1.1 Headings are for convenience only.
+
+1.2 References to statutes include re-enactments.
+
+## 2. SCHEDULING
+
+### 2.1 Layered Targeting
+
+2.1.1 Up to three targeting layers may be combined.
+
+2.1.2 Each layer reduces reach by 40-60%.
+"""
+
+
+def test_split_contract_sections_tracks_heading_hierarchy():
+    sections = ingest._split_contract_sections(_SAMPLE_CONTRACT)
+
+    assert [(heading, number) for heading, number, _ in sections] == [
+        ("Preamble", ""),
+        ("1. DEFINITIONS", "1"),
+        ("2. SCHEDULING > 2.1 Layered Targeting", "2.1"),
+    ]
+    assert "---" not in sections[0][2]
+
+
+def test_split_clauses_and_pack_respect_clause_boundaries():
+    _, _, body = ingest._split_contract_sections(_SAMPLE_CONTRACT)[2]
+    blocks = ingest._split_clauses(body)
+
+    assert [clause_id for clause_id, _ in blocks] == ["2.1.1", "2.1.2"]
+
+    packed = ingest._pack_clauses(blocks, max_chars=60)
+    assert [ids for ids, _ in packed] == [["2.1.1"], ["2.1.2"]]
+
+    packed = ingest._pack_clauses(blocks, max_chars=1000)
+    assert len(packed) == 1
+    assert ingest._format_clause_id(packed[0][0], "2.1") == "2.1.1-2.1.2"
+
+
+def test_pack_clauses_splits_oversized_tables_on_lines():
+    table = "\n".join(f"| site {i} | London | 48-sheet |" for i in range(40))
+    packed = ingest._pack_clauses([("", table)], max_chars=300)
+
+    assert len(packed) > 1
+    assert all(len(text) <= 300 for _, text in packed)
+    assert "\n".join(text for _, text in packed) == table
+
+
+def test_load_contract_documents_emits_linked_clause_chunks():
+    root = ingest._get_project_root()
+    md_path = root / "data" / "raw" / "contracts" / "ITV_Airtime_Agreement.md"
+
+    docs = ingest.load_contract_documents(md_path)
+    rel_path = str(md_path.relative_to(root))
+
+    assert len(docs) > 1
+    assert all(len(doc.text) < len(md_path.read_text(encoding="utf-8")) / 4 for doc in docs)
+    assert {doc.metadata["parent_doc_id"] for doc in docs} == {rel_path}
+    assert all(doc.ref_doc_id == rel_path for doc in docs)
+    assert len({doc.doc_id for doc in docs}) == len(docs)
+    assert all(doc.metadata["total_chunks"] == len(docs) for doc in docs)
+
+    scope = next(doc for doc in docs if doc.metadata["section"] == "2. SCOPE OF AGREEMENT")
+    assert scope.metadata["clause_id"].startswith("2.1")
+    assert scope.text.startswith("ITV Airtime Agreement — 2. SCOPE OF AGREEMENT")
+    assert "£3,300,000" in scope.text
@@ -0,0 +1,53 @@
+"""Tests for CSV chunk filter metadata in src.rag.data_processing.ingest."""
+
+from __future__ import annotations
+
+from src.rag.data_processing import ingest
+
+
+def test_chunk_filter_metadata_collects_dates_and_entities():
+    header = ["date", "campaign_name", "market", "model", "spend"]
+    rows = [
+        ["2025-03-02", "META_GB_S07_A", "GB", "DEEPAL S07", "10"],
+        ["2025-03-01", "META_GB_S07_B", "GB", "AVATR 12", "12"],
+        ["2025-03-02", "META_GB_S07_A", "GB", "", "11"],
+    ]
+
+    metadata = ingest._chunk_filter_metadata("meta_ads.csv", header, rows)
+
+    assert metadata["date_min"] == "2025-03-01"
+    assert metadata["date_max"] == "2025-03-02"
+    assert (metadata["date_min_key"], metadata["date_max_key"]) == (20250301, 20250302)
+    assert metadata["channel"] == ["meta"]
+    assert metadata["campaign"] == ["META_GB_S07_A", "META_GB_S07_B"]
+    assert metadata["market"] == ["GB"]
+    assert metadata["model"] == ["AVATR 12", "DEEPAL S07"]
+
+
+def test_chunk_filter_metadata_expands_months_and_start_end_spans():
+    monthly = ingest._chunk_filter_metadata(
+        "competitor_spend.csv",
+        ["year_month", "competitor", "channel"],
+        [["2025-02", "Tesla", "tv"], ["2025-01", "BYD", "digital"]],
+    )
+    assert (monthly["date_min"], monthly["date_max"]) == ("2025-01-01", "2025-02-28")
+    assert monthly["channel"] == ["digital", "tv"]
+
+    flights = ingest._chunk_filter_metadata(
+        "radio_performance.csv",
+        ["campaign_name", "start_date", "end_date", "market"],
+        [["S07 Launch", "2025-03-10", "2025-04-06", "GB"]],
+    )
+    assert (flights["date_min"], flights["date_max"]) == ("2025-03-10", "2025-04-06")
+    assert flights["channel"] == ["radio"]
+    assert "model" not in flights
+
+
+def test_load_csv_documents_excludes_filter_only_keys_from_embedding():
+    root = ingest._get_project_root()
+    doc = ingest.load_csv_documents(root / "data" / "raw" / "tv_performance.csv")[0]
+
+    assert doc.metadata["channel"] == ["tv"]
+    assert doc.metadata["date_min"] <= doc.metadata["date_max"]
+    assert "date_min_key" in doc.excluded_embed_metadata_keys
+    assert "date_min" not in doc.excluded_embed_metadata_keys
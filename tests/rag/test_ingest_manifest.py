@@ -0,0 +1,200 @@
+"""Tests for the ingest manifest and incremental builds."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from llama_index.core import Document
+
+from src.rag.data_processing import build_index
+from src.rag.data_processing.manifest import (
+    apply_change_set,
+    compute_change_set,
+    load_manifest,
+    save_manifest,
+)
+from src.rag.embeddings.indexer import RAGIndexer
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _ingest(tmp_path: Path, sources: list[Path], entries: dict) -> dict:
+    change_set = compute_change_set("text", sources, entries, tmp_path, "1")
+    chunk_ids = {rel: [f"{rel}#0"] for rel in change_set.changed}
+    return apply_change_set(entries, change_set, chunk_ids, "1")
+
+
+def test_change_set_classifies_added_modified_removed_unchanged(tmp_path: Path):
+    meta = _write(tmp_path / "data" / "raw" / "meta_ads.csv", "a,b\n1,2\n")
+    tv = _write(tmp_path / "data" / "raw" / "tv.csv", "a,b\n3,4\n")
+    entries = _ingest(tmp_path, [meta, tv], {})
+
+    _write(meta, "a,b\n1,2\n5,6\n")
+    radio = _write(tmp_path / "data" / "raw" / "radio.csv", "a\n7\n")
+    change_set = compute_change_set("text", [meta, radio], entries, tmp_path, "1")
+
+    assert change_set.added == ("data/raw/radio.csv",)
+    assert change_set.modified == ("data/raw/meta_ads.csv",)
+    assert change_set.removed == ("data/raw/tv.csv",)
+    assert change_set.unchanged == ()
+    assert set(change_set.removed_chunk_ids) == {
+        "data/raw/meta_ads.csv#0",
+        "data/raw/tv.csv#0",
+    }
+
+
+def test_touched_file_with_same_content_is_unchanged(tmp_path: Path, monkeypatch):
+    meta = _write(tmp_path / "meta_ads.csv", "a,b\n1,2\n")
+    entries = _ingest(tmp_path, [meta], {})
+    stat = meta.stat()
+    os.utime(meta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    change_set = compute_change_set("text", [meta], entries, tmp_path, "1")
+    assert not change_set.has_changes
+
+    refreshed = apply_change_set(entries, change_set, {}, "1")
+    assert refreshed["meta_ads.csv"].mtime_ns == meta.stat().st_mtime_ns
+    assert refreshed["meta_ads.csv"].chunk_ids == entries["meta_ads.csv"].chunk_ids
+
+    # Stat now matches, so the next diff must not hash the file at all.
+    monkeypatch.setattr(
+        "src.rag.data_processing.manifest.content_hash",
+        lambda path: (_ for _ in ()).throw(AssertionError("unchanged file was hashed")),
+    )
+    assert compute_change_set("text", [meta], refreshed, tmp_path, "1").unchanged == (
+        "meta_ads.csv",
+    )
+
+
+def test_chunker_version_bump_marks_files_modified(tmp_path: Path):
+    meta = _write(tmp_path / "meta_ads.csv", "a,b\n1,2\n")
+    entries = _ingest(tmp_path, [meta], {})
+
+    change_set = compute_change_set("text", [meta], entries, tmp_path, "2")
+
+    assert change_set.modified == ("meta_ads.csv",)
+
+
+def test_manifest_round_trip_and_corrupt_file(tmp_path: Path):
+    meta = _write(tmp_path / "meta_ads.csv", "a,b\n1,2\n")
+    entries = _ingest(tmp_path, [meta], {})
+    manifest_path = tmp_path / "processed" / "ingest_manifest.json"
+
+    save_manifest(manifest_path, entries)
+    assert load_manifest(manifest_path) == entries
+
+    manifest_path.write_text("{not json", encoding="utf-8")
+    assert load_manifest(manifest_path) == {}
+    assert load_manifest(tmp_path / "missing.json") == {}
+
+
+def test_update_bm25_index_replaces_removed_chunks(tmp_path: Path):
+    bm25_dir = tmp_path / "bm25"
+    indexer = RAGIndexer(qdrant_path=str(tmp_path / "qdrant"), bm25_path=str(bm25_dir))
+    old = Document(id_="old", text="Meta CPM benchmark", metadata={"source_file": "meta.csv"})
+    keep = Document(id_="keep", text="TV reach targets", metadata={"source_file": "tv.csv"})
+    indexer.build_bm25_index([old, keep], rebuild=True)
+    (bm25_dir / ".gitkeep").write_text("", encoding="utf-8")
+
+    new = Document(id_="new", text="Meta CPC benchmark", metadata={"source_file": "meta.csv"})
+    assert indexer.update_bm25_index([new], removed_ids=["old"]) is not None
+
+    reloaded = indexer.build_bm25_index([])
+    ids = {result.node.node_id for result in reloaded.retrieve("Meta benchmark TV reach")}
+    assert ids == {"keep", "new"}
+    assert (bm25_dir / ".gitkeep").exists()
+
+
+def test_incremental_build_skips_unchanged_corpus(tmp_path: Path, monkeypatch, capsys):
+    source = _write(tmp_path / "data" / "raw" / "meta_ads.csv", "a,b\n1,2\n")
+    manifest_path = tmp_path / "ingest_manifest.json"
+    calls: list[str] = []
+
+    class _FakeIndexer:
+        def build_text_index(self, docs: list[Document]) -> None:
+            calls.append(f"text:{len(docs)}")
+
+        def build_bm25_index(self, docs: list[Document], rebuild: bool = False) -> None:
+            calls.append(f"bm25:{len(docs)}:{rebuild}")
+
+        def update_text_index(self, docs: list[Document], removed_ids: list[str]) -> None:
+            calls.append(f"update-text:{len(docs)}:{len(removed_ids)}")
+
+        def update_bm25_index(self, docs: list[Document], removed_ids: list[str]) -> None:
+            calls.append(f"update-bm25:{len(docs)}:{len(removed_ids)}")
+
+    def _load(path: Path) -> list[Document]:
+        calls.append(f"load:{path.name}")
+        return [
+            Document(
+                id_=f"{path.name}#{path.stat().st_size}",
+                text=path.read_text(encoding="utf-8"),
+                metadata={"source_file": str(path.relative_to(tmp_path))},
+            )
+        ]
+
+    monkeypatch.setattr(build_index, "_get_project_root", lambda: tmp_path)
+    monkeypatch.setattr(build_index, "RAGIndexer", _FakeIndexer)
+    monkeypatch.setattr(build_index, "discover_text_sources", lambda: [source])
+    monkeypatch.setattr(build_index, "load_source_documents", _load)
+    argv = ["--text", "--incremental", "--dedup-mode", "off", "--manifest", str(manifest_path)]
+
+    assert build_index.main(argv) == 0
+    assert calls == ["load:meta_ads.csv", "text:1", "bm25:1:True"]
+    assert load_manifest(manifest_path)["data/raw/meta_ads.csv"].chunk_ids == (
+        "meta_ads.csv#8",
+    )
+
+    calls.clear()
+    capsys.readouterr()
+    assert build_index.main(argv) == 0
+    assert calls == []
+    assert "No changes detected; indexes are up to date." in capsys.readouterr().out
+
+    _write(source, "a,b\n1,2\n3,4\n")
+    assert build_index.main(argv) == 0
+    assert calls == ["load:meta_ads.csv", "update-text:1:1", "update-bm25:1:1"]
+
+
+def test_full_build_writes_manifest_for_later_incremental_runs(tmp_path: Path, monkeypatch, capsys):
+    source = _write(tmp_path / "data" / "raw" / "meta_ads.csv", "a,b\n1,2\n")
+    manifest_path = tmp_path / "ingest_manifest.json"
+    save_manifest(manifest_path, _ingest(tmp_path, [_write(tmp_path / "gone.csv", "x\n")], {}))
+    calls: list[str] = []
+    docs = [Document(id_="meta#0", text="a,b", metadata={"source_file": "data/raw/meta_ads.csv"})]
+
+    class _FakeIndexer:
+        def build_text_index(self, passed_docs: list[Document]) -> None:
+            calls.append("text")
+
+        def build_bm25_index(self, passed_docs: list[Document], rebuild: bool = False) -> None:
+            calls.append("bm25")
+
+    monkeypatch.setattr(build_index, "_get_project_root", lambda: tmp_path)
+    monkeypatch.setattr(build_index, "RAGIndexer", _FakeIndexer)
+    monkeypatch.setattr(build_index, "load_all_text_documents", lambda: docs)
+    monkeypatch.setattr(build_index, "discover_text_sources", lambda: [source])
+    argv = ["--text", "--dedup-mode", "off", "--manifest", str(manifest_path)]
+
+    assert build_index.main(argv) == 0
+    entries = load_manifest(manifest_path)
+    assert list(entries) == ["data/raw/meta_ads.csv"]
+    assert entries["data/raw/meta_ads.csv"].chunk_ids == ("meta#0",)
+
+    calls.clear()
+    capsys.readouterr()
+    assert build_index.main([*argv, "--incremental"]) == 0
+    assert calls == []
+    assert "No changes detected; indexes are up to date." in capsys.readouterr().out
+
+
+def test_incremental_rejects_sample_mode(capsys):
+    exit_code = build_index.main(["--incremental", "--sample", "--dry-run"])
+
+    assert exit_code == 1
+    assert "--incremental cannot be combined with --sample" in capsys.readouterr().out
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 from llama_index.core import Document
 from llama_index.core.embeddings import MockEmbedding
 from llama_index.core.schema import NodeWithScore, TextNode
@@ -287,3 +288,80 @@ def test_check_indexes_prints_collection_stats(tmp_path: Path, monkeypatch, caps
     assert "campaign_assets: vector_count=0, status=green" in output
     assert "BM25: path=" in output
     assert "status=ready" in output
+
+
+def test_search_text_pushes_date_and_entity_filters_to_both_legs(tmp_path: Path, monkeypatch):
+    qdrant_dir = tmp_path / "qdrant"
+    bm25_dir = tmp_path / "bm25"
+
+    monkeypatch.setenv("QDRANT_PATH", str(qdrant_dir))
+    monkeypatch.setattr(query_engine, "_DEFAULT_BM25_PATH", str(bm25_dir))
+    monkeypatch.setattr(indexer_module, "OpenAIEmbedding", lambda model: MockEmbedding(embed_dim=8))
+    monkeypatch.setattr(query_engine, "OpenAIEmbedding", lambda model: MockEmbedding(embed_dim=8))
+
+    def _tv_chunk(doc_id: str, date_min: str, date_max: str, model: str) -> Document:
+        return Document(
+            id_=doc_id,
+            text=f"TV spend and GRPs for {model} between {date_min} and {date_max}.",
+            metadata={
+                "source_file": "data/raw/tv_performance.csv",
+                "category": "traditional_media",
+                "date_min": date_min,
+                "date_max": date_max,
+                "date_min_key": int(date_min.replace("-", "")),
+                "date_max_key": int(date_max.replace("-", "")),
+                "channel": ["tv"],
+                "model": [model],
+            },
+        )
+
+    docs = [
+        _tv_chunk("11111111-1111-1111-1111-111111111111", "2025-02-24", "2025-03-03", "AVATR 12"),
+        _tv_chunk("22222222-2222-2222-2222-222222222222", "2025-03-10", "2025-03-17", "DEEPAL S07"),
+        _tv_chunk("33333333-3333-3333-3333-333333333333", "2025-04-07", "2025-04-14", "AVATR 12"),
+        Document(
+            id_="44444444-4444-4444-4444-444444444444",
+            text="TV airtime contract clause on spend commitments.",
+            metadata={"source_file": "data/raw/contracts/ITV.md", "category": "contracts"},
+        ),
+    ]
+
+    indexer = RAGIndexer(qdrant_path=str(qdrant_dir), bm25_path=str(bm25_dir))
+    indexer.build_text_index(docs)
+    indexer.build_bm25_index(docs)
+    indexer.qdrant_client.close()
+
+    march = query_engine.search_text(
+        "TV spend", top_k=5, date_from="2025-03", date_to="2025-03", channel="tv"
+    )
+    assert {result["metadata"]["date_min"] for result in march} == {"2025-02-24", "2025-03-10"}
+
+    march_avatr = query_engine.search_text(
+        "TV spend", top_k=5, date_from="2025-03", date_to="2025-03", model="AVATR 12"
+    )
+    assert [result["metadata"]["date_min"] for result in march_avatr] == ["2025-02-24"]
+
+
+def test_text_filters_validate_dates_and_mask_bm25_corpus():
+    filters = query_engine._build_text_filters(
+        "2025-03", "2025-03-31", {"market": "GB", "model": None}
+    )
+    assert (filters.date_from_key, filters.date_to_key) == (20250301, 20250331)
+
+    class _Retriever:
+        corpus = [
+            {"market": ["GB"], "date_min_key": 20250301, "date_max_key": 20250302},
+            {"market": ["DE"], "date_min_key": 20250301, "date_max_key": 20250302},
+            {"market": ["GB"], "date_min_key": 20250401, "date_max_key": 20250402},
+            {"category": "contracts"},
+        ]
+        corpus_weight_mask = None
+
+    retriever = _Retriever()
+    query_engine._apply_bm25_mask(retriever, filters)
+    assert retriever.corpus_weight_mask == [1, 0, 0, 0]
+
+    with pytest.raises(ValueError, match="date_from must be on or before date_to"):
+        query_engine._build_text_filters("2025-04-01", "2025-03-01", {})
+    with pytest.raises(ValueError, match="date_to must be an ISO date"):
+        query_engine._build_text_filters(None, "March", {})
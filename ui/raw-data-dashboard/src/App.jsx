@@ -1,5 +1,5 @@
 import React, { useEffect, useMemo, useState } from 'react';
-import { getSummary, getFilePreview } from './api';
+import { getSummary, getFilePreview, subscribeToChanges } from './api';
 
 const THEME_KEY = 'raw-data-dashboard-theme';
 
@@ -84,6 +84,21 @@ function isCrossFileCheck(check) {
   return typeof fileRef === 'string' ? separator.test(fileRef) : false;
 }
 
+const checkKey = (check) => `${check.file || ''}${check.id}`;
+
+function applyDiff(prev, diff) {
+  if (!prev) {
+    return prev;
+  }
+  const replaced = new Set([...diff.deleted, ...diff.files.map((file) => file.file_name)]);
+  const files = [...prev.files.filter((file) => !replaced.has(file.file_name)), ...diff.files].sort(
+    (a, b) => (a.file_name < b.file_name ? -1 : a.file_name > b.file_name ? 1 : 0),
+  );
+  const updated = new Map(diff.checks.map((check) => [checkKey(check), check]));
+  const checks = prev.checks.map((check) => updated.get(checkKey(check)) || check);
+  return { summary: diff.summary, files, checks };
+}
+
 function App() {
   const [theme, setTheme] = useState(() => {
     if (typeof window === 'undefined') return 'dark';
@@ -135,8 +150,9 @@ function App() {
     try {
       const data = await getSummary();
       setPayload(data);
-      if (!selectedFile && data.files?.length) {
-        setSelectedFile(data.files[0].file_name);
+      if (data.files?.length) {
+        // Functional update: the change feed calls refresh from a closure made on mount.
+        setSelectedFile((current) => current || data.files[0].file_name);
       }
     } catch (err) {
       setError(err.message || 'Failed to load dashboard');
@@ -153,6 +169,23 @@ function App() {
     refresh();
   }, []);
 
+  useEffect(
+    () =>
+      subscribeToChanges({
+        onDiff: (diff) => {
+          if (diff.rules_changed) {
+            refresh();
+            return;
+          }
+          setPayload((prev) => applyDiff(prev, diff));
+        },
+        onReset: refresh,
+      }),
+    [],
+  );
+
+  const selectedModified = payload?.files?.find((file) => file.file_name === selectedFile)?.last_modified;
+
   useEffect(() => {
     if (!selectedFile) {
       setPreview(null);
@@ -182,7 +215,7 @@ function App() {
     return () => {
       cancelled = true;
     };
-  }, [selectedFile, previewRows]);
+  }, [selectedFile, previewRows, selectedModified]);
 
   const summary = payload?.summary || {};
   const files = payload?.files || [];
@@ -17,3 +17,10 @@ export function getFilePreview(fileName, rows = 20) {
   const encoded = encodeURIComponent(fileName);
   return requestJson(`${API_BASE}/api/raw/dashboard/file/${encoded}?rows=${rows}`);
 }
+
+export function subscribeToChanges({ onDiff, onReset }) {
+  const source = new EventSource(`${API_BASE}/api/raw/dashboard/events`);
+  source.addEventListener('diff', (event) => onDiff(JSON.parse(event.data)));
+  source.addEventListener('reset', () => onReset());
+  return () => source.close();
+}